@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.db.models import F, Case, When, Value, CharField
+from django.db.models.functions import Concat
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.benchmark import scenario
+from core.pagination import encode_cursor, cursor_values, queryset_ordering
+from core.views import get_paginated_data
+from users.models import User
+from community.models import Board, Post, PostPhoto
+from community.selectors import PostSelector
+from community.views import PostListApi
+
+
+@scenario('post_list_rep_photo')
+def post_list_rep_photo(scale: int):
+    # 사진이 많은 게시글 목록: to-many join Case 방식과 상관 서브쿼리 방식 비교
+    writer = User.objects.create_user(
+        email='benchmark-post@sasm.co.kr', password='benchmark', nickname='benchmark')
+    board = Board.objects.create(
+        name='benchmark', supports_post_photos=True, supports_post_comments=True)
+
+    posts = Post.objects.bulk_create([
+        Post(title='벤치마크 {}'.format(i), content='벤치마크 게시글 내용', board=board, writer=writer)
+        for i in range(200 * scale)
+    ])
+    PostPhoto.objects.bulk_create([
+        PostPhoto(post=post, image='community/post/{}-{}.jpg'.format(post.id, j))
+        for post in posts for j in range(10)
+    ], batch_size=1000)
+
+    def case_join():
+        posts = Post.objects.filter(board=board).annotate(
+            rep_photo=Case(
+                When(photos__image=None, then=None),
+                default=Concat(Value(settings.MEDIA_URL),
+                               F('photos__image'),
+                               output_field=CharField())
+            ),
+        ).order_by('-created')
+        # 페이지네이션과 동일하게 COUNT + 첫 페이지 조회, 전체 row 수 반환
+        count = posts.count()
+        list(posts[:20])
+        return count
+
+    def rep_media_url_subquery():
+        posts = PostSelector.list(board=board)
+        count = posts.count()
+        list(posts[:20])
+        return count
+
+    return {
+        'case_join': case_join,
+        'rep_media_url_subquery': rep_media_url_subquery,
+    }
+
+
+@scenario('post_list_deep_page')
+def post_list_deep_page(scale: int):
+    # 페이지 번호(COUNT + OFFSET) 방식과 커서 방식의 1페이지 / 500페이지 조회 비교
+    page_size = 20
+    writer = User.objects.create_user(
+        email='benchmark-page@sasm.co.kr', password='benchmark', nickname='benchmark')
+    board = Board.objects.create(name='benchmark')
+
+    Post.objects.bulk_create([
+        Post(title='벤치마크 {}'.format(i), content='벤치마크 게시글 내용', board=board, writer=writer)
+        for i in range(500 * page_size * scale)
+    ], batch_size=1000)
+
+    posts = PostSelector.list(board=board)
+    # 500페이지 직전 row의 커서 (클라이언트가 499번 next를 따라간 것과 동일)
+    last_row = posts.order_by(*queryset_ordering(posts))[499 * page_size - 1]
+    deep_cursor = encode_cursor(cursor_values(last_row, queryset_ordering(posts)))
+
+    factory = APIRequestFactory()
+
+    def page(params):
+        def run():
+            data = get_paginated_data(
+                pagination_class=PostListApi.Pagination,
+                serializer_class=PostListApi.PostListOutputSerializer,
+                queryset=PostSelector.list(board=board),
+                request=Request(factory.get('/community/posts/', {'page_size': page_size, **params},
+                                            HTTP_HOST='localhost')),
+                view=None,
+            )
+            return len(data['results'])
+        return run
+
+    return {
+        'page_number_1': page({'page': 1}),
+        'page_number_500': page({'page': 500}),
+        'cursor_1': page({'pagination': 'cursor'}),
+        'cursor_500': page({'pagination': 'cursor', 'cursor': deep_cursor}),
+    }
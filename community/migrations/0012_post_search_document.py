@@ -0,0 +1,89 @@
+# Generated by Django 4.0 on 2026-10-19 14:19
+
+from django.db import migrations, models
+
+
+# 마이그레이션 작성 시점의 정규화/n-gram 규칙 (이후 community.models의 변경과 무관하게 유지)
+def normalize_search_text(text):
+    return ''.join(text.lower().split())
+
+
+def search_ngrams(text, n=2):
+    text = normalize_search_text(text)
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def build_post_search_documents(apps, schema_editor):
+    # 기존 게시글의 검색 문서 및 n-gram 역색인 생성
+    Post = apps.get_model('community', 'Post')
+    PostSearchDocument = apps.get_model('community', 'PostSearchDocument')
+    PostSearchToken = apps.get_model('community', 'PostSearchToken')
+    weights = {'title': 4, 'hashtag': 3, 'content': 1, 'comment': 1}
+
+    for post in Post.objects.all().iterator():
+        hashtags = '\n'.join(post.hashtags.order_by(
+            'id').values_list('name', flat=True))
+        comments = '\n'.join(post.comments.order_by(
+            'id').values_list('content', flat=True))
+
+        PostSearchDocument.objects.create(
+            post=post,
+            board_id=post.board_id,
+            title=post.title,
+            content=post.content,
+            hashtags=hashtags,
+            comments=comments,
+        )
+
+        texts = {'title': post.title, 'content': post.content,
+                 'hashtag': hashtags, 'comment': comments}
+        PostSearchToken.objects.bulk_create([
+            PostSearchToken(board_id=post.board_id, post=post,
+                            field=field, token=token, weight=weights[field])
+            for field, text in texts.items()
+            for token in search_ngrams(text)
+        ], batch_size=1000)
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0011_alter_post_keyword_alter_post_subtitle'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field', models.CharField(choices=[('title', 'title'), ('content', 'content'), ('hashtag', 'hashtag'), ('comment', 'comment')], max_length=10)),
+                ('token', models.CharField(max_length=2)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('board', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='community.board')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='community.post')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PostSearchDocument',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='community.post')),
+                ('title', models.CharField(max_length=200)),
+                ('content', models.TextField(max_length=50000)),
+                ('hashtags', models.TextField(blank=True)),
+                ('comments', models.TextField(blank=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='community.board')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='postsearchtoken',
+            index=models.Index(fields=['board', 'token', 'post'], name='postsearchtoken_lookup_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='postsearchtoken',
+            constraint=models.UniqueConstraint(fields=('post', 'field', 'token'), name='post_search_token_unique_constraint'),
+        ),
+        migrations.RunPython(build_post_search_documents,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.0 on 2026-10-19 14:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count
+
+
+def build_post_hashtag_stats(apps, schema_editor):
+    # 기존 해시태그로 게시판별 해시태그 통계 생성
+    PostHashtag = apps.get_model('community', 'PostHashtag')
+    PostHashtagStat = apps.get_model('community', 'PostHashtagStat')
+
+    stats = PostHashtag.objects.values('post__board', 'name').annotate(
+        post_count=Count('post', distinct=True)).order_by()
+    PostHashtagStat.objects.bulk_create([
+        PostHashtagStat(board_id=stat['post__board'], name=stat['name'], post_count=stat['post_count'])
+        for stat in stats
+    ], batch_size=1000)
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0012_post_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostHashtagStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=10)),
+                ('post_count', models.PositiveIntegerField(default=0)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='community.board')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='posthashtagstat',
+            constraint=models.UniqueConstraint(fields=('board', 'name'), name='post_hashtag_stat_unique_constraint'),
+        ),
+        migrations.RunPython(build_post_hashtag_stats,
+                             migrations.RunPython.noop),
+    ]
@@ -102,6 +102,20 @@ class PostHashtag(TimeStampedModel):
         ]
 
 
+class PostHashtagStat(models.Model):
+    # 게시판별 해시태그 통계 (해당 해시태그를 가지는 게시글 수), PostHashtagService에서 증감
+    board = models.ForeignKey(
+        'Board', related_name='+', on_delete=models.CASCADE)
+    name = models.CharField(max_length=10)
+    post_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['board', 'name'], name='post_hashtag_stat_unique_constraint'),
+        ]
+
+
 def get_post_photo_upload_path(instance, filename):
     return 'community/post/{}'.format(filename)
 
@@ -174,6 +188,69 @@ def remove_file_from_s3(sender, instance, using, **kwargs):
     instance.image.delete(save=False)
 
 
+def normalize_search_text(text: str) -> str:
+    # 검색 색인과 검색어에 공통으로 적용되는 정규화: 소문자 변환, 공백 제거
+    return ''.join(text.lower().split())
+
+
+def search_ngrams(text: str, n: int = 2) -> set[str]:
+    # 한글은 형태소 분석 없이도 bi-gram으로 부분 문자열 검색이 가능
+    text = normalize_search_text(text)
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class PostSearchDocument(models.Model):
+    # 게시글 검색용 비정규화 문서, 게시글/해시태그/댓글 service에서 갱신
+    post = models.OneToOneField(
+        'Post', related_name='search_document', on_delete=models.CASCADE, primary_key=True)
+    board = models.ForeignKey(
+        'Board', related_name='+', on_delete=models.CASCADE)
+    title = models.CharField(max_length=200)
+    content = models.TextField(max_length=50000)
+    hashtags = models.TextField(blank=True)
+    comments = models.TextField(blank=True)
+    updated = models.DateTimeField(auto_now=True)
+
+
+class PostSearchToken(models.Model):
+    # PostSearchDocument의 n-gram 역색인, (board, token)으로 후보 게시글을 찾음
+    TITLE = 'title'
+    CONTENT = 'content'
+    HASHTAG = 'hashtag'
+    COMMENT = 'comment'
+    FIELD_CHOICES = (
+        (TITLE, 'title'),
+        (CONTENT, 'content'),
+        (HASHTAG, 'hashtag'),
+        (COMMENT, 'comment'),
+    )
+    # 검색 결과 정렬 시 필드별 가중치
+    FIELD_WEIGHTS = {
+        TITLE: 4,
+        HASHTAG: 3,
+        CONTENT: 1,
+        COMMENT: 1,
+    }
+
+    board = models.ForeignKey(
+        'Board', related_name='+', on_delete=models.CASCADE, db_index=False)
+    post = models.ForeignKey(
+        'Post', related_name='search_tokens', on_delete=models.CASCADE)
+    field = models.CharField(choices=FIELD_CHOICES, max_length=10)
+    token = models.CharField(max_length=2)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'token', 'post'],
+                         name='postsearchtoken_lookup_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'field', 'token'], name='post_search_token_unique_constraint'),
+        ]
+
+
 class PostReport(TimeStampedModel):
     """Post Report Category Definition"""
     POST_REPORT1 = "게시판 성격에 부적절함"
@@ -1,18 +1,20 @@
 from datetime import datetime
-from dataclasses import dataclass
-from collections import Counter
+from dataclasses import dataclass, replace
 
 from django.conf import settings
 from django.db import transaction
 from django.http import Http404
-from django.db.models import Q, F, Value, CharField, Func, Aggregate, Count
-from django.db.models.functions import Concat, Substr
+from django.db.models import Q, F, Value, CharField, Func, Aggregate, Count, Sum
+from django.db.models.functions import Coalesce, Concat, Substr
 from django.db.models import Case, When
-from django.db.models import OuterRef, Subquery
+from django.db.models import OuterRef, Subquery, prefetch_related_objects
 
 
 from users.models import User
-from community.models import Board, Post, PostHashtag, PostLike, PostPhoto, PostComment, PostCommentPhoto, PostPlace
+from core.selectors import rep_media_url
+from core.autocomplete import VersionedTrieCache
+from core.caches import VersionedCache
+from community.models import Board, Post, PostHashtag, PostHashtagStat, PostLike, PostPhoto, PostComment, PostCommentPhoto, PostPlace, PostSearchDocument, PostSearchToken, normalize_search_text, search_ngrams
 
 # class PostSelector:
 #     def __init__(self):
@@ -103,7 +105,7 @@ class PostCoordinatorSelector:
     def __init__(self, user: User):
         self.user = user
 
-    def list(self, board_id: int, query: str, query_type: str, latest: bool, keyword: str):
+    def list(self, board_id: int, query: str, query_type: str, latest: bool, keyword: str, order: str = ''):
         board = BoardSelector.get_from_id(id=board_id)
 
         extra_fields = {}
@@ -117,45 +119,78 @@ class PostCoordinatorSelector:
             query_type=query_type,
             latest=latest,
             keyword=keyword,
+            order=order,
             extra_fields=extra_fields
         )
 
     def detail(self, post_id: int):
-        board = Post.objects.get(id=post_id).board
-        post = PostSelector.detail(post_id=post_id)
+        # 사용자와 무관한 게시글 디테일은 post id + 버전으로 캐시하고, 좋아요 여부만 사용자별로 조회
+        dto = POST_DETAIL_CACHE.get(
+            post_id, lambda: PostDetailLoader.load(post_id=post_id))
 
-        likes = PostLikeSelector.likes(
-            post_id=post.id,
+        return replace(dto, likes=PostLikeSelector.likes(
+            post_id=post_id,
             user=self.user
-        )
+        ))
+
+
+# 게시글 수정/삭제/좋아요/사진 추가 시 PostService.invalidate_detail로,
+# 작성자 정보 변경 시 community.signals에서 버전 갱신
+POST_DETAIL_CACHE = VersionedCache('community:post:detail:')
+
+
+class PostDetailLoader:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def load(post_id: int) -> PostDto:
+        # 작성자/게시판은 join으로 함께 조회하고,
+        # 게시판이 지원하는 기능에 한해 해시태그/사진/장소를 각각 한 번의 쿼리로 prefetch
+        post = Post.objects.select_related('writer', 'board').get(id=post_id)
+        board = post.board
+
+        lookups = ['places']
+        if board.supports_hashtags:
+            lookups.append('hashtags')
+        if board.supports_post_photos:
+            lookups.append('photos')
+        prefetch_related_objects([post], *lookups)
+
+        writer = post.writer
+        profile = None
+        if writer is not None and writer.profile_image.name is not None:
+            profile = settings.MEDIA_URL + writer.profile_image.name
 
         dto = PostDto(
             id=post.id,
-            board=post.board.id,
+            board=board.id,
             title=post.title,
             content=post.content,
-            nickname=post.nickname,
-            email=post.email,
-            profile=post.profile,
+            nickname=writer.nickname if writer else None,
+            email=writer.email if writer else None,
+            profile=profile,
             created=post.created,
             updated=post.updated,
-            likeCount=post.likeCount,
-            viewCount=post.viewCount,
-            likes=likes,
+            likeCount=post.like_cnt,
+            viewCount=post.view_cnt,
+            likes=False,
             subtitle=post.subtitle,
             keyword=post.keyword,
-            places=[],
+            places=[{
+                'name': place.name,
+                'address': place.address,
+                'contact': place.contact,
+                'longitude': place.longitude,
+                'latitude': place.latitude,
+            } for place in post.places.all()],
         )
 
         if board.supports_hashtags:
-            dto.hashtagList = PostHashtagSelector.hashtags_of_post(post=post)
+            dto.hashtagList = [hashtag.name for hashtag in post.hashtags.all()]
 
         if board.supports_post_photos:
-            dto.photoList = PostPhotoSelector.photos_of_post(post=post)
-
-        places = PostPlaceSelector.places_of_post(post=post)
-        for place in places:
-            dto.places.append({**place})
+            dto.photoList = [settings.MEDIA_URL + photo.image.name for photo in post.photos.all()]
 
         return dto
 
@@ -165,44 +200,43 @@ class PostSelector:
         pass
 
     @ staticmethod
-    def list(board: Board, query: str = '', query_type: str = 'default', latest: bool = True, keyword: str = '', extra_fields: dict = {}):
+    def list(board: Board, query: str = '', query_type: str = 'default', latest: bool = True, keyword: str = '', order: str = '', extra_fields: dict = {}):
 
         q = Q()
         q.add(Q(board=board), q.AND)
 
         if query_type == 'hashtag':  # 해시태그 검색
             q.add(Q(hashtags__name__exact=query), q.AND)
-        else:  # 통합 검색(기본값): 게시글 내용, 제목, 댓글 내용, 해쉬태그 연관 검색
-            q.add(Q(title__icontains=query) |
-                  Q(content__icontains=query) |
-                  Q(comments__content__icontains=query) |
-                  Q(hashtags__name__icontains=query), q.AND)
+        elif normalize_search_text(query):  # 통합 검색(기본값): 게시글 내용, 제목, 댓글 내용, 해쉬태그 연관 검색
+            # 댓글/해시태그 join 대신 검색 문서의 n-gram 역색인 사용
+            q.add(Q(id__in=PostSearchSelector.search(
+                board=board, query=query).values('post')), q.AND)
 
         if keyword:
             q.add(Q(keyword=keyword), q.AND)
 
         # 최신순 정렬
         if latest:
-            order = '-created'
+            order_by = ['-created']
         else:
-            order = 'created'
+            order_by = ['created']
+
+        # 관련도순 정렬: 검색어 n-gram이 등장한 필드 가중치 합
+        if order == 'relevance' and query_type != 'hashtag' and normalize_search_text(query):
+            extra_fields = {
+                **extra_fields,
+                'score': PostSearchSelector.score(query=query),
+            }
+            order_by = ['-score', '-created']
 
         posts = Post.objects.filter(q).annotate(
             preview=Substr('content', 1, 50),
             nickname=F('writer__nickname'),
             email=F('writer__email'),
             likeCount=F('like_cnt'),
-            rep_photo=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_photo=rep_media_url(PostPhoto.objects.filter(post=OuterRef('pk'))),
             ** extra_fields
-        ).order_by(order)  # .distinct
+        ).order_by(*order_by)  # .distinct
 
         return posts
 
@@ -226,40 +260,75 @@ class PostSelector:
         ).get(id=post_id)
 
 
+class PostSearchSelector:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def search(board: Board, query: str):
+        # (board, token) 인덱스로 모든 n-gram을 포함하는 후보 게시글을 찾고,
+        # 후보의 검색 문서에 대해서만 icontains로 실제 포함 여부를 확인 (기존 검색 결과와 동일)
+        documents = PostSearchDocument.objects.filter(board=board)
+
+        grams = search_ngrams(query)
+        if grams:
+            candidates = PostSearchToken.objects.filter(
+                board=board,
+                token__in=grams,
+            ).values('post').annotate(
+                matched=Count('token', distinct=True),
+            ).filter(matched=len(grams)).values('post')
+            documents = documents.filter(post__in=candidates)
+
+        return documents.filter(
+            Q(title__icontains=query) |
+            Q(content__icontains=query) |
+            Q(hashtags__icontains=query) |
+            Q(comments__icontains=query)
+        )
+
+    @staticmethod
+    def ranked(board: Board, query: str):
+        # 관련도순으로 정렬된 중복 없는 게시글 id 리스트
+        return list(PostSearchSelector.search(board=board, query=query).annotate(
+            score=PostSearchSelector.score(query=query, outer_ref='post'),
+        ).order_by('-score', '-post').values_list('post', flat=True))
+
+    @staticmethod
+    def score(query: str, outer_ref: str = 'pk'):
+        return Coalesce(Subquery(
+            PostSearchToken.objects.filter(
+                post=OuterRef(outer_ref),
+                token__in=search_ngrams(query),
+            ).order_by().values('post').annotate(
+                score=Sum('weight'),
+            ).values('score')[:1]
+        ), 0)
+
+
 @dataclass
 class PostHashtagDto:
     name: str
     postCount: int
 
 
+POST_HASHTAG_TRIES = VersionedTrieCache('hashtag:post')
+
+
 class PostHashtagSelector:
     def __init__(self):
         pass
 
     @staticmethod
-    def list(board_id: int, query: str):
-        dtos = []
-
-        # Counter를 이용해 hashtag 빈도(해당 해시태그를 가지는 게시글 수) 계산
-        # query와 정확히 일치하는 순(= startswith이므로 문자열 길이가 가장 짧은 순)으로 해시태그 정렬
-        # TODO: 향후 해시태그 수가 많아질 경우 성능 저하 포인트가 될 수 있음
-        hashtags = sorted(
-            Counter(
-                PostHashtag.objects.filter(post__board__id=board_id,
-                                           name__startswith=query)
-                .values_list('name', flat=True)).items()
-        )
-
-        for hashtag in hashtags:
-            name = hashtag[0]
-            post_cnt = hashtag[1]
-
-            dtos.append(PostHashtagDto(
-                name=name,
-                postCount=post_cnt
-            ))
-
-        return dtos
+    def list(board_id: int, query: str, limit: int = None):
+        # 게시판별 해시태그 통계로 만든 prefix trie에서 인기순(해당 해시태그를 가지는 게시글 수)으로 조회
+        # trie는 프로세스별로 보관하고, 통계가 바뀌어 버전이 갱신된 경우에만 다시 생성
+        trie = POST_HASHTAG_TRIES.get(
+            board_id, lambda: PostHashtagStat.objects.filter(board__id=board_id, post_count__gt=0)
+            .values_list('name', 'post_count'))
+
+        return [PostHashtagDto(name=name, postCount=post_cnt)
+                for name, post_cnt in trie.search(query, limit)]
 
     @staticmethod
     def hashtags_of_post(post: Post):
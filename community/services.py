@@ -5,15 +5,17 @@ import json
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import F
 from django.core.files.images import ImageFile
 from django.core.files.uploadedfile import UploadedFile, InMemoryUploadedFile
 
 from rest_framework import exceptions
 
 from users.models import User
-from community.models import Board, Post, PostHashtag, PostPhoto, PostLike, PostComment, PostCommentPhoto, PostReport, PostCommentReport, PostPlace
-from .selectors import BoardSelector, PostHashtagSelector, PostSelector, PostLikeSelector, PostCommentSelector, PostCommentPhotoSelector
+from community.models import Board, Post, PostHashtag, PostPhoto, PostLike, PostComment, PostCommentPhoto, PostReport, PostCommentReport, PostPlace, PostSearchDocument, PostSearchToken, PostHashtagStat, search_ngrams
+from .selectors import POST_DETAIL_CACHE, POST_HASHTAG_TRIES, BoardSelector, PostHashtagSelector, PostSelector, PostLikeSelector, PostCommentSelector, PostCommentPhotoSelector
 from core.exceptions import ApplicationError
+from core.uploads import UploadTicket, issue_upload, confirm_upload
 
 
 class PostCoordinatorService:
@@ -49,6 +51,8 @@ class PostCoordinatorService:
         if places:
             PostPlaceService.create(post=post, place_jsons=places)
 
+        PostSearchService(post=post).index()
+
         return post
 
     @transaction.atomic
@@ -79,10 +83,20 @@ class PostCoordinatorService:
         if places:
             PostPlaceService.update(post=post, place_jsons=places)
 
+        # 댓글은 변경되지 않았으므로 제목/내용/해시태그만 재색인
+        PostSearchService(post=post).index(fields=[
+            PostSearchToken.TITLE, PostSearchToken.CONTENT, PostSearchToken.HASHTAG])
+
         return post
 
     @transaction.atomic
     def delete(self, post: Post):
+        # 삭제되는 게시글의 해시태그 통계 감소
+        PostHashtagStatService.decrease(
+            board=post.board,
+            names=list(post.hashtags.values_list('name', flat=True)),
+        )
+
         post_service = PostService()
         post_service.delete(post=post)
 
@@ -142,9 +156,13 @@ class PostService:
         post.full_clean()
         post.save()
 
+        PostService.invalidate_detail(post_id=post.id)
+
         return post
 
     def delete(self, post: Post):
+        PostService.invalidate_detail(post_id=post.id)
+
         post.delete()
 
     @staticmethod
@@ -156,6 +174,8 @@ class PostService:
         post.full_clean()
         post.save()
 
+        PostService.invalidate_detail(post_id=post.id)
+
     @staticmethod
     def dislike(post_id: int):
         post = Post.objects.get(id=post_id)
@@ -165,6 +185,23 @@ class PostService:
         post.full_clean()
         post.save()
 
+        PostService.invalidate_detail(post_id=post.id)
+
+    @staticmethod
+    def invalidate_detail(post_id: int):
+        # 커밋된 이후 게시글 디테일 캐시 버전 갱신 (rollback된 경우 갱신하지 않음)
+        transaction.on_commit(lambda: POST_DETAIL_CACHE.invalidate(post_id))
+
+    @staticmethod
+    def invalidate_details(post_ids: list[int]):
+        # 작성자 정보 변경 등 여러 게시글의 디테일 캐시를 커밋 이후 한 번에 갱신
+        def invalidate_all():
+            for post_id in post_ids:
+                POST_DETAIL_CACHE.invalidate(post_id)
+
+        if post_ids:
+            transaction.on_commit(invalidate_all)
+
 
 class PostHashtagService:
     def __init__(self, post: Post):
@@ -187,10 +224,14 @@ class PostHashtagService:
 
             hashtags.append(hashtag)
 
+        PostHashtagStatService.increase(board=self.post.board, names=names)
+
         return hashtags
 
     def update(self, names: list[str]):
         hashtags = []
+        removed_names = []
+        created_names = []
 
         current_hashtags = self.post.hashtags.all()
 
@@ -198,6 +239,7 @@ class PostHashtagService:
         for current_hashtag in current_hashtags:
             if current_hashtag.name not in names:
                 current_hashtag.delete()
+                removed_names.append(current_hashtag.name)
             else:
                 hashtags.append(current_hashtag)
 
@@ -216,10 +258,42 @@ class PostHashtagService:
             hashtag.save()
 
             hashtags.append(hashtag)
+            created_names.append(name)
+
+        PostHashtagStatService.decrease(board=self.post.board, names=removed_names)
+        PostHashtagStatService.increase(board=self.post.board, names=created_names)
 
         return hashtags
 
 
+class PostHashtagStatService:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def increase(board: Board, names: list[str]):
+        for name in set(names):
+            stat, _ = PostHashtagStat.objects.get_or_create(board=board, name=name)
+            # 동시 요청에도 누락되지 않도록 DB에서 증가
+            PostHashtagStat.objects.filter(pk=stat.pk).update(post_count=F('post_count') + 1)
+
+        PostHashtagStatService._invalidate(board=board, names=names)
+
+    @staticmethod
+    def decrease(board: Board, names: list[str]):
+        PostHashtagStat.objects.filter(board=board, name__in=set(names), post_count__gt=0).update(
+            post_count=F('post_count') - 1)
+        PostHashtagStat.objects.filter(board=board, name__in=set(names), post_count=0).delete()
+
+        PostHashtagStatService._invalidate(board=board, names=names)
+
+    @staticmethod
+    def _invalidate(board: Board, names: list[str]):
+        # 커밋된 이후 자동완성 trie 버전 갱신 (다른 프로세스의 trie도 다시 생성됨)
+        if names:
+            transaction.on_commit(lambda: POST_HASHTAG_TRIES.invalidate(board.id))
+
+
 class PostPhotoService:
     def __init__(self, post: Post):
         self.post = post
@@ -244,6 +318,34 @@ class PostPhotoService:
 
         return photos
 
+    def issue_upload(self, user: User, content_type: str, size: int) -> UploadTicket:
+        if not self.post.board.supports_post_photos:
+            raise ApplicationError('해당 게시판은 사진 첨부를 지원하지 않습니다.')
+
+        return issue_upload(
+            user=user,
+            upload_to='community/post',
+            content_type=content_type,
+            size=size,
+        )
+
+    def confirm_upload(self, user: User, token: str) -> PostPhoto:
+        # 클라이언트가 S3에 직접 업로드한 파일을 검증한 뒤 게시글의 PostPhoto로 생성
+        image_name = confirm_upload(user=user, token=token, upload_to='community/post')
+        if PostPhoto.objects.filter(image=image_name).exists():
+            raise ApplicationError('이미 등록된 사진입니다.')
+
+        photo = PostPhoto(
+            image=image_name,
+            post=self.post
+        )
+        photo.full_clean()
+        photo.save()
+
+        PostService.invalidate_detail(post_id=self.post.id)
+
+        return photo
+
     def update(self, photo_image_urls: list[str], image_files: list[InMemoryUploadedFile]):
         photos = []
 
@@ -263,6 +365,62 @@ class PostPhotoService:
         return photos
 
 
+class PostSearchService:
+    def __init__(self, post: Post):
+        self.post = post
+
+    def _field_texts(self, fields: list[str]) -> dict:
+        texts = {}
+
+        if PostSearchToken.TITLE in fields:
+            texts[PostSearchToken.TITLE] = self.post.title
+        if PostSearchToken.CONTENT in fields:
+            texts[PostSearchToken.CONTENT] = self.post.content
+        if PostSearchToken.HASHTAG in fields:
+            texts[PostSearchToken.HASHTAG] = '\n'.join(
+                self.post.hashtags.order_by('id').values_list('name', flat=True))
+        if PostSearchToken.COMMENT in fields:
+            texts[PostSearchToken.COMMENT] = '\n'.join(
+                self.post.comments.order_by('id').values_list('content', flat=True))
+
+        return texts
+
+    def index(self, fields: list[str] = None):
+        # 검색 문서를 갱신하고, 변경된 필드의 n-gram 토큰만 다시 생성
+        all_fields = [field for field, _ in PostSearchToken.FIELD_CHOICES]
+        if fields is None or not PostSearchDocument.objects.filter(post=self.post).exists():
+            fields = all_fields
+
+        texts = self._field_texts(fields)
+
+        document_columns = {
+            PostSearchToken.TITLE: 'title',
+            PostSearchToken.CONTENT: 'content',
+            PostSearchToken.HASHTAG: 'hashtags',
+            PostSearchToken.COMMENT: 'comments',
+        }
+        PostSearchDocument.objects.update_or_create(
+            post=self.post,
+            defaults={
+                'board': self.post.board,
+                **{document_columns[field]: text for field, text in texts.items()},
+            },
+        )
+
+        PostSearchToken.objects.filter(post=self.post, field__in=fields).delete()
+        PostSearchToken.objects.bulk_create([
+            PostSearchToken(
+                board_id=self.post.board_id,
+                post=self.post,
+                field=field,
+                token=token,
+                weight=PostSearchToken.FIELD_WEIGHTS[field],
+            )
+            for field, text in texts.items()
+            for token in search_ngrams(text)
+        ], batch_size=1000)
+
+
 class PostLikeService:
     def __init__(self):
         pass
@@ -368,6 +526,8 @@ class PostCommentCoordinatorService:
 
         photo_service.create(image_files=image_files)
 
+        PostSearchService(post=post).index(fields=[PostSearchToken.COMMENT])
+
         return post_comment
 
     @transaction.atomic
@@ -401,13 +561,19 @@ class PostCommentCoordinatorService:
             image_files=image_files
         )
 
+        PostSearchService(post=post_comment.post).index(
+            fields=[PostSearchToken.COMMENT])
+
         return post_comment
 
     @transaction.atomic
     def delete(self, post_comment: PostComment):
+        post = post_comment.post
         post_comment_service = PostCommentService()
         post_comment_service.delete(post_comment=post_comment)
 
+        PostSearchService(post=post).index(fields=[PostSearchToken.COMMENT])
+
 
 class PostCommentService:
     def __init__(self):
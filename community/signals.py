@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from users.models import User
+from community.models import Post
+from community.services import PostService
+
+
+# 게시글 디테일 캐시에 포함되는 작성자 정보
+POST_DETAIL_WRITER_FIELDS = {'email', 'nickname', 'profile_image'}
+
+
+@receiver(post_save, sender=User)
+def invalidate_post_details_of_writer(sender, instance, created, update_fields=None, **kwargs):
+    # 새로 가입했거나 작성자 정보가 바뀌지 않은 경우(last_login 갱신 등) 게시글 조회 없이 무시
+    fields = POST_DETAIL_WRITER_FIELDS if update_fields is None else POST_DETAIL_WRITER_FIELDS & set(update_fields)
+    if created or not instance.changed_fields(fields):
+        return
+    PostService.invalidate_details(post_ids=list(
+        Post.objects.filter(writer=instance).values_list('id', flat=True)))
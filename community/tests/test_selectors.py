@@ -0,0 +1,133 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from users.models import User
+from community.models import Board, PostPhoto
+from community.services import PostCoordinatorService, PostCommentCoordinatorService
+from community.selectors import PostSearchSelector, PostSelector, PostHashtagSelector, PostCoordinatorSelector
+
+
+class PostSearchSelectorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        self.board = Board.objects.create(
+            name='Test Board',
+            supports_hashtags=True,
+            supports_post_comments=True,
+        )
+        service = PostCoordinatorService(user=self.user)
+
+        self.title_post = service.create(
+            board_id=self.board.id, title='제로웨이스트 샵 후기', content='좋아요')
+        self.hashtag_post = service.create(
+            board_id=self.board.id, title='카페', content='텀블러 할인', hashtag_names=['제로웨이스트'])
+        self.other_post = service.create(
+            board_id=self.board.id, title='비건 식당', content='웨이스트 제로')
+
+    def test_search_matches_substring_across_fields_without_duplicates(self):
+        PostCommentCoordinatorService(user=self.user).create(
+            post_id=self.other_post.id, isParent=True, parent_id=None,
+            content='제로웨이스트 실천', mentioned_email='', image_files=[])
+
+        posts = PostSelector.list(board=self.board, query='제로웨이스트')
+
+        self.assertCountEqual([post.id for post in posts],
+                              [self.title_post.id, self.hashtag_post.id, self.other_post.id])
+
+    def test_ranked_orders_by_field_weight(self):
+        ranked = PostSearchSelector.ranked(board=self.board, query='제로웨이스트')
+
+        # 제목(가중치 4)에 포함된 게시글이 해시태그(가중치 3)에 포함된 게시글보다 앞에 위치
+        self.assertEqual(ranked, [self.title_post.id, self.hashtag_post.id])
+
+    def test_index_is_updated_on_comment_delete(self):
+        comment = PostCommentCoordinatorService(user=self.user).create(
+            post_id=self.other_post.id, isParent=True, parent_id=None,
+            content='제로웨이스트 실천', mentioned_email='', image_files=[])
+        PostCommentCoordinatorService(user=self.user).delete(post_comment=comment)
+
+        self.assertNotIn(self.other_post.id, PostSearchSelector.ranked(
+            board=self.board, query='제로웨이스트'))
+
+
+class PostListRepPhotoTests(TestCase):
+    def test_post_with_many_photos_is_listed_once_with_first_photo(self):
+        user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        board = Board.objects.create(name='Test Board', supports_post_photos=True)
+        post = PostCoordinatorService(user=user).create(
+            board_id=board.id, title='사진 많은 게시글', content='내용')
+        for i in range(3):
+            PostPhoto.objects.create(post=post, image='community/post/{}.jpg'.format(i))
+
+        posts = PostSelector.list(board=board)
+
+        self.assertEqual(posts.count(), 1)
+        self.assertTrue(posts[0].rep_photo.endswith('community/post/0.jpg'))
+
+
+class PostHashtagSelectorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        self.board = Board.objects.create(name='Test Board', supports_hashtags=True)
+        self.service = PostCoordinatorService(user=self.user)
+
+    def test_autocomplete_is_sorted_by_popularity_and_follows_updates(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.create(board_id=self.board.id, title='1', content='1',
+                                hashtag_names=['제로웨이스트'])
+            post = self.service.create(board_id=self.board.id, title='2', content='2',
+                                       hashtag_names=['제로', '제로웨이스트'])
+
+        hashtags = PostHashtagSelector.list(board_id=self.board.id, query='제로')
+        self.assertEqual([(h.name, h.postCount) for h in hashtags],
+                         [('제로웨이스트', 2), ('제로', 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete(post=post)
+
+        hashtags = PostHashtagSelector.list(board_id=self.board.id, query='제로')
+        self.assertEqual([(h.name, h.postCount) for h in hashtags],
+                         [('제로웨이스트', 1)])
+
+
+class PostDetailCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        self.board = Board.objects.create(
+            name='Test Board', supports_hashtags=True, supports_post_photos=True)
+        self.post = PostCoordinatorService(user=self.user).create(
+            board_id=self.board.id, title='제목', content='내용', hashtag_names=['제로'])
+        PostPhoto.objects.create(post=self.post, image='community/post/1.jpg')
+
+    def test_cached_detail_only_queries_like_flag_and_follows_likes(self):
+        selector = PostCoordinatorSelector(user=self.user)
+
+        # post(+writer, board), places, hashtags, photos, 좋아요 여부
+        with self.assertNumQueries(5):
+            dto = selector.detail(post_id=self.post.id)
+        self.assertEqual(dto.hashtagList, ['제로'])
+        self.assertEqual(len(dto.photoList), 1)
+
+        with self.assertNumQueries(1):
+            selector.detail(post_id=self.post.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PostCoordinatorService(user=self.user).like_or_dislike(post=self.post)
+
+        dto = selector.detail(post_id=self.post.id)
+        self.assertEqual((dto.likeCount, dto.likes), (1, True))
+
+    def test_cached_detail_follows_writer_profile_change(self):
+        selector = PostCoordinatorSelector(user=self.user)
+        selector.detail(post_id=self.post.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.nickname = 'changed'
+            self.user.save()
+
+        self.assertEqual(selector.detail(post_id=self.post.id).nickname, 'changed')
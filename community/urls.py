@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import BoardPropertyDetailApi, PostListApi, PostDetailApi, PostCreateApi, PostUpdateApi, PostDeleteApi, PostLikeApi, PostHashtagListApi, PostCommentListApi, PostCommentCreateApi, PostCommentUpdateApi, PostCommentDeleteApi, PostReportCreateApi, PostCommentReportCreateApi
+from .views import BoardPropertyDetailApi, PostListApi, PostDetailApi, PostCreateApi, PostUpdateApi, PostPhotoUploadUrlApi, PostPhotoUploadConfirmApi, PostDeleteApi, PostLikeApi, PostHashtagListApi, PostCommentListApi, PostCommentCreateApi, PostCommentUpdateApi, PostCommentDeleteApi, PostReportCreateApi, PostCommentReportCreateApi
 
 urlpatterns = [
     path('boards/<int:board_id>/',
@@ -11,6 +11,10 @@ urlpatterns = [
     path('posts/create/', PostCreateApi.as_view(), name='post_create'),
     path('posts/<int:post_id>/update/',
          PostUpdateApi.as_view(), name='post_update'),
+    path('posts/<int:post_id>/photos/upload_url/',
+         PostPhotoUploadUrlApi.as_view(), name='post_photo_upload_url'),
+    path('posts/<int:post_id>/photos/confirm/',
+         PostPhotoUploadConfirmApi.as_view(), name='post_photo_upload_confirm'),
     path('posts/<int:post_id>/delete/',
          PostDeleteApi.as_view(), name='post_delete'),
     path('posts/<int:post_id>/like/',
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404
 
 from rest_framework.response import Response
@@ -8,8 +9,9 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 
 from rest_framework.views import APIView
 from community.mixins import ApiAuthMixin, ApiNoAuthMixin
-from community.services import PostCoordinatorService, PostCommentCoordinatorService, PostReportService, PostCommentReportService
+from community.services import PostCoordinatorService, PostCommentCoordinatorService, PostReportService, PostCommentReportService, PostPhotoService
 from community.selectors import PostCoordinatorSelector, PostHashtagSelector, PostCommentCoordinatorSelector, BoardSelector
+from core.views import get_paginated_response
 
 from .models import Post, PostComment
 from .permissions import IsWriter
@@ -258,6 +260,137 @@ class PostUpdateApi(ApiAuthMixin, APIView):
         }, status=status.HTTP_200_OK)
 
 
+class PostPhotoUploadUrlApi(ApiAuthMixin, APIView):
+    permission_classes = (IsWriter, )
+
+    def get_object(self, post_id):
+        post = get_object_or_404(Post, pk=post_id)
+        self.check_object_permissions(self.request, post)
+        return post
+
+    class PostPhotoUploadUrlInputSerializer(serializers.Serializer):
+        content_type = serializers.CharField()
+        size = serializers.IntegerField()
+
+        class Meta:
+            examples = {
+                'content_type': 'image/jpeg',
+                'size': 1048576,
+            }
+
+    class PostPhotoUploadUrlOutputSerializer(serializers.Serializer):
+        key = serializers.CharField()
+        url = serializers.CharField()
+        fields = serializers.DictField()
+        token = serializers.CharField()
+        expires_in = serializers.IntegerField()
+
+    @swagger_auto_schema(
+        request_body=PostPhotoUploadUrlInputSerializer,
+        operation_id='게시글 사진 업로드 URL 발급',
+        operation_description='''
+            게시글에 첨부될 사진을 S3에 직접 업로드하기 위한 presigned URL을 발급합니다. 게시글 작성자만 요청할 수 있습니다.<br/>
+            응답의 url로 fields와 file을 multipart/form-data POST 요청으로 업로드한 후(file은 마지막 필드),<br/>
+            token을 게시글 사진 업로드 확인 API로 전달하면 게시글 사진이 생성됩니다.<br/>
+            ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "key": "community/post/1686065590.1234abcd.jpg",
+                            "url": "https://sasm-bucket.s3.amazonaws.com/",
+                            "fields": {"Content-Type": "image/jpeg", "key": "media/community/post/1686065590.1234abcd.jpg"},
+                            "token": "eyJuYW1lIjoiY29tbXVuaXR5L3Bvc3Qv...",
+                            "expires_in": 300,
+                        }
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def post(self, request, post_id):
+        serializer = self.PostPhotoUploadUrlInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        post = self.get_object(post_id)
+
+        service = PostPhotoService(post=post)
+        ticket = service.issue_upload(
+            user=request.user,
+            content_type=data.get('content_type'),
+            size=data.get('size'),
+        )
+
+        return Response({
+            'status': 'success',
+            'data': self.PostPhotoUploadUrlOutputSerializer(ticket).data,
+        }, status=status.HTTP_200_OK)
+
+
+class PostPhotoUploadConfirmApi(ApiAuthMixin, APIView):
+    permission_classes = (IsWriter, )
+
+    def get_object(self, post_id):
+        post = get_object_or_404(Post, pk=post_id)
+        self.check_object_permissions(self.request, post)
+        return post
+
+    class PostPhotoUploadConfirmInputSerializer(serializers.Serializer):
+        token = serializers.CharField()
+
+        class Meta:
+            examples = {
+                'token': 'eyJuYW1lIjoiY29tbXVuaXR5L3Bvc3Qv...',
+            }
+
+    @swagger_auto_schema(
+        request_body=PostPhotoUploadConfirmInputSerializer,
+        operation_id='게시글 사진 업로드 확인',
+        operation_description='''
+            presigned URL로 업로드한 파일의 크기와 이미지 형식을 확인한 뒤 게시글 사진을 생성합니다.<br/>
+            이후 게시글 수정 시, 유지할 사진 URL들과 함께 photoList에 포함해야 합니다.<br/>
+            ''',
+        responses={
+            "201": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {"id": 1, "location": "https://sasm-bucket.s3.amazonaws.com/media/community/post/1686065590.1234abcd.jpg"}
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def post(self, request, post_id):
+        serializer = self.PostPhotoUploadConfirmInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        post = self.get_object(post_id)
+
+        service = PostPhotoService(post=post)
+        photo = service.confirm_upload(
+            user=request.user,
+            token=data.get('token'),
+        )
+
+        return Response({
+            'status': 'success',
+            'data': {'id': photo.id, 'location': settings.MEDIA_URL + photo.image.name},
+        }, status=status.HTTP_201_CREATED)
+
+
 class PostDeleteApi(ApiAuthMixin, APIView):
     permission_classes = (IsWriter, )
 
@@ -340,22 +473,6 @@ class PostLikeApi(ApiAuthMixin, APIView):
         }, status=status.HTTP_200_OK)
 
 
-def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
-    paginator = pagination_class()
-
-    page = paginator.paginate_queryset(queryset, request, view=view)
-
-    if page is not None:
-        serializer = serializer_class(page, many=True)
-    else:
-        serializer = serializer_class(queryset, many=True)
-
-    return Response({
-        'status': 'success',
-        'data': paginator.get_paginated_response(serializer.data).data,
-    }, status=status.HTTP_200_OK)
-
-
 class PostListApi(ApiNoAuthMixin, APIView):
     class Pagination(PageNumberPagination):
         page_size = 5
@@ -366,6 +483,8 @@ class PostListApi(ApiNoAuthMixin, APIView):
         query = serializers.CharField(required=False)
         query_type = serializers.CharField(required=False)
         latest = serializers.BooleanField(required=False)
+        order = serializers.ChoiceField(
+            choices=['latest', 'relevance'], required=False)
         page = serializers.IntegerField(required=False)
 
         # # 정보글
@@ -399,6 +518,7 @@ class PostListApi(ApiNoAuthMixin, APIView):
             query: 검색어 (ex: '지속가능성')</br>
             query_type: 검색 종류 (ex: 'default', 'hashtag')</br>
             latest: 최신순 정렬 여부 (ex: true)</br>
+            order: 정렬 기준 (ex: 'latest', 'relevance'), relevance인 경우 기본 검색 결과를 검색어 관련도순으로 정렬</br>
             keyword (정보글 전용): 키워드 </br>
             <br/>
             기본 검색의 경우, 전달된 query를 title, content, hashtags, comments.content에 포함하고 있는 게시글 리스트를 반환합니다.<br/>
@@ -449,8 +569,8 @@ class PostListApi(ApiNoAuthMixin, APIView):
             latest=filters.get('latest', True),
             # 정보글 키워드
             keyword=filters.get('keyword', ''),
-            # # 다른 정렬 옵션, 추후 latest를 order에 통합 예정
-            # order=filters.get('order', 'latest'),
+            # 다른 정렬 옵션(관련도순), 추후 latest를 order에 통합 예정
+            order=filters.get('order', 'latest'),
             # # 정보글 사용자 종류(관리자, 일반인)
             # user_type=filters.get('user_type', ''),
         )
@@ -0,0 +1,92 @@
+import heapq
+import logging
+import threading
+import traceback
+import uuid
+
+from django.core.cache import cache
+
+
+logger = logging.getLogger('django')
+
+
+class PrefixTrie:
+    # 노드마다 인기순 상위 top_k개를 미리 계산해두어, 자동완성 조회는 prefix 길이만큼만 탐색
+    __slots__ = ('root', 'top_k')
+
+    def __init__(self, entries, top_k: int = 50):
+        # entries: (name, count) iterable
+        self.root = {}
+        self.top_k = top_k
+
+        for name, count in entries:
+            node = self.root
+            for char in name:
+                node = node.setdefault(char, {})
+            node[None] = (name, count)
+
+        self._build_top(self.root)
+
+    @staticmethod
+    def _rank(entry):
+        # 인기순, 같으면 짧은(검색어와 더 일치하는) 순, 이름순
+        name, count = entry
+        return (-count, len(name), name)
+
+    def _build_top(self, node) -> list:
+        candidates = [node[None]] if None in node else []
+        for char, child in node.items():
+            if char is not None and char != '':
+                candidates.extend(self._build_top(child))
+        top = heapq.nsmallest(self.top_k, candidates, key=self._rank)
+        node[''] = top
+        return top
+
+    def search(self, prefix: str, limit: int = None) -> list:
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node[''][:limit]
+
+
+class VersionedTrieCache:
+    # 프로세스별 trie 캐시, 공유 cache(redis)의 버전이 바뀌면 loader로 다시 생성
+    def __init__(self, namespace: str, top_k: int = 50):
+        self.namespace = namespace
+        self.top_k = top_k
+        self.tries = {}
+        self.lock = threading.Lock()
+
+    def _version_key(self, key) -> str:
+        return '{}:version:{}'.format(self.namespace, key)
+
+    def version(self, key):
+        try:
+            return cache.get(self._version_key(key))
+        except:
+            # redis 동작 안함 등의 오류 처리
+            logger.error(traceback.format_exc())
+            return None
+
+    def invalidate(self, key):
+        # 버전 값은 비교에만 사용하므로 충돌하지 않는 임의의 값이면 충분
+        try:
+            cache.set(self._version_key(key), uuid.uuid4().hex, None)
+        except:
+            logger.error(traceback.format_exc())
+        # 공유 cache를 사용할 수 없는 경우에도 현재 프로세스의 trie는 폐기
+        with self.lock:
+            self.tries.pop(key, None)
+
+    def get(self, key, loader) -> PrefixTrie:
+        version = self.version(key)
+        cached = self.tries.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        trie = PrefixTrie(loader(), top_k=self.top_k)
+        with self.lock:
+            self.tries[key] = (version, trie)
+        return trie
@@ -0,0 +1,51 @@
+import statistics
+import time
+
+from django.db import connection
+
+
+# 오프라인 벤치마크 시나리오 등록소
+# 각 앱의 benchmarks.py에서 @scenario로 등록하고, `python manage.py benchmark`로 실행
+# 시나리오 함수는 필요한 데이터를 생성한 뒤 {라벨: 측정할 함수} dict를 반환 (실행 후 데이터는 rollback)
+SCENARIOS = {}
+
+
+def scenario(name: str):
+    def wrapper(func):
+        SCENARIOS[name] = func
+        return func
+    return wrapper
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(p / 100 * len(values)) - 1))
+    return values[index]
+
+
+def measure(func, repeat: int = 20) -> dict:
+    # 첫 실행(warm-up)에서 쿼리 수를 기록하고, 이후 repeat회 실행 시간(ms)을 측정
+    # 측정 함수가 값을 반환하면 결과에 함께 기록 (ex. 조회된 row 수)
+    # test client 요청은 request_started에서 connection.queries를 초기화하므로 execute wrapper로 쿼리 수를 셈
+    queries = []
+
+    def count_query(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        result = func()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'result': result,
+        'queries': len(queries),
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'mean_ms': round(statistics.mean(timings), 3),
+    }
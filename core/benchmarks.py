@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.test import override_settings
+
+from rest_framework.test import APIClient
+
+from core.benchmark import scenario
+from core.seed import DatasetSeeder
+
+
+# 프로파일링 도구 middleware는 측정에서 제외 (local 설정)
+PROFILING_MIDDLEWARE = ('silk.', 'debug_toolbar.')
+
+
+def endpoint_client(user) -> APIClient:
+    client = APIClient(HTTP_HOST='localhost')
+    client.force_authenticate(user=user)
+    with override_settings(MIDDLEWARE=[middleware for middleware in settings.MIDDLEWARE
+                                       if not middleware.startswith(PROFILING_MIDDLEWARE)]):
+        client.handler.load_middleware()
+    return client
+
+
+@scenario('read_endpoints')
+def read_endpoints(scale: int):
+    # 시드 데이터셋에서 주요 조회 API를 test client로 호출 (middleware, 인증, 직렬화 포함)
+    # 결과의 queries는 API 한 번 호출에 실행되는 쿼리 수
+    seeder = DatasetSeeder(scale=scale, prefix='benchmark')
+    seeder.run()
+
+    # 팔로우/좋아요가 있는 일반 사용자 기준으로 조회
+    user = seeder.users[-1]
+    client = endpoint_client(user)
+
+    def get(path, params=None):
+        def run():
+            response = client.get(path, params)
+            assert response.status_code == 200, (path, response.status_code)
+            return response.status_code
+        return run
+
+    story = seeder.stories[0]
+    return {
+        'place_list_distance': get('/places/place_search/', {'left': 37.55, 'right': 126.95}),
+        'story_list': get('/stories/story_search/'),
+        'story_detail': get('/stories/story_detail/{}/'.format(story.id)),
+        'post_list': get('/community/posts/', {'board': seeder.board.id}),
+        'post_search': get('/community/posts/', {'board': seeder.board.id, 'query': '벤치마크'}),
+        'forest_list': get('/forest/'),
+        'total_search': get('/curations/total_search/', {'search': '벤치마크'}),
+        'mypage_summary': get('/mypage/me/summary/'),
+        'mypage_liked_story': get('/mypage/mypick_story/'),
+        'mypage_timeline': get('/mypage/following/timeline/'),
+    }
@@ -1,8 +1,12 @@
 import traceback
 import logging
+import time
+import uuid
 
 from django.core.cache import cache
 
+from core.metrics import record_cache
+
 
 logger = logging.getLogger('django')
 
@@ -20,6 +24,7 @@ def get_cache(key_prefix, key_suffix_keyword):
                 # redis 동작 안함 등의 오류 처리
                 logger.error(traceback.format_exc())
 
+            record_cache(hit=data is not None)
             # cache entry가 없거나 cache에 문제가 있는 경우, 본 함수 실행
             if data is None:
                 data = func(*args, **kwargs)
@@ -51,3 +56,79 @@ def delete_cache(key_prefix, key_suffix_keyword):
             return data
         return decorator
     return wrapper
+
+
+class VersionedCache:
+    # key별 버전 값을 공유 cache에 두고, 데이터는 `prefix:key:버전`에 저장
+    # 변경 시 버전만 갱신하므로, 갱신 직전에 읽은 이전 데이터가 뒤늦게 저장되어도 새 버전과 섞이지 않음
+    def __init__(self, key_prefix: str, timeout: int = 60 * 60):
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+
+    def _version_key(self, key) -> str:
+        return '{}version:{}'.format(self.key_prefix, key)
+
+    def version(self, key):
+        version_key = self._version_key(key)
+        version = cache.get(version_key)
+        if version is None:
+            # 버전 값이 없거나 evict된 경우, 이전 데이터를 재사용하지 않도록 새 버전으로 시작
+            cache.add(version_key, uuid.uuid4().hex, None)
+            version = cache.get(version_key)
+        return version
+
+    def get(self, key, loader):
+        data = None
+        cache_key = None
+        try:
+            cache_key = '{}{}:{}'.format(self.key_prefix, key, self.version(key))
+            data = cache.get(cache_key)
+        except:
+            # redis 동작 안함 등의 오류 처리
+            logger.error(traceback.format_exc())
+
+        record_cache(hit=data is not None)
+        # cache entry가 없거나 cache에 문제가 있는 경우, loader 실행
+        if data is None:
+            data = loader()
+            if cache_key is not None:
+                try:
+                    cache.set(cache_key, data, self.timeout)
+                except:
+                    logger.error(traceback.format_exc())
+
+        return data
+
+    def invalidate(self, key):
+        try:
+            cache.set(self._version_key(key), uuid.uuid4().hex, None)
+        except:
+            logger.error(traceback.format_exc())
+
+
+class LocalVersionedCache(VersionedCache):
+    # 프로세스 내 L1 캐시(local_timeout초) + 공유 cache(redis) L2 VersionedCache
+    # L1은 버전을 확인하지 않으므로 다른 프로세스의 변경은 최대 local_timeout초 늦게 반영됨 (같은 프로세스에서는 즉시 반영)
+    def __init__(self, key_prefix: str, timeout: int = 60 * 60, local_timeout: float = 5, max_entries: int = 10000):
+        super().__init__(key_prefix, timeout=timeout)
+        self.local_timeout = local_timeout
+        self.max_entries = max_entries
+        self.local = {}
+
+    def get(self, key, loader):
+        now = time.monotonic()
+        entry = self.local.get(key)
+        if entry is not None and entry[0] > now:
+            record_cache(hit=True)
+            return entry[1]
+
+        data = super().get(key, loader)
+        if data is not None:
+            if len(self.local) >= self.max_entries:
+                self.local.clear()
+            self.local[key] = (now + self.local_timeout, data)
+        return data
+
+    def invalidate(self, key):
+        self.local.pop(key, None)
+        super().invalidate(key)
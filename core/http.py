@@ -0,0 +1,207 @@
+import json
+import logging
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.exceptions import ApplicationError
+from core.metrics import record_outbound
+
+
+logger = logging.getLogger('django')
+
+
+# 외부 서비스(소셜 로그인 provider, 지도 API 등) 호출용 공용 HTTP client
+# - 프로세스 전체에서 connection pool을 공유하는 requests.Session 사용
+# - provider별 (connect, read) timeout, 연속 실패 시 일정 시간 호출을 차단하는 circuit breaker
+# - provider별 응답 시간/실패를 로그로 기록
+
+
+class CircuitBreaker:
+    # 연속 failure_threshold회 실패하면 reset_timeout초 동안 호출 차단(open),
+    # 이후 한 번의 시험 호출(half-open)이 성공하면 다시 허용(closed)
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                # 시험 호출 하나만 허용하고, 결과가 나올 때까지 다시 차단
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning('circuit opened: provider={}'.format(self.name))
+                self.opened_at = time.monotonic()
+
+
+class HttpClient:
+    DEFAULT_TIMEOUT = (3.05, 5)
+
+    def __init__(self):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=getattr(settings, 'HTTP_CLIENT_POOL_CONNECTIONS', 10),
+            pool_maxsize=getattr(settings, 'HTTP_CLIENT_POOL_MAXSIZE', 10),
+            # 멱등한 GET 요청의 연결 오류/일시적 오류만 한 번 재시도
+            max_retries=Retry(total=1, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                              allowed_methods=('GET', ), raise_on_status=False),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        with self.lock:
+            if provider not in self.breakers:
+                failure_threshold, reset_timeout = getattr(
+                    settings, 'HTTP_CLIENT_BREAKER', (5, 30))
+                self.breakers[provider] = CircuitBreaker(
+                    provider, failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+            return self.breakers[provider]
+
+    @staticmethod
+    def timeout(provider: str):
+        timeouts = getattr(settings, 'HTTP_CLIENT_TIMEOUTS', {})
+        return timeouts.get(provider, timeouts.get('default', HttpClient.DEFAULT_TIMEOUT))
+
+    def request(self, provider: str, method: str, url: str, **kwargs) -> requests.Response:
+        breaker = self.breaker(provider)
+        if not breaker.allow():
+            logger.warning('outbound rejected: provider={} circuit open'.format(provider))
+            raise ApplicationError('{} 서버와 일시적으로 통신할 수 없습니다. 잠시 후 다시 시도해주세요.'.format(provider))
+
+        kwargs.setdefault('timeout', self.timeout(provider))
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            record_outbound(elapsed_ms)
+            breaker.record_failure()
+            logger.error('outbound failed: provider={} elapsed_ms={:.1f}\n{}'.format(
+                provider, elapsed_ms, traceback.format_exc()))
+            raise ApplicationError('{} 서버와 통신하지 못했습니다.'.format(provider))
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record_outbound(elapsed_ms)
+
+        # 4xx는 잘못된 토큰 등 요청의 문제이므로 provider 장애로 보지 않음
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        logger.info('outbound: provider={} status={} elapsed_ms={:.1f}'.format(
+            provider, response.status_code, elapsed_ms))
+        return response
+
+    def get(self, provider: str, url: str, **kwargs) -> requests.Response:
+        return self.request(provider, 'GET', url, **kwargs)
+
+    def post(self, provider: str, url: str, **kwargs) -> requests.Response:
+        return self.request(provider, 'POST', url, **kwargs)
+
+
+http_client = HttpClient()
+
+
+class JwksCache:
+    # 공개키(JWKS) 캐시: TTL 동안 공유 cache(redis)에 저장하고, 모르는 kid가 오면(키 교체) 다시 조회
+    # 잘못된 kid로 인한 반복 조회를 막기 위해 재조회는 refresh_interval초에 한 번만 수행
+    def __init__(self, provider: str, url: str, ttl: int = 3600, refresh_interval: int = 60):
+        self.provider = provider
+        self.url = url
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.cache_key = 'jwks:{}'.format(provider)
+        self.refreshed_at = 0
+
+    def _fetch(self) -> dict:
+        response = http_client.get(self.provider, self.url)
+        if not response.ok:
+            raise ApplicationError('{} 공개키를 가져오지 못했습니다.'.format(self.provider))
+
+        keys = {key['kid']: key for key in response.json().get('keys', [])}
+        self.refreshed_at = time.monotonic()
+        try:
+            cache.set(self.cache_key, keys, self.ttl)
+        except:
+            logger.error(traceback.format_exc())
+        return keys
+
+    def _cached(self):
+        try:
+            return cache.get(self.cache_key)
+        except:
+            logger.error(traceback.format_exc())
+            return None
+
+    def get_key(self, kid: str):
+        keys = self._cached()
+        if keys is None:
+            keys = self._fetch()
+        elif kid not in keys and time.monotonic() - self.refreshed_at >= self.refresh_interval:
+            keys = self._fetch()
+        return keys.get(kid)
+
+
+class LocalStubAdapter(BaseAdapter):
+    # 테스트/로컬 개발용 provider 대역: 실제 네트워크 대신 handler(request)의 (status, body) 반환
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+
+    def send(self, request, **kwargs):
+        status, body = self.handler(request)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode() if not isinstance(body, bytes) else body
+        response.headers['Content-Type'] = 'application/json'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def stub_responses(routes: dict):
+    # routes: {url prefix: handler}, 블록 안에서 해당 prefix로의 요청은 handler가 응답
+    # ex. with stub_responses({'https://kapi.kakao.com/': lambda request: (200, {...})}): ...
+    previous = dict(http_client.session.adapters)
+    for prefix, handler in routes.items():
+        http_client.session.mount(prefix, LocalStubAdapter(handler))
+    try:
+        yield
+    finally:
+        http_client.session.adapters.clear()
+        http_client.session.adapters.update(previous)
+        with http_client.lock:
+            http_client.breakers.clear()
@@ -0,0 +1,159 @@
+import functools
+import logging
+import os
+import traceback
+from datetime import timedelta
+from email.mime.image import MIMEImage
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import EmailOutbox
+from core.tasks import enqueue_on_commit
+
+
+logger = logging.getLogger('django')
+
+LOGO_CONTENT_ID = 'SASM_LOGO_BLACK.png'
+
+
+@functools.lru_cache(maxsize=1)
+def _logo_data() -> bytes:
+    # 로고 이미지는 프로세스당 한 번만 읽음
+    with open(os.path.join(settings.BASE_DIR, 'static/img/SASM_LOGO_BLACK.png'), 'rb') as f:
+        return f.read()
+
+
+def logo_image() -> MIMEImage:
+    # MIME part는 메시지마다 헤더가 붙으므로 캐시한 bytes로 새로 생성
+    image = MIMEImage(_logo_data())
+    image.add_header('Content-ID', '<{}>'.format(LOGO_CONTENT_ID))
+    return image
+
+
+class EmailOutboxService:
+    # 메일은 요청 트랜잭션 안에서 outbox에 저장만 하고, 커밋 이후 백그라운드에서 발송
+    # 발송 실패 시 지수 backoff로 MAX_ATTEMPTS회까지 재시도 (재시도는 다음 발송 또는 send_email_outbox 명령에서 처리)
+    BATCH_SIZE = 50
+    MAX_ATTEMPTS = 5
+    BACKOFF_SECONDS = 30
+    # 발송 중 프로세스가 종료되어 sending 상태로 남은 메일을 다시 발송할 때까지의 시간
+    SENDING_TIMEOUT = timedelta(minutes=10)
+    # 발송 완료/실패한 메일 기록을 보관하는 기간 (purge_finished)
+    RETENTION = timedelta(days=7)
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def enqueue(subject: str, to_email: str, html_content: str,
+                from_email: str = None, attach_logo: bool = True) -> EmailOutbox:
+        email = EmailOutbox.objects.create(
+            subject=subject,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            to_email=to_email,
+            html_content=html_content,
+            attach_logo=attach_logo,
+            next_attempt_at=timezone.now(),
+        )
+        enqueue_on_commit(EmailOutboxService.deliver_pending)
+        return email
+
+    @staticmethod
+    def message(email: EmailOutbox, connection=None) -> EmailMultiAlternatives:
+        msg = EmailMultiAlternatives(
+            email.subject, '...', email.from_email, [email.to_email], connection=connection)
+        msg.attach_alternative(email.html_content, "text/html")
+        if email.attach_logo:
+            msg.attach(logo_image())
+        return msg
+
+    @staticmethod
+    def _claim(batch_size: int) -> list[EmailOutbox]:
+        # 다른 worker와 중복 발송하지 않도록 상태를 sending으로 바꾼 메일만 발송
+        now = timezone.now()
+        due = EmailOutbox.objects.filter(
+            Q(status=EmailOutbox.STATUS_PENDING, next_attempt_at__lte=now) |
+            Q(status=EmailOutbox.STATUS_SENDING, updated__lt=now - EmailOutboxService.SENDING_TIMEOUT)
+        ).order_by('next_attempt_at', 'id')[:batch_size]
+
+        claimed = []
+        for email in due:
+            if EmailOutbox.objects.filter(pk=email.pk, status=email.status, updated=email.updated).update(
+                    status=EmailOutbox.STATUS_SENDING, updated=now):
+                claimed.append(email)
+        return claimed
+
+    @staticmethod
+    def _failed(email: EmailOutbox, error: str):
+        attempts = email.attempts + 1
+        # 본문에는 인증 토큰/비밀번호 재설정 코드가 포함되므로, 더 이상 발송하지 않는 메일은 본문을 지움
+        html_content = email.html_content
+        if attempts >= EmailOutboxService.MAX_ATTEMPTS:
+            status = EmailOutbox.STATUS_FAILED
+            html_content = ''
+            logger.error('email outbox give up: id={} to={}'.format(email.id, email.to_email))
+        else:
+            status = EmailOutbox.STATUS_PENDING
+
+        EmailOutbox.objects.filter(pk=email.pk).update(
+            status=status,
+            html_content=html_content,
+            attempts=attempts,
+            next_attempt_at=timezone.now() + timedelta(
+                seconds=EmailOutboxService.BACKOFF_SECONDS * 2 ** (attempts - 1)),
+            last_error=error,
+            updated=timezone.now(),
+        )
+
+    @staticmethod
+    def deliver_pending(batch_size: int = None) -> int:
+        # 발송 대상 메일을 batch_size개씩 하나의 SMTP 연결로 발송, 발송한 메일 수 반환
+        batch_size = batch_size or EmailOutboxService.BATCH_SIZE
+        sent = 0
+        while True:
+            emails = EmailOutboxService._claim(batch_size)
+            if not emails:
+                return sent
+
+            connection = get_connection()
+            try:
+                connection.open()
+            except Exception:
+                # SMTP 서버에 연결할 수 없는 경우 batch 전체를 재시도 대상으로 처리
+                error = traceback.format_exc()
+                logger.error(error)
+                for email in emails:
+                    EmailOutboxService._failed(email, error)
+                return sent
+
+            try:
+                for email in emails:
+                    try:
+                        EmailOutboxService.message(email, connection=connection).send()
+                    except Exception:
+                        EmailOutboxService._failed(email, traceback.format_exc())
+                        continue
+
+                    # 발송한 메일의 본문(인증 토큰 포함)은 보관하지 않음
+                    EmailOutbox.objects.filter(pk=email.pk).update(
+                        status=EmailOutbox.STATUS_SENT,
+                        html_content='',
+                        attempts=email.attempts + 1,
+                        last_error='',
+                        updated=timezone.now(),
+                    )
+                    sent += 1
+            finally:
+                connection.close()
+
+    @staticmethod
+    def purge_finished() -> int:
+        # RETENTION이 지난 발송 완료/실패 메일 기록 삭제, 삭제한 메일 수 반환
+        deleted, _ = EmailOutbox.objects.filter(
+            status__in=[EmailOutbox.STATUS_SENT, EmailOutbox.STATUS_FAILED],
+            updated__lt=timezone.now() - EmailOutboxService.RETENTION,
+        ).delete()
+        return deleted
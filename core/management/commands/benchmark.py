@@ -0,0 +1,59 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.module_loading import autodiscover_modules
+
+from core.benchmark import SCENARIOS, measure
+
+
+class Benchmark(Exception):
+    # 시나리오 실행 후 생성된 데이터를 rollback하기 위한 예외
+    pass
+
+
+class Command(BaseCommand):
+    help = '각 앱의 benchmarks.py에 등록된 벤치마크 시나리오를 실행하고 결과를 JSON으로 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*',
+                            help='실행할 시나리오 이름 (기본값: 전체)')
+        parser.add_argument('--scale', type=int, default=1,
+                            help='시나리오 데이터 규모 배수')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='측정 반복 횟수')
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+        parser.add_argument('--list', action='store_true',
+                            help='등록된 시나리오 목록 출력')
+
+    def handle(self, *args, **options):
+        autodiscover_modules('benchmarks')
+
+        if options['list']:
+            for name in sorted(SCENARIOS):
+                self.stdout.write(name)
+            return
+
+        names = options['scenarios'] or sorted(SCENARIOS)
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            raise CommandError('등록되지 않은 시나리오: {}'.format(', '.join(unknown)))
+
+        results = {}
+        for name in names:
+            try:
+                with transaction.atomic():
+                    cases = SCENARIOS[name](scale=options['scale'])
+                    results[name] = {
+                        label: measure(func, repeat=options['repeat'])
+                        for label, func in cases.items()
+                    }
+                    raise Benchmark
+            except Benchmark:
+                pass
+
+        output = json.dumps(results, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+        self.stdout.write(output)
@@ -0,0 +1,28 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.exceptions import ApplicationError
+from core.seed import DatasetSeeder
+
+
+class Command(BaseCommand):
+    help = '부하 테스트용 데이터셋을 생성합니다. 같은 seed, scale이면 같은 구성의 데이터셋이 생성됩니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=1,
+                            help='데이터 규모 배수 (1배: 사용자 {}명, 게시글 {}개 등)'.format(
+                                DatasetSeeder.SIZES['users'], DatasetSeeder.SIZES['posts']))
+        parser.add_argument('--seed', type=int, default=0,
+                            help='난수 seed')
+        parser.add_argument('--prefix', default='seed',
+                            help='생성되는 사용자 이메일/게시물 제목의 prefix')
+
+    def handle(self, *args, **options):
+        try:
+            counts = DatasetSeeder(
+                scale=options['scale'], seed=options['seed'], prefix=options['prefix']).run()
+        except ApplicationError as e:
+            raise CommandError(e.message)
+
+        self.stdout.write(json.dumps(counts, indent=2, ensure_ascii=False))
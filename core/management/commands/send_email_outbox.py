@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.mail import EmailOutboxService
+
+
+class Command(BaseCommand):
+    help = 'outbox에 쌓인 메일을 발송하고 보관 기간이 지난 기록을 삭제합니다. 실패한 메일의 재시도를 위해 주기적으로(cron 또는 --loop) 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true',
+                            help='종료하지 않고 interval초마다 발송')
+        parser.add_argument('--interval', type=int, default=30,
+                            help='--loop 사용 시 발송 간격(초)')
+        parser.add_argument('--batch-size', type=int, default=EmailOutboxService.BATCH_SIZE,
+                            help='하나의 SMTP 연결로 발송할 메일 수')
+
+    def handle(self, *args, **options):
+        while True:
+            sent = EmailOutboxService.deliver_pending(batch_size=options['batch_size'])
+            purged = EmailOutboxService.purge_finished()
+            self.stdout.write('sent: {}, purged: {}'.format(sent, purged))
+
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
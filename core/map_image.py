@@ -1,8 +1,7 @@
 from django.conf import settings
 
 from core.exceptions import ApplicationError
-
-import requests
+from core.http import http_client
 
 
 class Marker:
@@ -29,8 +28,9 @@ def get_static_naver_image(markers: list[Marker]):
 
     markers_query_string = "".join(map(Marker.query_string, markers))
 
-    response = requests.get(
-        url=url + base_params + markers_query_string,
+    response = http_client.get(
+        'naver_map',
+        url + base_params + markers_query_string,
         headers=headers,
         stream=True
     )
@@ -0,0 +1,173 @@
+import bisect
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger('django')
+
+
+# 요청별 성능 지표 (silk 대신 운영 환경에서 상시 사용하는 가벼운 계측)
+# - view(route)별 쿼리 수, DB 시간, 캐시 hit/miss, 외부 HTTP 호출 시간, 응답 시간을 메모리 histogram으로 집계
+# - 같은 SQL(fingerprint)이 QUERY_REPEAT_THRESHOLD회보다 많이 반복되면 N+1 의심으로 로그
+# - 집계는 프로세스(worker)별로 유지되며 재시작 시 초기화됨
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict:
+        # 누적(cumulative) bucket, 마지막 '+Inf'는 전체 개수
+        buckets = {}
+        total = 0
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            total += count
+            buckets[str(bound)] = total
+        return {'count': self.count, 'sum': round(self.sum, 3), 'buckets': buckets}
+
+
+class MetricsRegistry:
+    COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+    MS_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+    METRICS = {
+        'duration_ms': MS_BUCKETS,
+        'queries': COUNT_BUCKETS,
+        'db_ms': MS_BUCKETS,
+        'cache_hits': COUNT_BUCKETS,
+        'cache_misses': COUNT_BUCKETS,
+        'outbound_ms': MS_BUCKETS,
+    }
+
+    def __init__(self):
+        self.views = {}
+        self.lock = threading.Lock()
+
+    def observe(self, view: str, values: dict):
+        with self.lock:
+            histograms = self.views.get(view)
+            if histograms is None:
+                histograms = self.views[view] = {
+                    name: Histogram(buckets) for name, buckets in self.METRICS.items()}
+            for name, value in values.items():
+                histograms[name].observe(value)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {view: {name: histogram.to_dict() for name, histogram in histograms.items()}
+                    for view, histograms in self.views.items()}
+
+    def reset(self):
+        with self.lock:
+            self.views = {}
+
+
+metrics = MetricsRegistry()
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.db_ms = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.outbound_ms = 0
+        self.fingerprints = Counter()
+
+
+_current_stats = ContextVar('request_stats', default=None)
+
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+\b')
+_IN_LIST = re.compile(r'\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)')
+
+
+def fingerprint(sql: str) -> str:
+    # 파라미터 개수/리터럴 값만 다른 쿼리를 같은 쿼리로 묶음 (ex. IN (%s, %s) -> IN (...))
+    return _IN_LIST.sub('(...)', _NUMBER.sub('?', _STRING.sub('?', sql)))
+
+
+def record_cache(hit: bool):
+    stats = _current_stats.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+def record_outbound(elapsed_ms: float):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.outbound_ms += elapsed_ms
+
+
+def _query_wrapper(execute, sql, params, many, context):
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_ms += (time.perf_counter() - start) * 1000
+        stats.fingerprints[fingerprint(sql)] += 1
+
+
+def view_name(request) -> str:
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    return '{} {}'.format(request.method, match.route)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_query_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+
+        view = view_name(request)
+        metrics.observe(view, {
+            'duration_ms': (time.perf_counter() - start) * 1000,
+            'queries': stats.queries,
+            'db_ms': stats.db_ms,
+            'cache_hits': stats.cache_hits,
+            'cache_misses': stats.cache_misses,
+            'outbound_ms': stats.outbound_ms,
+        })
+
+        threshold = getattr(settings, 'QUERY_REPEAT_THRESHOLD', 10)
+        for sql, count in stats.fingerprints.items():
+            if count > threshold:
+                logger.warning('N+1 suspected: view={} repeated={} sql={}'.format(view, count, sql))
+
+        return response
@@ -10,4 +10,33 @@ class TimeStampedModel(models.Model):
     updated = models.DateTimeField(auto_now=True)
 
     class Meta:
-        abstract = True #admin에서 안보이게
\ No newline at end of file
+        abstract = True #admin에서 안보이게
+
+class EmailOutbox(TimeStampedModel):
+    # 발송할 메일 (outbox), 요청과 같은 트랜잭션에서 저장하고 core.mail의 worker가 발송
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    subject = models.CharField(max_length=200)
+    from_email = models.EmailField(max_length=64)
+    to_email = models.EmailField(max_length=64)
+    html_content = models.TextField()
+    # 메일 본문에서 cid:SASM_LOGO_BLACK.png로 참조하는 로고 이미지 첨부 여부
+    attach_logo = models.BooleanField(default=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_due_idx'),
+        ]
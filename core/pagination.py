@@ -0,0 +1,124 @@
+import base64
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Q
+
+from core.exceptions import ApplicationError
+
+
+# keyset(커서) 페이지네이션 공용 유틸
+# ordering은 ['created', 'id'] 또는 ['-created', '-id'] 형태로, 마지막 필드는 unique해야 함
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError('커서에 담을 수 없는 값입니다: {}'.format(type(value)))
+
+
+def encode_cursor(values: dict) -> str:
+    payload = json.dumps(values, default=_json_default, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ApplicationError('유효하지 않은 커서입니다.')
+
+    if not isinstance(values, dict):
+        raise ApplicationError('유효하지 않은 커서입니다.')
+
+    return values
+
+
+def _field_name(field: str) -> str:
+    return field.lstrip('-')
+
+
+def cursor_values(row, ordering: list[str]) -> dict:
+    # row는 model instance 또는 values() dict 모두 가능
+    if isinstance(row, dict):
+        return {_field_name(f): row[_field_name(f)] for f in ordering}
+    return {_field_name(f): getattr(row, _field_name(f)) for f in ordering}
+
+
+def keyset_q(ordering: list[str], values: dict) -> Q:
+    # (a, b) > (va, vb) == (a > va) OR (a = va AND b > vb)
+    try:
+        q = Q()
+        for i, field in enumerate(ordering):
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition = Q(**{'{}__{}'.format(_field_name(field), lookup): values[_field_name(field)]})
+            for prev in ordering[:i]:
+                condition &= Q(**{_field_name(prev): values[_field_name(prev)]})
+            q |= condition
+    except KeyError:
+        raise ApplicationError('유효하지 않은 커서입니다.')
+
+    return q
+
+
+def paginate_keyset(queryset, ordering: list[str], cursor: str = None, page_size: int = 20):
+    # page_size + 1개를 가져와 다음 페이지 존재 여부를 COUNT 없이 판단
+    if cursor:
+        queryset = queryset.filter(keyset_q(ordering, decode_cursor(cursor)))
+
+    rows = list(queryset.order_by(*ordering)[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(cursor_values(rows[-1], ordering))
+
+    return rows, next_cursor
+
+
+# 커서에 담을 수 있는 정렬 필드 타입 (JSON으로 인코딩한 값을 그대로 비교에 사용할 수 있는 타입)
+# Decimal 등 JSON으로 인코딩할 수 없는 타입은 커서 생성 시 500 오류가 되므로 정렬 단계에서 거부
+CURSOR_FIELD_TYPES = (models.DateField, models.CharField, models.TextField,
+                      models.IntegerField, models.FloatField, models.BooleanField)
+
+
+def _is_cursor_field(queryset, name: str) -> bool:
+    # NULL이 가능한 필드는 (a > va) 비교에서 제외되므로 지원하지 않음
+    # annotation은 NULL 여부를 알 수 없으므로 타입만 확인 (NULL이 아닌 값만 정렬에 사용해야 함)
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        field, null = annotation.output_field, False
+    else:
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        null = field.null
+    return isinstance(field, CURSOR_FIELD_TYPES) and not field.is_relation and not null
+
+
+def queryset_ordering(queryset) -> list[str]:
+    # queryset의 정렬 필드에 unique한 id를 덧붙여 커서로 사용할 ordering 생성
+    ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+
+    for field in ordering:
+        if not isinstance(field, str) or field == '?' or '__' in field:
+            raise ApplicationError('커서 페이지네이션을 지원하지 않는 정렬입니다.')
+
+    ordering = ['-id' if field == '-pk' else 'id' if field == 'pk' else field
+                for field in ordering]
+    if 'id' not in ordering and '-id' not in ordering:
+        ordering.append('-id' if ordering and ordering[-1].startswith('-') else 'id')
+
+    for field in ordering:
+        if not _is_cursor_field(queryset, _field_name(field)):
+            raise ApplicationError('커서 페이지네이션을 지원하지 않는 정렬입니다.')
+
+    return ordering
+
+
+def approximate_count(queryset, limit: int = 1000) -> int:
+    # 전체 COUNT(*) 대신 최대 limit개까지만 세어 비용을 제한 (limit과 같으면 그 이상일 수 있음)
+    return queryset.order_by()[:limit].count()
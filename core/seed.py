@@ -0,0 +1,338 @@
+import random
+from collections import Counter
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import F
+
+from core.exceptions import ApplicationError
+from users.models import User
+from places.models import Place, PlacePhoto, SNSType, SNSUrl, PlaceVisitorReview
+from stories.models import Story, StoryPhoto, StoryComment, StoryMap
+from community.models import Board, Post, PostPhoto, PostComment, PostLike, PostHashtag, PostHashtagStat, PostSearchDocument, PostSearchToken, search_ngrams
+from forest.models import Category, SemiCategory, Forest, ForestPhoto, ForestHashtag, ForestHashtagStat, ForestComment, ForestFeedPosting
+from curations.models import Curation, Curation_Story, CurationPhoto
+from mypage.models import TimelineEntry
+
+
+class DatasetSeeder:
+    # 부하 테스트/벤치마크용 데이터셋 생성기 (`python manage.py seed_data`, core/benchmarks.py에서 사용)
+    # - 같은 seed, scale이면 같은 구성의 데이터셋을 생성
+    # - bulk_create를 사용하므로 model save/signal/service가 실행되지 않음
+    #   좋아요/팔로우 수, 해시태그 통계, 게시글 검색 색인, 포레스트 피드 posting list, 팔로잉 타임라인도 함께 생성
+    # - 생성되는 데이터의 이메일/제목은 prefix로 시작하며, 같은 prefix로 두 번 생성할 수 없음
+    SIZES = {
+        'users': 100,
+        'places': 50,
+        'stories': 50,
+        'posts': 200,
+        'forests': 200,
+        'curations': 20,
+    }
+    FOLLOWS_PER_USER = 10
+    LIKES_PER_USER = 5
+    COMMENTS_PER_POST = 3
+    HASHTAGS = ['제로웨이스트', '비건', '리필', '업사이클링', '플라스틱프리', '친환경', '텀블러', '중고', '채식', '분리수거']
+    BATCH_SIZE = 1000
+    PASSWORD = 'seed-password'
+
+    def __init__(self, scale: int = 1, seed: int = 0, prefix: str = 'seed'):
+        self.scale = scale
+        self.random = random.Random(seed)
+        self.prefix = prefix
+        self.counts = {}
+
+    def size(self, name: str) -> int:
+        return self.SIZES[name] * self.scale
+
+    def name(self, kind: str, i: int) -> str:
+        return '{} {} {}'.format(self.prefix, kind, i)
+
+    def sample(self, population: list, k: int) -> list:
+        return self.random.sample(population, min(k, len(population)))
+
+    def create(self, model, objs: list, queryset=None) -> list:
+        created = model.objects.bulk_create(objs, batch_size=self.BATCH_SIZE)
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(objs)
+        if queryset is not None and created and created[0].pk is None:
+            # MySQL 등 bulk_create가 pk를 반환하지 않는 DB는 생성 순서(id)대로 다시 조회
+            created = list(queryset.order_by('id'))
+        return created
+
+    @transaction.atomic
+    def run(self) -> dict:
+        if User.objects.filter(email__startswith='{}-'.format(self.prefix)).exists():
+            raise ApplicationError('prefix {}로 생성된 데이터가 이미 있습니다.'.format(self.prefix))
+
+        self.users = self.seed_users()
+        self.places = self.seed_places()
+        self.stories = self.seed_stories()
+        self.seed_posts()
+        self.forests = self.seed_forests()
+        self.curations = self.seed_curations()
+        self.seed_timeline()
+        return self.counts
+
+    def seed_users(self) -> list[User]:
+        password = make_password(self.PASSWORD)
+        users = self.create(User, [
+            User(email='{}-user{}@sasm.co.kr'.format(self.prefix, i),
+                 nickname='{}{}'.format(self.prefix, i)[:20],
+                 password=password, is_active=True,
+                 is_verified=i % 10 == 1, is_sdp_admin=i == 0,
+                 introduction='안녕하세요 {}입니다.'.format(i))
+            for i in range(self.size('users'))
+        ], User.objects.filter(email__startswith='{}-'.format(self.prefix)))
+
+        # 팔로우 관계와 팔로워/팔로잉 수 (UserFollowService와 동일하게 유지)
+        follows = []
+        for user in users:
+            targets = [target for target in self.sample(users, self.FOLLOWS_PER_USER + 1)
+                       if target.id != user.id][:self.FOLLOWS_PER_USER]
+            follows.extend(User.follows.through(from_user_id=user.id, to_user_id=target.id)
+                           for target in targets)
+        following_cnt = Counter(follow.from_user_id for follow in follows)
+        follower_cnt = Counter(follow.to_user_id for follow in follows)
+        for user in users:
+            user.following_cnt = following_cnt[user.id]
+            user.follower_cnt = follower_cnt[user.id]
+
+        self.create(User.follows.through, follows)
+        User.objects.bulk_update(users, ['follower_cnt', 'following_cnt'], batch_size=self.BATCH_SIZE)
+        self.follows = follows
+        return users
+
+    def seed_places(self) -> list[Place]:
+        categories = [category for category, _ in Place.PLACE_CHOICES]
+        places = self.create(Place, [
+            Place(place_name=self.name('장소', i),
+                  category=self.random.choice(categories),
+                  mon_hours='10:00 ~ 20:00', tues_hours='10:00 ~ 20:00', wed_hours='10:00 ~ 20:00',
+                  thurs_hours='10:00 ~ 20:00', fri_hours='10:00 ~ 20:00', sat_hours='12:00 ~ 18:00',
+                  sun_hours='휴무', place_review='벤치마크용 장소 리뷰',
+                  address='서울 마포구 포은로 {}'.format(i),
+                  rep_pic='places/place_image.png',
+                  short_cur='벤치마크용 장소 소개',
+                  latitude=37.5 + self.random.random() * 0.1,
+                  longitude=126.9 + self.random.random() * 0.1,
+                  is_released=True)
+            for i in range(self.size('places'))
+        ], Place.objects.filter(place_name__startswith=self.prefix))
+
+        self.create(PlacePhoto, [
+            PlacePhoto(place=place, image='places/{}-{}.jpg'.format(place.id, j))
+            for place in places for j in range(3)
+        ])
+        sns_types = self.create(SNSType, [
+            SNSType(name=self.name('sns', i)) for i in range(3)
+        ], SNSType.objects.filter(name__startswith=self.prefix))
+        self.create(SNSUrl, [
+            SNSUrl(place=place, snstype=sns_type, url='https://sasm.co.kr/{}/{}'.format(place.id, sns_type.id))
+            for place in places for sns_type in self.sample(sns_types, 2)
+        ])
+        self.create(PlaceVisitorReview, [
+            PlaceVisitorReview(place=place, visitor_name=user, contents='벤치마크용 방문자 리뷰')
+            for place in places for user in self.sample(self.users, 3)
+        ])
+        self.create(Place.place_likeuser_set.through, [
+            Place.place_likeuser_set.through(place_id=place.id, user_id=user.id)
+            for user in self.users for place in self.sample(places, self.LIKES_PER_USER)
+        ])
+        return places
+
+    def seed_stories(self) -> list[Story]:
+        writers = [user for user in self.users if user.is_verified]
+        stories = self.create(Story, [
+            Story(title=self.name('스토리', i), story_review='벤치마크용 스토리 한줄평',
+                  tag='#벤치마크 #스토리', preview='벤치마크용 스토리 미리보기',
+                  html_content='<p>벤치마크용 스토리 본문 {}</p><img src="story.jpg">'.format(i) * 5,
+                  place=self.places[i % len(self.places)], writer=self.random.choice(writers))
+            for i in range(self.size('stories'))
+        ], Story.objects.filter(title__startswith=self.prefix))
+
+        self.create(StoryPhoto, [
+            StoryPhoto(story=story, caption='사진', image='stories/{}-{}.jpg'.format(story.id, j))
+            for story in stories for j in range(3)
+        ])
+        # 스토리 상세 조회 시 지도 이미지가 없으면 외부 지도 API를 호출하므로 미리 생성
+        self.create(StoryMap, [StoryMap(story=story) for story in stories])
+        self.create(StoryComment, [
+            StoryComment(story=story, content='벤치마크용 댓글', writer=user)
+            for story in stories for user in self.sample(self.users, 5)
+        ])
+
+        likes = [Story.story_likeuser_set.through(story_id=story.id, user_id=user.id)
+                 for user in self.users for story in self.sample(stories, self.LIKES_PER_USER)]
+        self.create(Story.story_likeuser_set.through, likes)
+        like_cnt = Counter(like.story_id for like in likes)
+        for story in stories:
+            story.story_like_cnt = like_cnt[story.id]
+        Story.objects.bulk_update(stories, ['story_like_cnt'], batch_size=self.BATCH_SIZE)
+        return stories
+
+    def seed_posts(self):
+        board = Board.objects.create(name=self.name('게시판', 0), supports_hashtags=True,
+                                     supports_post_photos=True, supports_post_comments=True)
+        self.board = board
+        posts = self.create(Post, [
+            Post(title=self.name('게시글', i), content='벤치마크용 게시글 내용 {}'.format(i) * 10,
+                 board=board, writer=self.random.choice(self.users))
+            for i in range(self.size('posts'))
+        ], Post.objects.filter(board=board))
+
+        self.create(PostPhoto, [
+            PostPhoto(post=post, image='community/post/{}-{}.jpg'.format(post.id, j))
+            for post in posts for j in range(self.random.randint(0, 2))
+        ])
+        comments = self.create(PostComment, [
+            PostComment(post=post, content='벤치마크용 댓글', writer=user)
+            for post in posts for user in self.sample(self.users, self.COMMENTS_PER_POST)
+        ])
+        hashtags = self.create(PostHashtag, [
+            PostHashtag(post=post, name=name)
+            for post in posts for name in self.sample(self.HASHTAGS, 2)
+        ])
+        self.create(PostHashtagStat, [
+            PostHashtagStat(board=board, name=name, post_count=count)
+            for name, count in Counter(hashtag.name for hashtag in hashtags).items()
+        ])
+
+        # 게시글 검색 문서와 n-gram 역색인 (PostSearchService.index와 동일)
+        texts = {post.id: {PostSearchToken.TITLE: post.title, PostSearchToken.CONTENT: post.content,
+                           PostSearchToken.HASHTAG: [], PostSearchToken.COMMENT: []} for post in posts}
+        for hashtag in hashtags:
+            texts[hashtag.post_id][PostSearchToken.HASHTAG].append(hashtag.name)
+        for comment in comments:
+            texts[comment.post_id][PostSearchToken.COMMENT].append(comment.content)
+        for fields in texts.values():
+            fields[PostSearchToken.HASHTAG] = '\n'.join(fields[PostSearchToken.HASHTAG])
+            fields[PostSearchToken.COMMENT] = '\n'.join(fields[PostSearchToken.COMMENT])
+
+        self.create(PostSearchDocument, [
+            PostSearchDocument(post_id=post_id, board=board, title=fields[PostSearchToken.TITLE],
+                               content=fields[PostSearchToken.CONTENT],
+                               hashtags=fields[PostSearchToken.HASHTAG],
+                               comments=fields[PostSearchToken.COMMENT])
+            for post_id, fields in texts.items()
+        ])
+        self.create(PostSearchToken, [
+            PostSearchToken(board=board, post_id=post_id, field=field, token=token,
+                            weight=PostSearchToken.FIELD_WEIGHTS[field])
+            for post_id, fields in texts.items()
+            for field, text in fields.items()
+            for token in search_ngrams(text)
+        ])
+
+        likes = [PostLike(post=post, user=user)
+                 for user in self.users for post in self.sample(posts, self.LIKES_PER_USER)]
+        self.create(PostLike, likes)
+        like_cnt = Counter(like.post_id for like in likes)
+        for post in posts:
+            post.like_cnt = like_cnt[post.id]
+        Post.objects.bulk_update(posts, ['like_cnt'], batch_size=self.BATCH_SIZE)
+
+    def seed_forests(self) -> list[Forest]:
+        categories = self.create(Category, [
+            Category(name=self.name('카테고리', i)) for i in range(3)
+        ], Category.objects.filter(name__startswith=self.prefix))
+        # SemiCategory.name은 최대 10자
+        semi_categories = self.create(SemiCategory, [
+            SemiCategory(name='{}-{}'.format(i, j), category=category)
+            for i, category in enumerate(categories) for j in range(3)
+        ], SemiCategory.objects.filter(category__in=categories))
+
+        forests = self.create(Forest, [
+            Forest(title=self.name('포레스트', i), subtitle='벤치마크용 부제목',
+                   content='<p>벤치마크용 포레스트 내용 {}</p>'.format(i) * 10,
+                   category=self.random.choice(categories), writer=self.random.choice(self.users))
+            for i in range(self.size('forests'))
+        ], Forest.objects.filter(title__startswith=self.prefix))
+
+        # 포레스트는 자신의 카테고리에 속한 세미 카테고리 중 1~2개를 가짐
+        category_semi_categories = {}
+        for semi_category in semi_categories:
+            category_semi_categories.setdefault(semi_category.category_id, []).append(semi_category)
+        forest_semi_categories = {
+            forest.id: self.sample(category_semi_categories[forest.category_id], self.random.randint(1, 2))
+            for forest in forests
+        }
+        self.create(SemiCategory.forest.through, [
+            SemiCategory.forest.through(semicategory_id=semi_category.id, forest_id=forest.id)
+            for forest in forests for semi_category in forest_semi_categories[forest.id]
+        ])
+        self.create(User.semi_categories.through, [
+            User.semi_categories.through(user_id=user.id, semicategory_id=semi_category.id)
+            for user in self.users for semi_category in self.sample(semi_categories, 2)
+        ])
+        self.create(ForestPhoto, [
+            ForestPhoto(forest=forest, image='forest/post/{}.jpg'.format(forest.id)) for forest in forests
+        ])
+        hashtags = self.create(ForestHashtag, [
+            ForestHashtag(forest=forest, name=name)
+            for forest in forests for name in self.sample(self.HASHTAGS, 2)
+        ])
+        # 해시태그 통계는 이름이 전역 unique이므로 이미 있는 통계에 더함
+        for name, count in Counter(hashtag.name for hashtag in hashtags).items():
+            stat, _ = ForestHashtagStat.objects.get_or_create(name=name)
+            ForestHashtagStat.objects.filter(pk=stat.pk).update(forest_count=F('forest_count') + count)
+        self.create(ForestComment, [
+            ForestComment(forest=forest, content='벤치마크용 댓글', writer=user)
+            for forest in forests for user in self.sample(self.users, 2)
+        ])
+
+        likes = [Forest.likeuser_set.through(forest_id=forest.id, user_id=user.id)
+                 for user in self.users for forest in self.sample(forests, self.LIKES_PER_USER)]
+        self.create(Forest.likeuser_set.through, likes)
+        like_cnt = Counter(like.forest_id for like in likes)
+        for forest in forests:
+            forest.like_cnt = like_cnt[forest.id]
+        Forest.objects.bulk_update(forests, ['like_cnt'], batch_size=self.BATCH_SIZE)
+
+        # 개인화 피드 posting list (ForestFeedPostingService와 동일하게 유지)
+        self.create(ForestFeedPosting, [
+            ForestFeedPosting(semi_category=semi_category, forest=forest,
+                              created=forest.created, like_cnt=forest.like_cnt)
+            for forest in forests for semi_category in forest_semi_categories[forest.id]
+        ])
+        return forests
+
+    def seed_curations(self) -> list[Curation]:
+        writers = [user for user in self.users if user.is_verified or user.is_sdp_admin]
+        curations = self.create(Curation, [
+            Curation(title=self.name('큐레이션', i), contents='벤치마크용 큐레이션 내용',
+                     writer=self.random.choice(writers), is_released=True,
+                     is_selected=i < 5, is_rep=i == 0)
+            for i in range(self.size('curations'))
+        ], Curation.objects.filter(title__startswith=self.prefix))
+
+        self.create(CurationPhoto, [
+            CurationPhoto(curation=curation, image='curations/{}.jpg'.format(curation.id))
+            for curation in curations
+        ])
+        self.create(Curation_Story, [
+            Curation_Story(curation=curation, story=story, short_curation='벤치마크용 숏큐레이션')
+            for curation in curations for story in self.sample(self.stories, 4)
+        ])
+
+        likes = [Curation.likeuser_set.through(curation_id=curation.id, user_id=user.id)
+                 for user in self.users for curation in self.sample(curations, 2)]
+        self.create(Curation.likeuser_set.through, likes)
+        like_cnt = Counter(like.curation_id for like in likes)
+        for curation in curations:
+            curation.like_cnt = like_cnt[curation.id]
+        Curation.objects.bulk_update(curations, ['like_cnt'], batch_size=self.BATCH_SIZE)
+        return curations
+
+    def seed_timeline(self):
+        # 팔로잉 타임라인 (TimelineService.fan_out과 동일하게 팔로워마다 작성자의 게시물 저장)
+        posts_by_writer = {}
+        for model, rows in (('Story', self.stories), ('Forest', self.forests), ('Curation', self.curations)):
+            for row in rows:
+                posts_by_writer.setdefault(row.writer_id, []).append((model, row.id, row.created))
+
+        self.create(TimelineEntry, [
+            TimelineEntry(user_id=follow.from_user_id, writer_id=follow.to_user_id,
+                          model=model, object_id=object_id, created=created)
+            for follow in self.follows
+            for model, object_id, created in posts_by_writer.get(follow.to_user_id, [])
+        ])
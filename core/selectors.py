@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db.models import F, Func, IntegerField, CharField, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, NullIf
+
+
+class SubqueryCount(Subquery):
+    # 상관 서브쿼리로 COUNT를 계산, 바깥 쿼리에 GROUP BY/JOIN을 추가하지 않음
+    # ex) annotate(comment_cnt=SubqueryCount(Comment.objects.filter(post=OuterRef('pk'))))
+    output_field = IntegerField()
+
+    def __init__(self, queryset, **extra):
+        # Func(COUNT)는 aggregate로 취급되지 않으므로 서브쿼리 내부에 GROUP BY가 생기지 않음
+        queryset = queryset.order_by().annotate(
+            _cnt=Func(F('pk'), function='COUNT')).values('_cnt')
+        super().__init__(queryset, **extra)
+
+
+def subquery_count(queryset):
+    return Coalesce(SubqueryCount(queryset), 0)
+
+
+def rep_media_url(queryset, field: str = 'image'):
+    # 대표 사진(첫 번째 사진) URL, to-many join 대신 상관 서브쿼리를 사용해 row가 늘어나지 않음
+    # ex) annotate(rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))))
+    path = Subquery(queryset.order_by('pk').values(field)[:1])
+
+    # 사진이 없으면 Concat 결과가 MEDIA_URL만 남으므로 NULL로 변환
+    return NullIf(
+        Concat(Value(settings.MEDIA_URL), path, output_field=CharField()),
+        Value(settings.MEDIA_URL),
+    )
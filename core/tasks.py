@@ -0,0 +1,49 @@
+import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+
+logger = logging.getLogger('django')
+
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'BACKGROUND_TASK_WORKERS', 2),
+            thread_name_prefix='background-task',
+        )
+    return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except:
+        # 백그라운드 작업의 실패가 요청 처리에 영향을 주지 않도록 로그만 기록
+        logger.error(traceback.format_exc())
+    finally:
+        # 작업 스레드에서 열린 DB connection 정리
+        connections.close_all()
+
+
+def enqueue(func, *args, **kwargs):
+    # 백그라운드 스레드에서 func 실행
+    # BACKGROUND_TASK_EAGER가 True이면 같은 스레드에서 바로 실행 (테스트용)
+    if getattr(settings, 'BACKGROUND_TASK_EAGER', False):
+        try:
+            func(*args, **kwargs)
+        except:
+            logger.error(traceback.format_exc())
+        return
+    _get_executor().submit(_run, func, args, kwargs)
+
+
+def enqueue_on_commit(func, *args, **kwargs):
+    # 현재 트랜잭션이 커밋된 이후 백그라운드 스레드에서 func 실행 (rollback 시 실행되지 않음)
+    transaction.on_commit(lambda: enqueue(func, *args, **kwargs))
@@ -0,0 +1,24 @@
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from core.metrics import fingerprint
+
+
+class QueryBudgetTestMixin:
+    # API별 쿼리 수 상한(budget) 검증
+    # ex) with self.assertQueryBudget(5): self.client.get('/forest/')
+    # 초과하면 실행된 쿼리를 fingerprint별 실행 횟수와 함께 보여줌 (N+1 확인용)
+    @contextmanager
+    def assertQueryBudget(self, budget: int, using: str = 'default'):
+        with CaptureQueriesContext(connections[using]) as queries:
+            yield queries
+
+        executed = len(queries.captured_queries)
+        if executed > budget:
+            counts = Counter(fingerprint(query['sql']) for query in queries.captured_queries)
+            self.fail('{} queries executed, budget is {}\n{}'.format(
+                executed, budget,
+                '\n'.join('{}x {}'.format(count, sql) for sql, count in counts.most_common())))
@@ -1,3 +1,298 @@
-from django.test import TestCase
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+from smtplib import SMTPException
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db.models import DecimalField, Value
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework import serializers
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from users.models import User
+from forest.models import Forest, ForestPhoto, Category, ForestFeedPosting
+from forest.services import ForestPhotoService
+from core.exceptions import ApplicationError
+from core.http import http_client, stub_responses, JwksCache
+from core.mail import EmailOutboxService
+from core.metrics import metrics, RequestMetricsMiddleware
+from core.benchmarks import read_endpoints
+from core.seed import DatasetSeeder
+from core.models import EmailOutbox
+from users.services import UserService
+from core.testing import QueryBudgetTestMixin
+from core.uploads import get_upload_backend
+from core.pagination import queryset_ordering
+from core.views import get_paginated_data
+
+
+PNG_HEADER = b'\x89PNG\r\n\x1a\n' + b'\x00' * 32
+
+
+@override_settings(UPLOAD_BACKEND='core.uploads.FileSystemUploadBackend',
+                   UPLOAD_FILESYSTEM_ROOT=tempfile.mkdtemp())
+class PresignedUploadTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        self.other = User.objects.create_user(
+            email='other@test.test', password='test', nickname='other')
+
+    def test_confirm_creates_photo_for_uploaded_image(self):
+        ticket = ForestPhotoService.issue_upload(
+            user=self.user, content_type='image/png', size=len(PNG_HEADER))
+        get_upload_backend().write(ticket.key, PNG_HEADER)
+
+        location = ForestPhotoService.confirm_upload(user=self.user, token=ticket.token)
+
+        self.assertTrue(location.endswith(ticket.key))
+        self.assertTrue(ForestPhoto.objects.filter(image=ticket.key).exists())
+
+        # 같은 token으로 두 번 confirm할 수 없음
+        with self.assertRaises(ApplicationError):
+            ForestPhotoService.confirm_upload(user=self.user, token=ticket.token)
+
+    def test_confirm_rejects_other_user_and_non_image(self):
+        ticket = ForestPhotoService.issue_upload(
+            user=self.user, content_type='image/png', size=len(PNG_HEADER))
+        get_upload_backend().write(ticket.key, b'<html></html>')
+
+        with self.assertRaises(ApplicationError):
+            ForestPhotoService.confirm_upload(user=self.other, token=ticket.token)
+        with self.assertRaises(ApplicationError):
+            ForestPhotoService.confirm_upload(user=self.user, token=ticket.token)
+
+        self.assertFalse(ForestPhoto.objects.exists())
+        self.assertIsNone(get_upload_backend().stat(ticket.key))
+
+    def test_issue_rejects_unsupported_type_and_size(self):
+        with self.assertRaises(ApplicationError):
+            ForestPhotoService.issue_upload(
+                user=self.user, content_type='application/pdf', size=10)
+        with self.assertRaises(ApplicationError):
+            ForestPhotoService.issue_upload(
+                user=self.user, content_type='image/png', size=100 * 1024 * 1024)
+
+
+class CursorPaginationTests(TestCase):
+    class Pagination(PageNumberPagination):
+        page_size = 2
+
+    class UserSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+
+    def setUp(self):
+        for i in range(5):
+            User.objects.create_user(
+                email='test{}@test.test'.format(i), password='test', nickname='test{}'.format(i))
+
+    def paginate(self, params):
+        return get_paginated_data(
+            pagination_class=self.Pagination,
+            serializer_class=self.UserSerializer,
+            queryset=User.objects.order_by('-is_active'),
+            request=Request(APIRequestFactory().get('/', params, HTTP_HOST='localhost')),
+            view=None,
+        )
+
+    def test_cursor_pages_break_ties_by_id_without_count(self):
+        expected = list(User.objects.order_by('-is_active', '-id').values_list('id', flat=True))
+
+        ids = []
+        params = {'pagination': 'cursor'}
+        with self.assertNumQueries(1):
+            data = self.paginate(params)
+        self.assertIsNone(data['count'])
+        ids.extend(row['id'] for row in data['results'])
+
+        while data['next']:
+            params['cursor'] = parse_qs(urlparse(data['next']).query)['cursor'][0]
+            data = self.paginate(params)
+            ids.extend(row['id'] for row in data['results'])
+
+        self.assertEqual(ids, expected)
+
+    def test_approximate_count_and_invalid_cursor(self):
+        data = self.paginate({'pagination': 'cursor', 'count': 'approximate'})
+        self.assertEqual(data['count'], 5)
+
+        with self.assertRaises(ApplicationError):
+            self.paginate({'pagination': 'cursor', 'cursor': 'invalid'})
+
+    def test_rejects_ordering_that_cannot_be_used_as_cursor(self):
+        querysets = [
+            User.objects.order_by('birthdate'),  # NULL 가능
+            Forest.objects.order_by('writer'),  # 관계 필드
+            User.objects.annotate(score=Value(Decimal('1.5'), output_field=DecimalField())).order_by('score'),
+        ]
+        for queryset in querysets:
+            with self.subTest(queryset.query.order_by), self.assertRaises(ApplicationError):
+                queryset_ordering(queryset)
+
+
+@override_settings(HTTP_CLIENT_BREAKER=(2, 30))
+class HttpClientTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = []
+
+    def test_circuit_opens_after_consecutive_provider_failures(self):
+        def handler(request):
+            self.calls.append(request.url)
+            return 503, {}
+
+        with stub_responses({'https://provider.test/': handler}):
+            for _ in range(2):
+                self.assertEqual(http_client.get('test', 'https://provider.test/me').status_code, 503)
+            with self.assertRaises(ApplicationError):
+                http_client.get('test', 'https://provider.test/me')
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_jwks_cache_refreshes_only_on_unknown_kid(self):
+        def handler(request):
+            self.calls.append(request.url)
+            return 200, {'keys': [{'kid': 'k{}'.format(len(self.calls)), 'alg': 'RS256'}]}
+
+        jwks = JwksCache('test', 'https://keys.test/keys', refresh_interval=0)
+        with stub_responses({'https://keys.test/': handler}):
+            self.assertEqual(jwks.get_key('k1')['kid'], 'k1')
+            self.assertEqual(jwks.get_key('k1')['kid'], 'k1')
+            self.assertEqual(len(self.calls), 1)
+
+            # 키 교체: 모르는 kid가 오면 다시 조회
+            self.assertEqual(jwks.get_key('k2')['kid'], 'k2')
+            self.assertEqual(len(self.calls), 2)
+
+
+class UnavailableEmailBackend(BaseEmailBackend):
+    # SMTP 서버 장애 대역
+    def open(self):
+        raise SMTPException('unavailable')
+
+    def send_messages(self, email_messages):
+        raise SMTPException('unavailable')
+
+
+@override_settings(BACKGROUND_TASK_EAGER=True)
+class EmailOutboxTests(TestCase):
+    def test_sign_up_sends_outbox_email_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            UserService.sign_up(email='mail@test.test', password='test', nickname='mail')
+            self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['mail@test.test'])
+        self.assertEqual(len(mail.outbox[0].attachments), 1)
+        email = EmailOutbox.objects.get()
+        self.assertEqual(email.status, EmailOutbox.STATUS_SENT)
+        # 인증 토큰이 포함된 본문은 발송 후 보관하지 않음
+        self.assertEqual(email.html_content, '')
+
+    def test_purges_finished_emails_after_retention(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            UserService.sign_up(email='mail@test.test', password='test', nickname='mail')
+        EmailOutboxService.enqueue(subject='pending', to_email='mail@test.test', html_content='code')
+
+        self.assertEqual(EmailOutboxService.purge_finished(), 0)
+
+        EmailOutbox.objects.update(updated=timezone.now() - EmailOutboxService.RETENTION - timedelta(seconds=1))
+        self.assertEqual(EmailOutboxService.purge_finished(), 1)
+        self.assertEqual(list(EmailOutbox.objects.values_list('subject', flat=True)), ['pending'])
+
+    def test_smtp_outage_keeps_email_for_retry_with_backoff(self):
+        with override_settings(EMAIL_BACKEND='core.tests.UnavailableEmailBackend'):
+            with self.captureOnCommitCallbacks(execute=True):
+                UserService.sign_up(email='mail@test.test', password='test', nickname='mail')
+
+        email = EmailOutbox.objects.get()
+        self.assertEqual(email.status, EmailOutbox.STATUS_PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertTrue(User.objects.filter(email='mail@test.test').exists())
+
+        # backoff 시간이 지나기 전에는 재시도하지 않음
+        self.assertEqual(EmailOutboxService.deliver_pending(), 0)
+
+        EmailOutbox.objects.update(next_attempt_at=email.created)
+        self.assertEqual(EmailOutboxService.deliver_pending(), 1)
+        self.assertEqual(EmailOutbox.objects.get().status, EmailOutbox.STATUS_SENT)
+
+
+class RequestMetricsTests(QueryBudgetTestMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.user = User.objects.create_user(
+            email='metrics@test.test', password='test', nickname='metrics')
+        self.client = APIClient(HTTP_HOST='localhost')
+        self.client.force_authenticate(user=self.user)
+
+    def test_records_queries_and_cache_per_route(self):
+        self.client.get('/mypage/me/summary/')
+        self.client.get('/mypage/me/summary/')
+
+        summary = metrics.snapshot()['GET mypage/me/summary/']
+        self.assertEqual(summary['duration_ms']['count'], 2)
+        self.assertEqual((summary['cache_hits']['sum'], summary['cache_misses']['sum']), (1, 1))
+        self.assertGreater(summary['queries']['sum'], 0)
+
+        self.user.is_sdp_admin = True
+        self.user.save()
+        response = self.client.get('/metrics/')
+        self.assertIn('GET mypage/me/summary/', response.data['data'])
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=2)
+    def test_logs_repeated_sql_fingerprint(self):
+        def view(request):
+            for user_id in range(3):
+                User.objects.filter(pk=user_id).exists()
+            return HttpResponse()
+
+        with self.assertLogs('django', level='WARNING') as logs:
+            RequestMetricsMiddleware(view)(RequestFactory().get('/'))
+
+        self.assertIn('repeated=3', logs.output[0])
+        self.assertEqual(metrics.snapshot()['unresolved']['queries']['sum'], 3)
+
+    def test_api_query_budgets(self):
+        category = Category.objects.create(name='category')
+        for i in range(10):
+            Forest.objects.create(title=str(i), content='content', category=category, writer=self.user)
+
+        with self.assertQueryBudget(6):
+            self.client.get('/forest/')
+        # 캐시가 없을 때: 개수 1 + 탭별 첫 페이지 9, 캐시된 이후: 0
+        with self.assertQueryBudget(10):
+            self.client.get('/mypage/me/summary/')
+        with self.assertQueryBudget(0):
+            self.client.get('/mypage/me/summary/')
+
+
+class DatasetSeederTests(TestCase):
+    def test_seeded_counters_match_relations_and_endpoints_respond(self):
+        seeder = DatasetSeeder(prefix='test')
+        seeder.run()
+
+        user = User.objects.get(pk=seeder.users[1].pk)
+        self.assertEqual(user.following_cnt, user.follows.count())
+        self.assertEqual(user.follower_cnt, user.followers.count())
+        forest = Forest.objects.get(pk=seeder.forests[0].pk)
+        self.assertEqual(forest.like_cnt, forest.likeuser_set.count())
+        self.assertEqual(ForestFeedPosting.objects.filter(forest=forest).count(), forest.semicategories.count())
+
+        with self.assertRaises(ApplicationError):
+            DatasetSeeder(prefix='test').run()
+
+    def test_read_endpoints_benchmark(self):
+        for label, run in read_endpoints(scale=1).items():
+            with self.subTest(label):
+                self.assertEqual(run(), 200)
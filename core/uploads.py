@@ -0,0 +1,192 @@
+import os
+import time
+import uuid
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core import signing
+from django.utils.module_loading import import_string
+
+from core.exceptions import ApplicationError
+
+
+# 클라이언트가 스토리지에 직접 업로드하는 presigned 업로드 흐름
+# 1. issue_upload: 업로드할 object key와 짧은 유효기간의 업로드 URL, 서명된 token 발급
+# 2. 클라이언트가 URL로 파일을 직접 업로드
+# 3. confirm_upload: token 검증 후 스토리지의 실제 파일 크기/타입을 확인하고 ImageField에 저장할 name 반환
+
+UPLOAD_TOKEN_SALT = 'core.uploads'
+
+# content type별 확장자
+ALLOWED_IMAGE_TYPES = {
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+    'image/heic': 'heic',
+}
+
+
+@dataclass
+class UploadTicket:
+    key: str
+    url: str
+    fields: dict
+    token: str
+    expires_in: int
+
+
+def sniff_image_type(head: bytes):
+    # 파일 앞부분의 magic number로 실제 이미지 타입 확인 (헤더의 Content-Type은 클라이언트가 임의로 지정 가능)
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'image/gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head[4:8] == b'ftyp' and head[8:12] in (b'heic', b'heix', b'mif1', b'msf1'):
+        return 'image/heic'
+    return None
+
+
+class S3UploadBackend:
+    def __init__(self):
+        import boto3
+
+        self.bucket = settings.AWS_STORAGE_BUCKET_NAME
+        self.client = boto3.client(
+            's3',
+            region_name=settings.AWS_S3_REGION_NAME,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
+
+    def _object_key(self, name: str) -> str:
+        # MediaStorage의 location(media/) 하위에 저장되어야 ImageField name과 일치
+        return '{}/{}'.format(settings.MEDIAFILES_LOCATION, name)
+
+    def presign(self, name: str, content_type: str, max_size: int, expires_in: int):
+        # content-length-range 조건으로 S3가 직접 크기 제한을 강제
+        post = self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=self._object_key(name),
+            Fields={'Content-Type': content_type},
+            Conditions=[
+                {'Content-Type': content_type},
+                ['content-length-range', 1, max_size],
+            ],
+            ExpiresIn=expires_in,
+        )
+        return post['url'], post['fields']
+
+    def stat(self, name: str):
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(
+                Bucket=self.bucket, Key=self._object_key(name))
+        except ClientError:
+            return None
+        return head['ContentLength']
+
+    def read_head(self, name: str, length: int) -> bytes:
+        obj = self.client.get_object(
+            Bucket=self.bucket,
+            Key=self._object_key(name),
+            Range='bytes=0-{}'.format(length - 1),
+        )
+        return obj['Body'].read()
+
+    def delete(self, name: str):
+        self.client.delete_object(
+            Bucket=self.bucket, Key=self._object_key(name))
+
+
+class FileSystemUploadBackend:
+    # 테스트/로컬 개발용 stand-in, 클라이언트 업로드는 write()로 대신함
+    def __init__(self):
+        self.location = settings.UPLOAD_FILESYSTEM_ROOT
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.location, name)
+
+    def presign(self, name: str, content_type: str, max_size: int, expires_in: int):
+        return 'file://' + self._path(name), {'Content-Type': content_type}
+
+    def write(self, name: str, content: bytes):
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+    def stat(self, name: str):
+        try:
+            return os.path.getsize(self._path(name))
+        except OSError:
+            return None
+
+    def read_head(self, name: str, length: int) -> bytes:
+        with open(self._path(name), 'rb') as f:
+            return f.read(length)
+
+    def delete(self, name: str):
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
+
+
+def get_upload_backend():
+    return import_string(settings.UPLOAD_BACKEND)()
+
+
+def issue_upload(user, upload_to: str, content_type: str, size: int) -> UploadTicket:
+    if content_type not in ALLOWED_IMAGE_TYPES:
+        raise ApplicationError('지원하지 않는 이미지 형식입니다.')
+    if size <= 0 or size > settings.UPLOAD_MAX_SIZE:
+        raise ApplicationError('이미지 크기는 {}MB 이하여야 합니다.'.format(
+            settings.UPLOAD_MAX_SIZE // (1024 * 1024)))
+
+    # 기존 업로드 파일명 규칙(time + uuid)을 그대로 사용
+    name = '{}/{}.{}'.format(upload_to.rstrip('/'),
+                             str(time.time()) + str(uuid.uuid4().hex),
+                             ALLOWED_IMAGE_TYPES[content_type])
+    expires_in = settings.UPLOAD_URL_EXPIRES
+
+    url, fields = get_upload_backend().presign(
+        name=name,
+        content_type=content_type,
+        max_size=settings.UPLOAD_MAX_SIZE,
+        expires_in=expires_in,
+    )
+    # token에 업로드 요청자와 key를 서명해두어, 다른 사용자의 업로드를 confirm할 수 없도록 함
+    token = signing.dumps({'name': name, 'user': user.pk},
+                          salt=UPLOAD_TOKEN_SALT)
+
+    return UploadTicket(key=name, url=url, fields=fields, token=token, expires_in=expires_in)
+
+
+def confirm_upload(user, token: str, upload_to: str) -> str:
+    try:
+        # 업로드 URL 만료 후에도 업로드 완료 직후 confirm할 수 있도록 여유를 둠
+        payload = signing.loads(token, salt=UPLOAD_TOKEN_SALT,
+                                max_age=settings.UPLOAD_URL_EXPIRES * 2)
+    except signing.BadSignature:
+        raise ApplicationError('유효하지 않거나 만료된 업로드 token입니다.')
+
+    name = payload['name']
+    if payload['user'] != user.pk or not name.startswith(upload_to.rstrip('/') + '/'):
+        raise ApplicationError('유효하지 않거나 만료된 업로드 token입니다.')
+
+    backend = get_upload_backend()
+    size = backend.stat(name)
+    if size is None:
+        raise ApplicationError('업로드된 파일을 찾을 수 없습니다.')
+
+    if size > settings.UPLOAD_MAX_SIZE or sniff_image_type(backend.read_head(name, 16)) is None:
+        backend.delete(name)
+        raise ApplicationError('업로드된 파일이 유효한 이미지가 아닙니다.')
+
+    return name
@@ -1,18 +1,122 @@
+from collections import OrderedDict
+
+from django.db.models import QuerySet
 from django.shortcuts import render
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.utils.urls import replace_query_param
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from core.metrics import metrics
+from core.pagination import paginate_keyset, queryset_ordering, approximate_count
+from core.permissions import IsSdpStaff
+
+
+# 커서 페이지네이션 사용 시 count=approximate로 요청하면 최대 이 개수까지만 센 count 반환
+APPROXIMATE_COUNT_LIMIT = 1000
+
+
 # Create your views here.
-def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
+def get_paginated_data(*, pagination_class, serializer_class, queryset, request, view, page_transform=None):
+    # page_transform: 페이지에 포함된 row 리스트만 받아 응답용 객체 리스트로 변환하는 함수
+    # (selector는 lazy queryset을 반환하고, URL 변환/DTO 생성 등은 한 페이지에 대해서만 수행)
     paginator = pagination_class()
 
+    # ?pagination=cursor: COUNT(*)/OFFSET 없이 정렬 키 + id 기준 커서로 다음 페이지 조회
+    # 파라미터가 없는 기존 클라이언트는 pagination_class(페이지 번호) 그대로 사용
+    if request.query_params.get('pagination') == 'cursor' and isinstance(queryset, QuerySet):
+        return get_cursor_paginated_data(
+            paginator=paginator,
+            serializer_class=serializer_class,
+            queryset=queryset,
+            request=request,
+            page_transform=page_transform,
+        )
+
     page = paginator.paginate_queryset(queryset, request, view=view)
+    if page is None:
+        page = queryset
+
+    if page_transform is not None:
+        page = page_transform(list(page))
+
+    serializer = serializer_class(page, many=True, context={'request': request})
 
-    if page is not None:
-        serializer = serializer_class(page, many=True, context={'request': request})
-    else:
-        serializer = serializer_class(queryset, many=True, context={'request': request})
+    return paginator.get_paginated_response(serializer.data).data
 
+
+def get_cursor_paginated_data(*, paginator, serializer_class, queryset, request, page_transform=None):
+    rows, next_cursor = paginate_keyset(
+        queryset,
+        ordering=queryset_ordering(queryset),
+        cursor=request.query_params.get('cursor'),
+        page_size=paginator.get_page_size(request),
+    )
+    if page_transform is not None:
+        rows = page_transform(rows)
+    serializer = serializer_class(rows, many=True, context={'request': request})
+
+    count = None
+    if request.query_params.get('count') == 'approximate':
+        count = approximate_count(queryset, limit=APPROXIMATE_COUNT_LIMIT)
+
+    next_url = None
+    if next_cursor is not None:
+        next_url = replace_query_param(
+            request.build_absolute_uri(), 'cursor', next_cursor)
+
+    return OrderedDict([
+        ('count', count),
+        ('next', next_url),
+        ('previous', None),
+        ('results', serializer.data),
+    ])
+
+
+def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view, page_transform=None):
     return Response({
         'status': 'success',
-        'data': paginator.get_paginated_response(serializer.data).data,
-    }, status=status.HTTP_200_OK)
\ No newline at end of file
+        'data': get_paginated_data(
+            pagination_class=pagination_class,
+            serializer_class=serializer_class,
+            queryset=queryset,
+            request=request,
+            view=view,
+            page_transform=page_transform,
+        ),
+    }, status=status.HTTP_200_OK)
+
+
+class MetricsApi(APIView):
+    permission_classes = (IsSdpStaff, )
+
+    @swagger_auto_schema(
+        operation_id='요청별 성능 지표 조회',
+        operation_description='''
+            현재 worker 프로세스에서 집계한 view(route)별 성능 지표 histogram을 조회합니다. 관리자만 조회할 수 있습니다. <br/>
+            지표 : duration_ms, queries, db_ms, cache_hits, cache_misses, outbound_ms <br/>
+            buckets는 누적 개수이며, 지표는 worker 프로세스가 재시작되면 초기화됩니다. <br/>
+        ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        'GET forest/': {
+                            'queries': {'count': 2, 'sum': 10, 'buckets': {'0': 0, '1': 0, '2': 0, '5': 2, '+Inf': 2}},
+                        },
+                    },
+                }
+            ),
+            "403": openapi.Response(
+                description="Forbidden",
+            ),
+        },
+    )
+    def get(self, request):
+        return Response({
+            'status': 'success',
+            'data': metrics.snapshot(),
+        }, status=status.HTTP_200_OK)
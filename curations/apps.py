@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CurationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'curations'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.db.models import F, Case, When, Value, CharField
+from django.db.models.functions import Concat
+
+from core.benchmark import scenario
+from users.models import User
+from curations.models import Curation, CurationPhoto
+from curations.selectors import CurationSelector
+
+
+@scenario('curation_list_rep_pic')
+def curation_list_rep_pic(scale: int):
+    # 사진이 많은 큐레이션 목록: to-many join Case 방식과 상관 서브쿼리 방식 비교
+    writer = User.objects.create_user(
+        email='benchmark-curation@sasm.co.kr', password='benchmark', nickname='benchmark')
+
+    curations = Curation.objects.bulk_create([
+        Curation(title='벤치마크 {}'.format(i), contents='벤치마크 큐레이션',
+                 writer=writer, is_released=True)
+        for i in range(200 * scale)
+    ])
+    CurationPhoto.objects.bulk_create([
+        CurationPhoto(curation=curation, image='curations/{}-{}.jpg'.format(curation.id, j))
+        for curation in curations for j in range(10)
+    ], batch_size=1000)
+
+    def case_join():
+        curations = Curation.objects.distinct().filter(is_released=True).annotate(
+            rep_pic=Case(
+                When(photos__image=None, then=None),
+                default=Concat(Value(settings.MEDIA_URL),
+                               F('photos__image'),
+                               output_field=CharField())
+            ),
+            writer_email=F('writer__email'),
+            nickname=F('writer__nickname'),
+        ).order_by('-created')
+        # 페이지네이션과 동일하게 COUNT + 첫 페이지 조회, 전체 row 수 반환
+        count = curations.count()
+        list(curations[:20])
+        return count
+
+    def rep_media_url_subquery():
+        curations = CurationSelector.list(order='latest')
+        count = curations.count()
+        list(curations[:20])
+        return count
+
+    return {
+        'case_join': case_join,
+        'rep_media_url_subquery': rep_media_url_subquery,
+    }
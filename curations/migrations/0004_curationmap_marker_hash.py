@@ -0,0 +1,18 @@
+# Generated by Django 4.0 on 2026-10-19 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curations', '0003_curationmap'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='curationmap',
+            name='marker_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.0 on 2026-10-19 14:33
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_curation_like_cnt(apps, schema_editor):
+    # 기존 좋아요 수로 like_cnt 채우기
+    Curation = apps.get_model('curations', 'Curation')
+    Like = Curation.likeuser_set.through
+
+    Curation.objects.update(like_cnt=Coalesce(Subquery(
+        Like.objects.filter(curation_id=OuterRef('pk')).order_by()
+        .values('curation_id').annotate(cnt=Count('*')).values('cnt')[:1]), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curations', '0004_curationmap_marker_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='curation',
+            name='like_cnt',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_curation_like_cnt,
+                             migrations.RunPython.noop),
+    ]
@@ -28,6 +28,7 @@ class Curation(core_models.TimeStampedModel):
 
     likeuser_set = models.ManyToManyField(
         "users.User", related_name='liked_curations', blank=True)
+    like_cnt = models.PositiveIntegerField(default=0)  # CurationLikeService에서 증감
     writer = models.ForeignKey(
         'users.User', related_name='curations', on_delete=models.SET_NULL, null=True, blank=False)
 
@@ -46,9 +47,22 @@ class Curation(core_models.TimeStampedModel):
     def update_contents(self, contents):
         self.contents = contents
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 저장 시 공개 여부가 바뀌었는지 확인하기 위해 로드한 값 보관 (mypage.signals)
+        instance._loaded_is_released = dict(zip(field_names, values)).get('is_released')
+        return instance
+
+    def is_released_changed(self) -> bool:
+        # 로드 이후(또는 마지막 저장 이후) 공개 여부가 바뀌었는지, DB에서 로드하지 않은 경우 바뀐 것으로 간주
+        return getattr(self, '_loaded_is_released', None) != self.is_released
+
     def save(self, *args, **kwargs):
         self.full_clean()
-        return super().save(*args, **kwargs)
+        result = super().save(*args, **kwargs)
+        self._loaded_is_released = self.is_released
+        return result
 
 
 class Curation_Story(core_models.TimeStampedModel):
@@ -69,13 +83,21 @@ class Curation_Story(core_models.TimeStampedModel):
         return super().save(*args, **kwargs)
 
 
+CURATION_MAP_PLACEHOLDER = 'curation_map_photo.png'
+
+
 class CurationMap(core_models.TimeStampedModel):
     curation = models.ForeignKey(
         "Curation", related_name='map_photos', on_delete=models.CASCADE, null=True)
+    # 지도 이미지가 생성되기 전까지는 placeholder 이미지
     map = models.ImageField(
-        upload_to=get_upload_path, default='curation_map_photo.png')
+        upload_to=get_upload_path, default=CURATION_MAP_PLACEHOLDER)
+    # 지도에 표시할 마커(장소) 집합의 hash, 스토리 구성이 바뀌지 않았으면 지도를 다시 생성하지 않음
+    marker_hash = models.CharField(max_length=64, blank=True, default='')
 
 
 @receiver(models.signals.post_delete, sender=CurationMap)
 def remove_file_from_s3(sender, instance, using, **kwargs):
-    instance.map.delete(save=False)
+    # 공용 placeholder 이미지는 삭제하지 않음
+    if instance.map.name != CURATION_MAP_PLACEHOLDER:
+        instance.map.delete(save=False)
@@ -1,17 +1,25 @@
 # from django.db.models import Q, F
 # from users.models import
 from datetime import datetime
-from curations.models import Curation
+import heapq
+from itertools import islice
+
+from curations.models import Curation, CurationPhoto, Curation_Story
 from users.models import User
-from stories.models import Story
-from forest.models import Forest
+from users.selectors import UserFollowGraphSelector
+from stories.models import Story, StoryPhoto
+from forest.models import Forest, ForestHashtag
 
 from django.conf import settings
+from django.http import Http404
 from django.db.models.functions import Concat, Substr
 from django.db.models import Q, F, Case, When, Value, Exists, OuterRef, CharField, BooleanField, Aggregate, Count
+from core.exceptions import ApplicationError
+from core.pagination import encode_cursor, decode_cursor, approximate_count
+from core.selectors import rep_media_url, subquery_count
+from core.caches import VersionedCache
 from dataclasses import dataclass
 
-from itertools import chain
 
 class GroupConcat(Aggregate):
     # Postgres ArrayAgg similar(not exactly equivalent) for sqlite & mysql
@@ -78,15 +86,7 @@ class CurationSelector:
             order = 'created'
 
         curations = Curation.objects.distinct().filter(q, is_released=True).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
             writer_email=F('writer__email'),
             nickname = F('writer__nickname'),
         ).order_by(order)
@@ -104,14 +104,6 @@ class CurationSelector:
                     then=Value(1)),
                 default=Value(0),
             ),
-            like_cnt=Count('likeuser_set'),
-            is_followed = Exists(
-            user.follows.through.objects.filter(
-                from_user_id=user.id,
-                to_user_id=OuterRef('writer_id')
-                )
-            ) if user.is_authenticated else Value(False),
-           
         ).select_related(
             'writer'
         ).prefetch_related(
@@ -130,7 +122,7 @@ class CurationSelector:
             updated=curation.updated,
             created=curation.created,
             map_image=None,
-            writer_is_followed=curation.is_followed,
+            writer_is_followed=UserFollowGraphSelector.is_followed(user, curation.writer_id),
             like_cnt=curation.like_cnt,
         )
 
@@ -144,15 +136,7 @@ class CurationSelector:
 
     def rep_curation_list(self):
         curations = Curation.objects.filter(is_released=True, is_rep=True).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
             writer_email=F('writer__email')
         )
 
@@ -169,15 +153,7 @@ class CurationSelector:
               Q(story__tag__icontains=search), q.AND)
 
         curations = Curation.objects.distinct().filter(q, is_released=True, writer__is_sdp_admin=True).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
             writer_email=F('writer__email'),
             nickname=F('writer__nickname'),
         )
@@ -195,15 +171,7 @@ class CurationSelector:
               Q(story__tag__icontains=search), q.AND)
 
         curations = Curation.objects.distinct().filter(q, is_released=True, writer__is_verified=True).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
             writer_email=F('writer__email'),
             nickname = F('writer__nickname'),
         )
@@ -217,64 +185,122 @@ class CurationSelector:
     #     return curations
 
 
+# 홈 화면 큐레이션 목록(검색어 없는 대표/관리자/인증유저 큐레이션) 캐시
+# 큐레이션/사진/작성자 정보 변경 시 HomeCurationCacheService에서 invalidate 후 백그라운드에서 다시 채움
+HOME_CURATION_CACHE = VersionedCache('curations:home:', timeout=60 * 60 * 24)
+
+
+class HomeCurationSelector:
+    # 목록 종류별 조회 쿼리셋과 응답 필드 (모든 방문자에게 동일한 데이터)
+    KINDS = {
+        'rep': ('id', 'title', 'rep_pic', 'writer_email', 'is_selected'),
+        'admin': ('id', 'title', 'rep_pic', 'writer_email', 'nickname', 'is_selected'),
+        'verified': ('id', 'title', 'rep_pic', 'writer_email', 'nickname', 'is_selected'),
+    }
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def load(kind: str) -> list[dict]:
+        if kind == 'rep':
+            curations = CurationSelector.rep_curation_list(None)
+        elif kind == 'admin':
+            curations = CurationSelector.admin_curation_list(search='')
+        else:
+            curations = CurationSelector.verified_user_curation_list(search='')
+
+        return list(curations.values(*HomeCurationSelector.KINDS[kind]))
+
+    @staticmethod
+    def list(kind: str) -> list[dict]:
+        # 페이지네이션은 요청마다 캐시된 목록에 대해 수행
+        return HOME_CURATION_CACHE.get(kind, lambda: HomeCurationSelector.load(kind))
+
+
 class CuratedStoryCoordinatorSelector:
     def __init__(self, user: User):
         self.user = user
 
     def detail(self, curation_id: int):
-        story_id_list = Curation.objects.distinct().get(id=curation_id).story.all()
-        curated_stories_qs = CuratedStorySelector.detail(
-            story_id_list=story_id_list, user=self.user)
+        # 사용자와 무관한 스토리 정보는 큐레이션 버전별로 캐시하고, 좋아요/팔로우 여부만 사용자별로 일괄 조회
+        curated_stories = CURATED_STORY_CACHE.get(
+            curation_id, lambda: CuratedStorySelector.load(curation_id=curation_id))
 
-        for story in curated_stories_qs:
-            if story['rep_photos'] != None:
-                story['rep_photos'] = list(story['rep_photos'].split(",")[
-                    :3])  # 업로드 된 사진 중 3개가 대표사진으로 자동 설정
-                temp_photo_list = []
+        story_ids = [story['story_id'] for story in curated_stories]
+        writer_ids = {story['writer'] for story in curated_stories}
+        liked = set()
+        if self.user.is_authenticated and curated_stories:
+            liked = set(Story.story_likeuser_set.through.objects.filter(
+                user_id=self.user.pk, story_id__in=story_ids
+            ).values_list('story_id', flat=True))
+        followed = UserFollowGraphSelector.followed_ids(self.user, writer_ids)
 
-                for photo in story['rep_photos']:
-                    temp_photo_list.append(settings.MEDIA_URL + str(photo))
+        return [{
+            **story,
+            'like_story': 1 if story['story_id'] in liked else 0,
+            'writer_is_followed': story['writer'] in followed,
+        } for story in curated_stories]
 
-                story['rep_photos'] = temp_photo_list
 
-        return curated_stories_qs
+# 큐레이션 수정, 포함된 스토리/스토리 사진 변경 시 curations.signals에서 invalidate
+CURATED_STORY_CACHE = VersionedCache('curations:curated_story:')
 
 
 class CuratedStorySelector:
+    # 스토리별 대표 사진 수
+    REP_PHOTO_COUNT = 3
+
     def __init__(self):
         pass
 
-    def detail(story_id_list: list, user: User):
-        return Story.objects.filter(id__in=story_id_list).values('id', 'story_review', 'preview', 'writer', 'tag', 'created').annotate(
-            story_id=F('id'),
-            place_name=F('place__place_name'),
-            place_address=F('place__address'),
-            place_category=F('place__category'),
-            hashtags=F('tag'),
-            like_story=Case(
-                When(Exists(Story.story_likeuser_set.through.objects.filter(
-                    story_id=OuterRef('pk'),
-                    user_id=user.pk
-                )),
-                    then=Value(1)),
-                default=Value(0),
-            ),
-           rep_pic=Concat(Value(settings.MEDIA_URL),  
-                           F('rep_pic'),
-                           output_field=CharField()),
-            rep_photos=GroupConcat('photos__image'),
-            nickname=F('writer__nickname'),
-            profile_image=Concat(Value(settings.MEDIA_URL),
-                                 F('writer__profile_image'),
-                                 output_field=CharField()),
-            writer_email=F('writer__email'),
-            writer_is_followed = Exists(
-            user.follows.through.objects.filter(
-                from_user_id=user.id,
-                to_user_id=OuterRef('writer_id')
-                )
-            ) if user.is_authenticated else Value(False),
-        ).distinct()
+    @staticmethod
+    def load(curation_id: int) -> list[dict]:
+        if not Curation.objects.filter(id=curation_id).exists():
+            raise Http404
+
+        # 큐레이션에 추가된 순서대로 스토리/장소/작성자를 join해서 한 번에 조회
+        rows = list(Curation_Story.objects.filter(
+            curation_id=curation_id
+        ).select_related(
+            'story', 'story__place', 'story__writer'
+        ).order_by('id'))
+
+        # 스토리별 앞의 REP_PHOTO_COUNT개 사진만 한 번의 쿼리로 조회
+        story_ids = [row.story_id for row in rows]
+        photos = {}
+        for story_id, image in StoryPhoto.objects.filter(story_id__in=story_ids).annotate(
+            rank=subquery_count(StoryPhoto.objects.filter(
+                story_id=OuterRef('story_id'), id__lt=OuterRef('id'))),
+        ).filter(rank__lt=CuratedStorySelector.REP_PHOTO_COUNT).order_by('id').values_list('story_id', 'image'):
+            photos.setdefault(story_id, []).append(settings.MEDIA_URL + str(image))
+
+        curated_stories = []
+        for row in rows:
+            story = row.story
+            place = story.place
+            writer = story.writer
+            curated_stories.append({
+                'id': story.id,
+                'story_id': story.id,
+                'story_review': story.story_review,
+                'preview': story.preview,
+                'short_curation': row.short_curation,
+                'writer': story.writer_id,
+                'tag': story.tag,
+                'hashtags': story.tag,
+                'created': story.created,
+                'place_name': place.place_name if place else None,
+                'place_address': place.address if place else None,
+                'place_category': place.category if place else None,
+                'rep_pic': settings.MEDIA_URL + story.rep_pic.name,
+                'rep_photos': photos.get(story.id),
+                'nickname': writer.nickname if writer else None,
+                'profile_image': settings.MEDIA_URL + writer.profile_image.name if writer else None,
+                'writer_email': writer.email if writer else None,
+            })
+
+        return curated_stories
 
 
 class CurationLikeSelector:
@@ -290,158 +316,200 @@ class CurationLikeSelector:
         
 
 class TotalSearchSelector:
+    # 큐레이션/포레스트/스토리 통합 검색
+    # 모델별로 (created, id) 순서의 상위 page_size + 1개만 조회(top-K)한 뒤 k-way merge로 한 페이지를 만들고,
+    # 페이지에 포함된 객체에 대해서만 좋아요/팔로우/대표사진 등을 annotate해서 조회
+    # 병합 순서는 (created, 모델 순서, id)이며, 마지막 결과의 키를 커서로 전달
+    MODELS = ['Curation', 'Forest', 'Story']
+    MAX_PAGE_SIZE = 50
+    # 모델별 검색 결과 수는 최대 이 개수까지만 계산 (첫 페이지에서만)
+    COUNT_LIMIT = 1000
+
     def __init__(self):
         pass
-    
+
     @staticmethod
-    def list(search: str='', order: str='', user: User=None):
-        
-        order_by_time = {'latest': '-created', 'oldest': 'created'}
+    def search_querysets(search: str) -> dict:
+        # to-many 관계 검색은 distinct join 대신 id__in 서브쿼리로 처리
+        curations = Curation.objects.filter(
+            Q(title__icontains=search) |
+            Q(contents__icontains=search) |
+            Q(id__in=Curation_Story.objects.filter(
+                Q(story__title__icontains=search) |
+                Q(story__place__place_name__icontains=search) |
+                Q(story__place__category__icontains=search) |
+                Q(story__tag__icontains=search)
+            ).values('curation')),
+            is_released=True,
+        )
 
-        if order in order_by_time:
-            order = order_by_time[order]
-        else:
-            order = 'created'
+        forests = Forest.objects.filter(
+            Q(title__icontains=search) |
+            Q(subtitle__icontains=search) |
+            Q(content__icontains=search) |
+            Q(id__in=ForestHashtag.objects.filter(name__icontains=search).values('forest'))
+        )
 
-        #curation에 대한 검색을 하고 결과를 curations에 저장
-        q_curation = Q()
-        
-        q_curation.add(Q(title__icontains=search) |
-                       Q(contents__icontains=search) |
-                       Q(story__title__icontains=search) |
-                       Q(story__place__place_name__icontains=search) |
-                       Q(story__place__category__icontains=search) |
-                       Q(story__tag__icontains=search), q_curation.AND)
-
-        curations = Curation.objects.distinct().filter(q_curation, is_released=True).annotate(
-            user_likes=Case(
-                When(Exists(Curation.likeuser_set.through.objects.filter(
-                    curation_id=OuterRef('pk'),
-                    user_id=user.pk
-                )),
-                    then=Value(1)),
-                default=Value(0),
-            ),
-            like_cnt=Count('likeuser_set'),
-            is_followed = Exists(
-            user.follows.through.objects.filter(
-                from_user_id=user.id,
-                to_user_id=OuterRef('writer_id')
-                )
-            ) if user.is_authenticated else Value(False),
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
-            nickname = F('writer__nickname'),
-        ).order_by(order)
+        stories = Story.objects.filter(
+            Q(title__icontains=search) |
+            Q(place__place_name__icontains=search) |  # 스토리 제목 또는 내용 검색
+            Q(place__category__icontains=search) |
+            Q(tag__icontains=search)
+        )
 
-        #orest에 대한 검색을 하고 결과를 forests에 저장
-        q_forest = Q()
-        q_forest.add(Q(title__icontains=search) |
-              Q(subtitle__icontains=search) |
-              Q(content__icontains=search) |
-              #   Q(category__name__icontains=search) |
-              #   Q(semi_categories__name__icontains=search) |
-              Q(hashtags__name__icontains=search), q_forest.AND)
-        
-        forests = Forest.objects.distinct().annotate(
-            user_likes=Case(
-                When(Exists(Forest.likeuser_set.through.objects.filter(
-                    forest_id=OuterRef('pk'),
-                    user_id=user.pk
-                )),
-                    then=Value(1)),
-                default=Value(0),
-            ),
-            is_followed = Exists(
-            user.follows.through.objects.filter(
-                from_user_id=user.id,
-                to_user_id=OuterRef('writer_id')
-                )
-            ) if user.is_authenticated else Value(False),
-            nickname=F('writer__nickname'),
-        ).filter(q_forest).order_by(order)
-
-        #story에 대한 검색을하고 결과를 stories에 저장
-        q_story=Q()
-        q_story.add(Q(title__icontains=search) |
-              Q(place__place_name__icontains=search) |  # 스토리 제목 또는 내용 검색
-              Q(place__category__icontains=search) |
-              Q(tag__icontains=search), q_story.AND)
-        
-        stories = Story.objects.filter(q_story).annotate(
-            user_likes=Case(
-                When(Exists(Story.story_likeuser_set.through.objects.filter(
-                    story_id=OuterRef('pk'),
-                    user_id=user.pk
-                )),
-                    then=Value(1)),
-                default=Value(0),
-            ),
-            is_followed = Exists(
-            user.follows.through.objects.filter(
-                from_user_id=user.id,
-                to_user_id=OuterRef('writer_id')
-                )
-            ) if user.is_authenticated else Value(False),
-            nickname=F('writer__nickname'),
-        ).distinct().order_by(order)
+        return {'Curation': curations, 'Forest': forests, 'Story': stories}
+
+    @staticmethod
+    def _stream_q(index: int, descending: bool, cursor: dict) -> Q:
+        # (created, 모델 순서, id) > 커서 (내림차순이면 <) 를 만족하는 조건을 해당 모델에 대해 전개
+        created, model, id = cursor['created'], cursor['model'], cursor['id']
+        strict, loose = ('lt', 'lte') if descending else ('gt', 'gte')
+
+        if index == model:
+            return Q(**{'created__' + strict: created}) | \
+                Q(created=created, **{'id__' + strict: id})
+        if (index > model) != descending:
+            return Q(**{'created__' + loose: created})
+        return Q(**{'created__' + strict: created})
 
-        #curations,forests,stories 쿼리셋에서 데이터 추출하고 변환
-        curations_data = [{'id': c.id, 
-                           'model':c.__class__.__name__, 
-                           'title':c.title, 
+    @staticmethod
+    def hydrate(model: str, ids: list[int]) -> dict:
+        # 사용자별 좋아요/팔로우 여부는 list에서 페이지 단위로 한 번에 조회
+        if model == 'Curation':
+            rows = Curation.objects.filter(id__in=ids).annotate(
+                rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
+                nickname=F('writer__nickname'),
+            )
+            return {c.id: {'id': c.id,
+                           'model': model,
+                           'title': c.title,
                            'content': c.contents,
-                           'like_cnt':c.like_cnt,
-                           'writer_is_followed':c.is_followed,
-                           'created':c.created,
-                           'rep_pic':c.rep_pic,
-                           'nickname':c.nickname,
-                           'user_likes': c.user_likes,
-                           } for c in curations]
-        
-        forests_data = [{'id': f.id, 
-                         'model':f.__class__.__name__, 
-                         'title':f.title, 
-                         'content':f.subtitle,
-                         'like_cnt':f.like_cnt,
-                         'writer_is_followed':f.is_followed,
-                         'created':f.created.strftime("%Y-%m-%d %H:%M:%S"),
-                         'rep_pic':f.rep_pic.url,
-                         'nickname':f.nickname,
-                         'user_likes':f.user_likes,
-                         } for f in forests]
-        
-        stories_data = [{'id': s.id, 
-                         'model':s.__class__.__name__,
-                         'title':s.title, 
-                         'content':s.preview,
-                         'like_cnt':s.story_like_cnt,
-                         'writer_is_followed':s.is_followed,
-                         'created':s.created.strftime("%Y-%m-%d %H:%M:%S"),
-                         'rep_pic':s.rep_pic.url,
-                         'nickname':s.nickname,
-                         'user_likes':s.user_likes,
-                         } for s in stories]
-
-        #세개의 데이터를 체인으로 연결
-        result_data = list(chain(curations_data, forests_data, stories_data))
-
-        #모델 유형별 객체 수를 저장
-        curation_count = curations.count()
-        forest_count = forests.count()
-        story_count = stories.count()
+                           'like_cnt': c.like_cnt,
+                           'writer_is_followed': False,
+                           'writer_id': c.writer_id,
+                           'created': c.created,
+                           'rep_pic': c.rep_pic,
+                           'nickname': c.nickname,
+                           'user_likes': 0,
+                           } for c in rows}
+
+        if model == 'Forest':
+            rows = Forest.objects.filter(id__in=ids).annotate(
+                nickname=F('writer__nickname'),
+            )
+            return {f.id: {'id': f.id,
+                           'model': model,
+                           'title': f.title,
+                           'content': f.subtitle,
+                           'like_cnt': f.like_cnt,
+                           'writer_is_followed': False,
+                           'writer_id': f.writer_id,
+                           'created': f.created.strftime("%Y-%m-%d %H:%M:%S"),
+                           'rep_pic': f.rep_pic.url,
+                           'nickname': f.nickname,
+                           'user_likes': 0,
+                           } for f in rows}
+
+        rows = Story.objects.filter(id__in=ids).annotate(
+            nickname=F('writer__nickname'),
+        )
+        return {s.id: {'id': s.id,
+                       'model': model,
+                       'title': s.title,
+                       'content': s.preview,
+                       'like_cnt': s.story_like_cnt,
+                       'writer_is_followed': False,
+                       'writer_id': s.writer_id,
+                       'created': s.created.strftime("%Y-%m-%d %H:%M:%S"),
+                       'rep_pic': s.rep_pic.url,
+                       'nickname': s.nickname,
+                       'user_likes': 0,
+                       } for s in rows}
+
+    @staticmethod
+    def apply_user_flags(rows: list[dict], user: User):
+        # 페이지 전체의 좋아요 여부(세 모델 UNION)와 작성자 팔로우 여부를 각각 한 번의 쿼리로 조회
+        liked = set()
+        followed = set()
+
+        if user is not None and user.is_authenticated and rows:
+            ids = {model: [row['id'] for row in rows if row['model'] == model]
+                   for model in TotalSearchSelector.MODELS}
+            liked = set(
+                Curation.likeuser_set.through.objects.filter(
+                    user_id=user.pk, curation_id__in=ids['Curation']
+                ).annotate(model=Value('Curation')).values_list('model', 'curation_id').union(
+                    Forest.likeuser_set.through.objects.filter(
+                        user_id=user.pk, forest_id__in=ids['Forest']
+                    ).annotate(model=Value('Forest')).values_list('model', 'forest_id'),
+                    Story.story_likeuser_set.through.objects.filter(
+                        user_id=user.pk, story_id__in=ids['Story']
+                    ).annotate(model=Value('Story')).values_list('model', 'story_id'),
+                    all=True,
+                ))
+            followed = UserFollowGraphSelector.followed_ids(
+                user, {row['writer_id'] for row in rows})
+
+        for row in rows:
+            row['user_likes'] = 1 if (row['model'], row['id']) in liked else 0
+            row['writer_is_followed'] = row.pop('writer_id') in followed
+
+    @staticmethod
+    def list(search: str = '', order: str = '', user: User = None, cursor: str = None, page_size: int = 20):
+        # latest: 최신순, 그 외(oldest, 기본값): 오래된순
+        descending = order == 'latest'
+        ordering = ['-created', '-id'] if descending else ['created', 'id']
+        page_size = max(1, min(page_size, TotalSearchSelector.MAX_PAGE_SIZE))
+
+        decoded = decode_cursor(cursor) if cursor else None
+        if decoded is not None and not ({'created', 'model', 'id'} <= decoded.keys()
+                                        and isinstance(decoded['model'], int)
+                                        and isinstance(decoded['id'], int)):
+            raise ApplicationError('유효하지 않은 커서입니다.')
+
+        querysets = TotalSearchSelector.search_querysets(search=search)
+
+        # 모델별 상위 page_size + 1개 (created, 모델 순서, id) 스트림
+        streams = []
+        for index, model in enumerate(TotalSearchSelector.MODELS):
+            queryset = querysets[model]
+            if decoded is not None:
+                queryset = queryset.filter(
+                    TotalSearchSelector._stream_q(index, descending, decoded))
+            streams.append([
+                (created, index, id) for created, id in
+                queryset.order_by(*ordering).values_list('created', 'id')[:page_size + 1]
+            ])
+
+        keys = list(islice(heapq.merge(*streams, reverse=descending), page_size + 1))
+
+        next_cursor = None
+        if len(keys) > page_size:
+            keys = keys[:page_size]
+            created, index, id = keys[-1]
+            next_cursor = encode_cursor({'created': created, 'model': index, 'id': id})
+
+        # 페이지에 포함된 객체만 모델별 한 번의 쿼리로 조회
+        rows = {}
+        for index, model in enumerate(TotalSearchSelector.MODELS):
+            ids = [id for _, key_index, id in keys if key_index == index]
+            if ids:
+                rows[index] = TotalSearchSelector.hydrate(model=model, ids=ids)
+
+        result_data = [rows[index][id] for _, index, id in keys if id in rows[index]]
+        TotalSearchSelector.apply_user_flags(rows=result_data, user=user)
+
+        # 모델 유형별 객체 수는 첫 페이지에서만 COUNT_LIMIT개까지 계산
+        counts = {model: None for model in TotalSearchSelector.MODELS}
+        if decoded is None:
+            counts = {model: approximate_count(queryset, limit=TotalSearchSelector.COUNT_LIMIT)
+                      for model, queryset in querysets.items()}
 
         result = {
-            'curation_count': curation_count,
-            'forest_count':forest_count,
-            'story_count': story_count,
+            'curation_count': counts['Curation'],
+            'forest_count': counts['Forest'],
+            'story_count': counts['Story'],
             'result_data': result_data,
+            'next': next_cursor,
         }
-        return result
\ No newline at end of file
+        return result
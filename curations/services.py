@@ -1,18 +1,24 @@
 import io
+import json
+import hashlib
 import time
 import uuid
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import F
 from django.core.files.images import ImageFile
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
 from users.models import User
 from stories.models import Story
 from places.models import PlacePhoto
-from curations.models import Curation, Curation_Story, CurationPhoto, CurationMap
-from curations.selectors import CurationLikeSelector
+from curations.models import Curation, Curation_Story, CurationPhoto, CurationMap, CURATION_MAP_PLACEHOLDER, get_upload_path
+from curations.selectors import CurationLikeSelector, HomeCurationSelector, HOME_CURATION_CACHE, CURATED_STORY_CACHE
 from core.map_image import Marker, get_static_naver_image
+from core.tasks import enqueue, enqueue_on_commit
+from mypage.services import UserProfileSummaryCacheService
 
 
 class CurationCoordinatorService:
@@ -43,7 +49,8 @@ class CurationCoordinatorService:
         photo_service = CurationPhotoService()
         photo_service.create(curation=curation, image_file=rep_pic)
 
-        CurationMapService.create(curation=curation, stories=stories_qs)
+        # 지도 이미지는 커밋 이후 백그라운드에서 생성 (그 전까지는 placeholder)
+        CurationMapService.request_render(curation=curation)
 
         return curation
 
@@ -75,8 +82,8 @@ class CurationCoordinatorService:
             photo_service.update(
                 curation=curation, photo_image_url=photo_image_url, image_file=rep_pic)
 
-        CurationMapService.delete(curation=curation)
-        CurationMapService.create(curation=curation, stories=stories_qs)
+        # 스토리(장소) 구성이 바뀐 경우에만 지도 이미지 재생성
+        CurationMapService.request_render(curation=curation)
 
         return curation
 
@@ -215,12 +222,27 @@ class CurationLikeService:
         pass
 
     @staticmethod
+    @transaction.atomic
     def like(curation: Curation, user: User):
-        curation.likeuser_set.add(user)
+        _, created = Curation.likeuser_set.through.objects.get_or_create(
+            curation_id=curation.id, user_id=user.id)
+
+        # 실제로 좋아요가 추가된 경우에만 DB에서 like_cnt 1 증가
+        # through 테이블에 직접 저장하여 m2m_changed signal이 없으므로 마이페이지 요약 캐시를 직접 invalidate
+        if created:
+            Curation.objects.filter(id=curation.id).update(like_cnt=F('like_cnt') + 1)
+            UserProfileSummaryCacheService.invalidate(user_ids=[user.id])
 
     @staticmethod
+    @transaction.atomic
     def dislike(curation: Curation, user: User):
-        curation.likeuser_set.remove(user)
+        deleted, _ = Curation.likeuser_set.through.objects.filter(
+            curation_id=curation.id, user_id=user.id).delete()
+
+        # 실제로 좋아요가 삭제된 경우에만 DB에서 like_cnt 1 감소
+        if deleted:
+            Curation.objects.filter(id=curation.id, like_cnt__gt=0).update(like_cnt=F('like_cnt') - 1)
+            UserProfileSummaryCacheService.invalidate(user_ids=[user.id])
 
     @staticmethod
     def like_or_dislike(curation: Curation, user: User):
@@ -238,31 +260,128 @@ class CurationMapService:
         pass
 
     @staticmethod
-    def create(curation: Curation, stories: list[Story]):
-        places = list(map(lambda x: x.place, stories))
-
-        # 사진 생성하기
-        markers = []
-        for place in places:
-            markers.append(Marker(
-                longitude=place.longitude,
-                latitude=place.latitude,
-                label=place.place_name,
-            ))
+    def marker_values(curation: Curation) -> list[tuple]:
+        # 큐레이션에 포함된 스토리의 장소를 한 번의 쿼리로 조회, 순서와 무관하게 같은 집합이면 같은 결과
+        return sorted(Curation_Story.objects.filter(
+            curation=curation,
+            story__place__isnull=False,
+        ).values_list(
+            'story__place__longitude',
+            'story__place__latitude',
+            'story__place__place_name',
+        ).distinct())
 
-        file_path = '{}-{}.{}'.format(curation.id,
+    @staticmethod
+    def marker_hash(marker_values: list[tuple]) -> str:
+        return hashlib.sha256(json.dumps(marker_values, ensure_ascii=False).encode()).hexdigest()
+
+    @staticmethod
+    def request_render(curation: Curation) -> CurationMap:
+        marker_hash = CurationMapService.marker_hash(
+            CurationMapService.marker_values(curation=curation))
+
+        curation_map = CurationMap.objects.filter(curation=curation).first()
+        if curation_map is not None and curation_map.marker_hash == marker_hash:
+            return curation_map
+
+        old_map = None
+        if curation_map is None:
+            curation_map = CurationMap(curation=curation)
+        else:
+            old_map = curation_map.map.name
+
+        # 새 지도 이미지가 준비될 때까지 placeholder 이미지 제공
+        # marker_hash는 render가 성공했을 때만 저장하므로, 생성에 실패하면 다음 요청에서 다시 생성
+        curation_map.map = CURATION_MAP_PLACEHOLDER
+        curation_map.marker_hash = ''
+        curation_map.save()
+
+        enqueue_on_commit(CurationMapService.render,
+                          curation_map_id=curation_map.id,
+                          marker_hash=marker_hash,
+                          old_map=old_map)
+
+        return curation_map
+
+    @staticmethod
+    def render(curation_map_id: int, marker_hash: str, old_map: str = None):
+        # 커밋 이후 백그라운드에서 실행: 지도 이미지 다운로드 및 S3 업로드
+        curation_map = CurationMap.objects.filter(
+            id=curation_map_id).select_related('curation').first()
+        storage = CurationMap._meta.get_field('map').storage
+
+        if old_map and old_map != CURATION_MAP_PLACEHOLDER:
+            storage.delete(old_map)
+
+        if curation_map is None:
+            return
+
+        # 이후 요청으로 마커 구성이 다시 바뀐 경우, 해당 요청의 작업에서 생성
+        marker_values = CurationMapService.marker_values(curation=curation_map.curation)
+        if CurationMapService.marker_hash(marker_values) != marker_hash:
+            return
+
+        markers = [Marker(longitude=longitude, latitude=latitude, label=place_name)
+                   for longitude, latitude, place_name in marker_values]
+        if not markers:
+            CurationMap.objects.filter(id=curation_map_id).update(marker_hash=marker_hash)
+            return
+
+        file_path = '{}-{}.{}'.format(curation_map.curation_id,
                                       str(time.time())+str(uuid.uuid4().hex), 'jpeg')
         map_image = ImageFile(io.BytesIO(
             get_static_naver_image(markers)), name=file_path)
+        name = storage.save(get_upload_path(curation_map, file_path), map_image)
 
-        curation_map = CurationMap(
-            curation=curation,
-            map=map_image
-        )
+        # 생성하는 동안 마커 구성이 바뀌었거나 삭제된 경우 업로드한 이미지 폐기
+        # 지도 이미지와 marker_hash를 함께 저장하여, 이미지가 저장된 경우에만 같은 마커 구성의 재생성을 생략
+        updated = 0
+        if CurationMapService.marker_hash(
+                CurationMapService.marker_values(curation=curation_map.curation)) == marker_hash:
+            updated = CurationMap.objects.filter(
+                id=curation_map_id, map=CURATION_MAP_PLACEHOLDER).update(map=name, marker_hash=marker_hash)
+        if not updated:
+            storage.delete(name)
 
-        curation_map.save()
+
+class HomeCurationCacheService:
+    # 다시 채우기 작업이 예약되어 있는 동안 유지되는 key (같은 시점의 여러 invalidate를 한 번의 warm으로 합침)
+    WARM_PENDING_KEY = 'curations:home:warm_pending'
+    WARM_PENDING_TIMEOUT = 60
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def invalidate():
+        # 커밋 이후 홈 화면 큐레이션 캐시 버전을 갱신하고, 첫 요청이 DB를 조회하지 않도록 백그라운드에서 다시 채움
+        def invalidate_all():
+            for kind in HomeCurationSelector.KINDS:
+                HOME_CURATION_CACHE.invalidate(kind)
+            # 이미 예약된 warm이 실행 전이면 새로 예약하지 않음 (예약된 warm이 갱신된 버전으로 채움)
+            if cache.add(HomeCurationCacheService.WARM_PENDING_KEY, 1, HomeCurationCacheService.WARM_PENDING_TIMEOUT):
+                enqueue(HomeCurationCacheService.warm)
+
+        transaction.on_commit(invalidate_all)
+
+    @staticmethod
+    def warm():
+        # 조회 전에 예약 표시를 지워서, 조회 중에 생긴 invalidate는 새 warm을 예약하도록 함
+        cache.delete(HomeCurationCacheService.WARM_PENDING_KEY)
+        for kind in HomeCurationSelector.KINDS:
+            HomeCurationSelector.list(kind)
+
+
+class CuratedStoryCacheService:
+    def __init__(self):
+        pass
 
     @staticmethod
-    def delete(curation: Curation):
-        map = CurationMap.objects.get(curation=curation)
-        map.delete()
+    def invalidate(curation_ids: list[int]):
+        # 커밋 이후 해당 큐레이션들의 스토리 목록 캐시 버전 갱신
+        def invalidate_all():
+            for curation_id in curation_ids:
+                CURATED_STORY_CACHE.invalidate(curation_id)
+
+        if curation_ids:
+            transaction.on_commit(invalidate_all)
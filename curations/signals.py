@@ -0,0 +1,98 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users.models import User
+from places.models import Place
+from stories.models import Story, StoryPhoto
+from curations.models import Curation, CurationPhoto, Curation_Story
+from curations.services import HomeCurationCacheService, CuratedStoryCacheService
+
+
+# 홈 화면 목록에 포함되거나 목록 선정에 사용되는 큐레이션 필드
+HOME_CURATION_FIELDS = {'title', 'writer', 'writer_id', 'is_released', 'is_selected', 'is_rep'}
+
+
+# 홈 화면 큐레이션 목록에 영향을 주는 변경 (관리자 페이지에서의 변경 포함)
+@receiver(post_save, sender=Curation)
+def invalidate_home_curations_of_curation(sender, instance, update_fields=None, **kwargs):
+    # like_cnt 등 목록과 관련 없는 필드만 저장된 경우 무시
+    if update_fields is not None and not HOME_CURATION_FIELDS & set(update_fields):
+        return
+    HomeCurationCacheService.invalidate()
+
+
+@receiver(post_delete, sender=Curation)
+@receiver(post_save, sender=CurationPhoto)
+@receiver(post_delete, sender=CurationPhoto)
+@receiver(post_save, sender=Curation_Story)
+@receiver(post_delete, sender=Curation_Story)
+def invalidate_home_curations(sender, instance, **kwargs):
+    HomeCurationCacheService.invalidate()
+
+
+# 홈 화면 목록에 포함되는 작성자 정보
+HOME_CURATION_WRITER_FIELDS = {'email', 'nickname', 'is_verified', 'is_sdp_admin'}
+
+
+@receiver(post_save, sender=User)
+def invalidate_home_curations_of_writer(sender, instance, created, update_fields=None, **kwargs):
+    # 새로 가입했거나 작성자 정보가 바뀌지 않은 경우(last_login 갱신 등) 큐레이션 조회 없이 무시
+    fields = HOME_CURATION_WRITER_FIELDS if update_fields is None else HOME_CURATION_WRITER_FIELDS & set(update_fields)
+    if created or not instance.changed_fields(fields):
+        return
+
+    if Curation.objects.filter(writer=instance).exists():
+        HomeCurationCacheService.invalidate()
+
+
+# 큐레이션 스토리 목록에 영향을 주는 변경
+@receiver(post_save, sender=Curation)
+@receiver(post_delete, sender=Curation)
+def invalidate_curated_stories_of_curation(sender, instance, **kwargs):
+    CuratedStoryCacheService.invalidate(curation_ids=[instance.id])
+
+
+@receiver(post_save, sender=Curation_Story)
+@receiver(post_delete, sender=Curation_Story)
+def invalidate_curated_stories_of_short_curation(sender, instance, **kwargs):
+    CuratedStoryCacheService.invalidate(curation_ids=[instance.curation_id])
+
+
+# 큐레이션 스토리 목록에 포함되는 스토리 필드
+CURATED_STORY_FIELDS = {'story_review', 'preview', 'tag', 'rep_pic', 'place', 'place_id', 'writer', 'writer_id'}
+
+
+@receiver(post_save, sender=Story)
+@receiver(post_save, sender=StoryPhoto)
+@receiver(post_delete, sender=StoryPhoto)
+def invalidate_curated_stories_of_story(sender, instance, update_fields=None, **kwargs):
+    # 좋아요 수 등 목록과 관련 없는 스토리 필드만 저장된 경우 무시
+    if sender is Story and update_fields is not None and not CURATED_STORY_FIELDS & set(update_fields):
+        return
+    story_id = instance.id if sender is Story else instance.story_id
+    CuratedStoryCacheService.invalidate(curation_ids=list(
+        Curation_Story.objects.filter(story_id=story_id).values_list('curation_id', flat=True)))
+
+
+# 큐레이션 스토리 목록에 포함되는 작성자/장소 필드
+CURATED_STORY_WRITER_FIELDS = {'email', 'nickname', 'profile_image'}
+CURATED_STORY_PLACE_FIELDS = {'place_name', 'address', 'category'}
+
+
+@receiver(post_save, sender=User)
+def invalidate_curated_stories_of_writer(sender, instance, created, update_fields=None, **kwargs):
+    # 새로 가입했거나 작성자 정보가 바뀌지 않은 경우(last_login 갱신 등) 큐레이션 조회 없이 무시
+    fields = CURATED_STORY_WRITER_FIELDS if update_fields is None else CURATED_STORY_WRITER_FIELDS & set(update_fields)
+    if created or not instance.changed_fields(fields):
+        return
+    CuratedStoryCacheService.invalidate(curation_ids=list(
+        Curation_Story.objects.filter(story__writer=instance).values_list('curation_id', flat=True).distinct()))
+
+
+@receiver(post_save, sender=Place)
+def invalidate_curated_stories_of_place(sender, instance, created, update_fields=None, **kwargs):
+    # 좋아요 수 등 목록과 관련 없는 장소 필드만 저장된 경우 무시
+    if created or update_fields is not None and not CURATED_STORY_PLACE_FIELDS & set(update_fields):
+        return
+    CuratedStoryCacheService.invalidate(curation_ids=list(
+        Curation_Story.objects.filter(story__place=instance).values_list('curation_id', flat=True).distinct()))
@@ -0,0 +1,250 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from core.exceptions import ApplicationError
+from users.models import User
+from places.models import Place
+from forest.models import Forest, Category
+from stories.models import Story, StoryPhoto
+from stories.services import StoryService
+from curations.models import Curation, Curation_Story, CurationPhoto, CurationMap, CURATION_MAP_PLACEHOLDER
+from curations.selectors import HomeCurationSelector, CuratedStorySelector, CuratedStoryCoordinatorSelector, TotalSearchSelector
+from curations.services import CurationMapService, HomeCurationCacheService
+
+
+def create_place(name: str) -> Place:
+    return Place.objects.create(
+        place_name=name, category='식당 및 카페', mon_hours='', tues_hours='', wed_hours='', thurs_hours='',
+        fri_hours='', sat_hours='', sun_hours='', place_review='', address='', rep_pic='place.png',
+        latitude=37.5, longitude=126.9)
+
+
+@override_settings(BACKGROUND_TASK_EAGER=True)
+class CurationMapServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        story = Story.objects.create(
+            title='story', story_review='test', tag='test', html_content='test',
+            place=create_place('place'), writer=self.user)
+        self.curation = Curation.objects.create(title='curation', contents='contents', writer=self.user)
+        Curation_Story.objects.create(curation=self.curation, story=story, short_curation='short')
+
+        storage = CurationMap._meta.get_field('map').storage
+        self.save = patch.object(storage, 'save', return_value='curations/map.jpeg').start()
+        patch.object(storage, 'delete').start()
+        self.addCleanup(patch.stopall)
+
+    def request_render(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            CurationMapService.request_render(curation=self.curation)
+        return CurationMap.objects.get(curation=self.curation)
+
+    @patch('curations.services.get_static_naver_image', return_value=b'map')
+    def test_saves_marker_hash_with_rendered_map(self, get_static_naver_image):
+        curation_map = self.request_render()
+        self.assertEqual(curation_map.map.name, 'curations/map.jpeg')
+        self.assertNotEqual(curation_map.marker_hash, '')
+
+        # 같은 마커 구성이면 다시 생성하지 않음
+        self.request_render()
+        self.assertEqual(get_static_naver_image.call_count, 1)
+
+    def test_failed_render_is_retried_on_next_request(self):
+        with patch('curations.services.get_static_naver_image', side_effect=ApplicationError('timeout')), \
+                self.assertLogs('django', level='ERROR'):
+            curation_map = self.request_render()
+        self.assertEqual((curation_map.map.name, curation_map.marker_hash), (CURATION_MAP_PLACEHOLDER, ''))
+        self.save.assert_not_called()
+
+        with patch('curations.services.get_static_naver_image', return_value=b'map'):
+            curation_map = self.request_render()
+        self.assertEqual(curation_map.map.name, 'curations/map.jpeg')
+
+
+@override_settings(BACKGROUND_TASK_EAGER=True)
+class HomeCurationCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.writer = User.objects.create_user(
+                email='writer@test.test', password='test', nickname='writer', is_sdp_admin=True)
+            self.curation = Curation.objects.create(
+                title='curation', contents='contents', writer=self.writer, is_released=True, is_rep=True)
+        self.stories = [Story.objects.create(
+            title=str(i), story_review='test', tag='test', html_content='test', writer=self.writer)
+            for i in range(3)]
+
+    def test_coalesces_warms_of_invalidations_in_transaction(self):
+        with patch.object(HomeCurationCacheService, 'warm') as warm, \
+                self.captureOnCommitCallbacks(execute=True):
+            curation = Curation.objects.create(
+                title='new', contents='contents', writer=self.writer, is_released=True)
+            for story in self.stories:
+                Curation_Story.objects.create(curation=curation, story=story, short_curation='short')
+            CurationPhoto.objects.create(curation=curation, image='curations/new.jpg')
+
+        warm.assert_called_once()
+
+    def test_cached_list_is_kept_until_listed_fields_change(self):
+        self.assertEqual([c['id'] for c in HomeCurationSelector.list('rep')], [self.curation.id])
+
+        # 좋아요 수, 작성자의 last_login 등 목록과 관련 없는 변경은 캐시를 유지
+        with self.captureOnCommitCallbacks(execute=True):
+            self.curation.like_cnt = 1
+            self.curation.save(update_fields=['like_cnt'])
+        writer = User.objects.get(pk=self.writer.pk)
+        with self.assertNumQueries(1):
+            writer.save()
+        with self.assertNumQueries(0):
+            HomeCurationSelector.list('rep')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            writer.email = 'changed@test.test'
+            writer.save()
+        self.assertEqual(HomeCurationSelector.list('rep')[0]['writer_email'], 'changed@test.test')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.curation.is_rep = False
+            self.curation.save(update_fields=['is_rep'])
+        self.assertEqual(HomeCurationSelector.list('rep'), [])
+
+
+class CuratedStorySelectorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        self.stories = [Story.objects.create(
+            title=str(i), story_review=str(i), tag='test', html_content='test', writer=self.user)
+            for i in range(3)]
+        self.curation = Curation.objects.create(title='curation', contents='contents', writer=self.user)
+        # 큐레이션에 추가된 순서: 2, 0, 1
+        for i in (2, 0, 1):
+            Curation_Story.objects.create(
+                curation=self.curation, story=self.stories[i], short_curation='short {}'.format(i))
+        for i in range(5):
+            StoryPhoto.objects.create(story=self.stories[2], caption='', image='stories/{}.jpg'.format(i))
+
+    def test_load_keeps_curation_order_and_first_photos(self):
+        stories = CuratedStorySelector.load(curation_id=self.curation.id)
+
+        self.assertEqual([story['story_id'] for story in stories],
+                         [self.stories[i].id for i in (2, 0, 1)])
+        self.assertEqual([story['short_curation'] for story in stories],
+                         ['short 2', 'short 0', 'short 1'])
+        self.assertEqual(stories[0]['rep_photos'],
+                         [settings.MEDIA_URL + 'stories/{}.jpg'.format(i) for i in range(3)])
+        self.assertIsNone(stories[1]['rep_photos'])
+
+    def test_cache_is_invalidated_by_story_edit_but_not_by_like(self):
+        selector = CuratedStoryCoordinatorSelector(self.user)
+        selector.detail(curation_id=self.curation.id)
+
+        with patch.object(CuratedStorySelector, 'load', wraps=CuratedStorySelector.load) as load:
+            with self.captureOnCommitCallbacks(execute=True):
+                StoryService.like(story=self.stories[0], user=self.user)
+            stories = selector.detail(curation_id=self.curation.id)
+            load.assert_not_called()
+            self.assertEqual(stories[1]['like_story'], 1)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.stories[0].story_review = 'changed'
+                self.stories[0].save()
+            stories = selector.detail(curation_id=self.curation.id)
+            load.assert_called_once()
+            self.assertEqual(stories[1]['story_review'], 'changed')
+
+    def test_cache_is_invalidated_by_writer_and_place_change(self):
+        place = create_place('place')
+        self.stories[0].place = place
+        self.stories[0].save()
+        selector = CuratedStoryCoordinatorSelector(self.user)
+        selector.detail(curation_id=self.curation.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.nickname = 'changed'
+            self.user.save()
+        stories = selector.detail(curation_id=self.curation.id)
+        self.assertEqual({story['nickname'] for story in stories}, {'changed'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            place.place_name = 'renamed'
+            place.save()
+        stories = selector.detail(curation_id=self.curation.id)
+        self.assertEqual(stories[1]['place_name'], 'renamed')
+
+        # 장소 좋아요 수만 저장된 경우 캐시 유지
+        with patch.object(CuratedStorySelector, 'load', wraps=CuratedStorySelector.load) as load:
+            with self.captureOnCommitCallbacks(execute=True):
+                place.place_like_cnt += 1
+                place.save(update_fields=['place_like_cnt', 'updated'])
+            selector.detail(curation_id=self.curation.id)
+            load.assert_not_called()
+
+
+class TotalSearchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        category = Category.objects.create(name='category')
+        objects = []
+        for i in range(4):
+            objects.append(Curation.objects.create(
+                title='검색 {}'.format(i), contents='contents', writer=self.user, is_released=True))
+            objects.append(Forest.objects.create(
+                title='검색 {}'.format(i), content='content', category=category, writer=self.user))
+            objects.append(Story.objects.create(
+                title='검색 {}'.format(i), story_review='test', tag='test', html_content='test', writer=self.user))
+
+        # 모델 사이에 created가 같은 객체가 섞이도록 두 개의 시각만 사용
+        now = timezone.now()
+        self.keys = []
+        for i, obj in enumerate(objects):
+            created = now + timedelta(seconds=i % 2)
+            type(obj).objects.filter(pk=obj.pk).update(created=created)
+            self.keys.append((created, TotalSearchSelector.MODELS.index(type(obj).__name__), obj.id))
+
+        self.client = APIClient(HTTP_HOST='localhost')
+
+    def pages(self, order: str):
+        pages = []
+        cursor = None
+        while True:
+            params = {'search': '검색', 'order': order, 'page_size': 5}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get('/curations/total_search/', params)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            cursor = response.data['next']
+            if cursor is None:
+                return pages
+
+    def test_pages_through_mixed_models_without_gaps_or_duplicates(self):
+        for order, descending in (('oldest', False), ('latest', True)):
+            with self.subTest(order):
+                pages = self.pages(order)
+
+                results = [(row['model'], row['id']) for page in pages for row in page['data']]
+                expected = [(TotalSearchSelector.MODELS[index], id)
+                            for _, index, id in sorted(self.keys, reverse=descending)]
+                self.assertEqual(results, expected)
+                self.assertEqual(len(pages), 3)
+
+                # 모델별 개수는 첫 페이지에서만 계산
+                self.assertEqual([pages[0][key] for key in ('curation_count', 'forest_count', 'story_count')],
+                                 [4, 4, 4])
+                self.assertEqual({page['curation_count'] for page in pages[1:]}, {None})
+
+    def test_invalid_cursor_is_bad_request(self):
+        for cursor in ('invalid', 'eyJpZCI6MX0'):
+            response = self.client.get('/curations/total_search/', {'search': '검색', 'cursor': cursor})
+            self.assertEqual(response.status_code, 400)
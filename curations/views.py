@@ -9,26 +9,11 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
-from .selectors import CurationSelector, CuratedStoryCoordinatorSelector, TotalSearchSelector
+from .selectors import CurationSelector, HomeCurationSelector, CuratedStoryCoordinatorSelector, TotalSearchSelector
 from .services import CurationCoordinatorService, CurationLikeService
 from .permissions import IsWriter, IsVerifiedOrSdpAdmin
 from curations.models import Curation
-
-
-def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
-    paginator = pagination_class()
-
-    page = paginator.paginate_queryset(queryset, request, view=view)
-
-    if page is not None:
-        serializer = serializer_class(page, many=True)
-    else:
-        serializer = serializer_class(queryset, many=True)
-
-    return Response({
-        'status': 'success',
-        'data': paginator.get_paginated_response(serializer.data).data,
-    }, status=status.HTTP_200_OK)
+from core.views import get_paginated_response
 
 
 class CurationListApi(APIView):
@@ -138,7 +123,7 @@ class RepCurationListApi(APIView):
         },
     )
     def get(self, request):
-        curations = CurationSelector.rep_curation_list(self)
+        curations = HomeCurationSelector.list('rep')
 
         return get_paginated_response(
             pagination_class=self.Pagination,
@@ -199,9 +184,13 @@ class AdminCurationListApi(APIView):
         filters_serializer.is_valid(raise_exception=True)
         filters = filters_serializer.validated_data
 
-        curations = CurationSelector.admin_curation_list(
-            search=filters.get('search', '')
-        )
+        # 검색어가 없는 홈 화면 목록은 캐시된 목록 사용
+        if filters.get('search'):
+            curations = CurationSelector.admin_curation_list(
+                search=filters.get('search')
+            )
+        else:
+            curations = HomeCurationSelector.list('admin')
 
         return get_paginated_response(
             pagination_class=self.Pagination,
@@ -262,9 +251,13 @@ class VerifiedUserCurationListApi(APIView):
         filters_serializer.is_valid(raise_exception=True)
         filters = filters_serializer.validated_data
 
-        curations = CurationSelector.verified_user_curation_list(
-            search=filters.get('search', '')
-        )
+        # 검색어가 없는 홈 화면 목록은 캐시된 목록 사용
+        if filters.get('search'):
+            curations = CurationSelector.verified_user_curation_list(
+                search=filters.get('search')
+            )
+        else:
+            curations = HomeCurationSelector.list('verified')
 
         return get_paginated_response(
             pagination_class=self.Pagination,
@@ -347,7 +340,7 @@ class CuratedStoryDetailApi(APIView):
         place_category = serializers.CharField()
         story_review = serializers.CharField()
         preview = serializers.CharField()
-        # short_curation = serializers.CharField()
+        short_curation = serializers.CharField()
         like_story = serializers.BooleanField()
         hashtags = serializers.CharField()
         rep_photos = serializers.ListField(required=False)
@@ -375,6 +368,7 @@ class CuratedStoryDetailApi(APIView):
                         'place_category': '식당 및 카페',
                         'place_review': '버섯에서 발견한 도시의 지속가능성',
                         'preview': '성수동에서 찾은 지속가능성의 의미',
+                        'short_curation': '버섯 농장을 함께 운영하는 비건 식당',
                         'like_story': True,
                         'hashtags': '#버섯농장 #로컬마켓 #성수동 #비건',
                         'rep_photos':  "['https://abc.com/1.jpg', 'https://abc.com/2.jpg', 'https://abc.com/3.jpg']",
@@ -647,6 +641,8 @@ class TotalSearchApi(APIView):
     class TotalSearchFilterSerializer(serializers.Serializer):
         search = serializers.CharField(required=False)
         order = serializers.CharField(required=False)
+        cursor = serializers.CharField(required=False)
+        page_size = serializers.IntegerField(required=False, min_value=1)
 
     class TotalSearchOutputSerializer(serializers.Serializer):
         id = serializers.IntegerField()
@@ -669,6 +665,8 @@ class TotalSearchApi(APIView):
             통합 검색 결과를 리스트합니다.(각 모델마다 객체의 수 또한 리턴합니다.)</br>
             search(검색어)의 default값은 ''로, 검색어가 없을 시 아무것도 반환되지 않습니다.
             order(정렬)은 latest 또는 oldest로 최신순 정렬 여루블 결정합니다.
+            page_size(기본값 20, 최대 50)개씩 반환하며, 다음 페이지는 응답의 next 값을 cursor로 전달해 조회합니다.</br>
+            모델별 객체 수는 첫 페이지(cursor 없음)에서만 최대 1000개까지 계산하며, 이후 페이지에서는 null입니다.</br>
             반환되는 정보는</br>
             1. id </br>
             2. model(ex. Curation, Forest, Story) </br>
@@ -717,7 +715,9 @@ class TotalSearchApi(APIView):
         results = TotalSearchSelector.list(
             search=filters.get('search', ''),
             order = filters.get('order', ''),
-            user=request.user
+            user=request.user,
+            cursor=filters.get('cursor'),
+            page_size=filters.get('page_size', 20),
         )
 
         return Response({
@@ -725,5 +725,6 @@ class TotalSearchApi(APIView):
             'curation_count':results['curation_count'],
             'forest_count':results['forest_count'],
             'story_count':results['story_count'],
+            'next': results['next'],
             'data': results['result_data'],
         }, status= status.HTTP_200_OK)
\ No newline at end of file
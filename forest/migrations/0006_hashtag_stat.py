@@ -0,0 +1,37 @@
+# Generated by Django 4.0 on 2026-10-19 14:23
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_forest_hashtag_stats(apps, schema_editor):
+    # 기존 해시태그로 해시태그 통계 생성
+    ForestHashtag = apps.get_model('forest', 'ForestHashtag')
+    ForestHashtagStat = apps.get_model('forest', 'ForestHashtagStat')
+
+    stats = ForestHashtag.objects.values('name').annotate(
+        forest_count=Count('forest', distinct=True)).order_by()
+    ForestHashtagStat.objects.bulk_create([
+        ForestHashtagStat(name=stat['name'], forest_count=stat['forest_count'])
+        for stat in stats
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forest', '0005_forest_rep_pic'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ForestHashtagStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=10, unique=True)),
+                ('forest_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(build_forest_hashtag_stats,
+                             migrations.RunPython.noop),
+    ]
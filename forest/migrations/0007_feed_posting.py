@@ -0,0 +1,52 @@
+# Generated by Django 4.0 on 2026-10-19 14:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_forest_feed_postings(apps, schema_editor):
+    # 기존 포레스트-세미 카테고리 관계로 posting list 생성
+    SemiCategory = apps.get_model('forest', 'SemiCategory')
+    ForestFeedPosting = apps.get_model('forest', 'ForestFeedPosting')
+
+    relations = SemiCategory.forest.through.objects.values_list(
+        'semicategory_id', 'forest_id', 'forest__created', 'forest__like_cnt')
+    ForestFeedPosting.objects.bulk_create([
+        ForestFeedPosting(semi_category_id=semi_category_id, forest_id=forest_id,
+                          created=created, like_cnt=like_cnt)
+        for semi_category_id, forest_id, created, like_cnt in relations.iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forest', '0006_hashtag_stat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ForestFeedPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField()),
+                ('like_cnt', models.PositiveIntegerField(default=0)),
+                ('forest', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_postings', to='forest.forest')),
+                ('semi_category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_postings', to='forest.semicategory')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='forestfeedposting',
+            index=models.Index(fields=['semi_category', '-created', '-forest'], name='forest_feed_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forestfeedposting',
+            index=models.Index(fields=['semi_category', '-like_cnt', '-forest'], name='forest_feed_hot_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='forestfeedposting',
+            constraint=models.UniqueConstraint(fields=('semi_category', 'forest'), name='forest_feed_posting_unique_constraint'),
+        ),
+            migrations.RunPython(build_forest_feed_postings,
+                             migrations.RunPython.noop),
+    ]
@@ -42,6 +42,35 @@ class ForestHashtag(TimeStampedModel):
         ]
 
 
+class ForestHashtagStat(models.Model):
+    # 해시태그 통계 (해당 해시태그를 가지는 포레스트 수), ForestHashtagService에서 증감
+    name = models.CharField(max_length=10, unique=True)
+    forest_count = models.PositiveIntegerField(default=0)
+
+
+class ForestFeedPosting(models.Model):
+    # 세미 카테고리별 포레스트 posting list (개인화 피드용), ForestFeedPostingService에서 관리
+    # 정렬 키(created, like_cnt)를 함께 저장하여 세미 카테고리별로 인덱스만 읽고 페이지 단위로 조회
+    semi_category = models.ForeignKey(
+        'SemiCategory', related_name='feed_postings', on_delete=models.CASCADE)
+    forest = models.ForeignKey(
+        'Forest', related_name='feed_postings', on_delete=models.CASCADE)
+    created = models.DateTimeField()
+    like_cnt = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['semi_category', 'forest'], name='forest_feed_posting_unique_constraint'),
+        ]
+        indexes = [
+            models.Index(fields=['semi_category', '-created', '-forest'],
+                         name='forest_feed_latest_idx'),
+            models.Index(fields=['semi_category', '-like_cnt', '-forest'],
+                         name='forest_feed_hot_idx'),
+        ]
+
+
 def get_forest_rep_pic_upload_path(instance, filename):
     return 'forest/rep_pic/{}'.format(filename)
 
@@ -1,11 +1,17 @@
 import re
+import heapq
 from datetime import datetime
-from django.db.models import Q, F, Value, CharField, Case, When, Exists, OuterRef
+from django.db.models import Q, F, Value, CharField, Case, When, Exists, OuterRef, prefetch_related_objects
 from django.db.models.functions import Concat, Substr
 from dataclasses import dataclass
 
 from users.models import User
-from forest.models import Forest, Category, SemiCategory, ForestComment
+from users.selectors import UserFollowGraphSelector
+from core.autocomplete import VersionedTrieCache
+from core.exceptions import ApplicationError
+from core.pagination import encode_cursor, decode_cursor, keyset_q
+from core.selectors import subquery_count
+from forest.models import Forest, Category, SemiCategory, ForestComment, ForestHashtag, ForestHashtagStat, ForestFeedPosting
 
 
 class CategorySelector:
@@ -86,7 +92,7 @@ class ForestSelector:
                 'is_verified': forest.writer.is_verified,
             },
             user_likes=forest.user_likes,
-            writer_is_followed = (user in forest.writer.followers.all()) if user.is_authenticated else False,
+            writer_is_followed=UserFollowGraphSelector.is_followed(user, forest.writer_id),
 
             like_cnt=forest.like_cnt,
             comment_cnt=len(forest.comments.all()),
@@ -106,32 +112,23 @@ class ForestSelector:
              semi_category_filters: list[str],
              writer_filter: str,
              user: User):
-
-        def extract_preview(content):
-            # img 태그는 space로 대체
-            # 나머지는 빈 문자열로 대체
-            ret = re.sub(r'<img.*?>', '', content)
-            ret = re.sub(r'<.*?>', '', ret)  # FYI: 닫는 태그 <\/.+?>
-            ret = re.sub('&nbsp;', ' ', ret)  # &nbsp; 지우기
-            ret = re.sub(r'\s{2,}', '', ret)  # space 두개 이상인 경우 하나로
-            return ret[:150]
-
+        # 페이지네이션 이전까지 평가되지 않는 queryset 반환, DTO는 page_dtos로 페이지에 대해서만 생성
         q = Q()
         q.add(Q(title__icontains=search) |
               Q(subtitle__icontains=search) |
               Q(content__icontains=search) |
               #   Q(category__name__icontains=search) |
               #   Q(semi_categories__name__icontains=search) |
-              Q(hashtags__name__icontains=search), q.AND)
+              Q(id__in=ForestHashtag.objects.filter(
+                  name__icontains=search).values('forest')), q.AND)
 
         if category_filter:
             q.add(Q(category__id__iexact=category_filter), q.AND)
 
-        semi_category_filter_q = Q()
-        for semi_category_filter in semi_category_filters:
-            semi_category_filter_q.add(
-                Q(semicategories__id=semi_category_filter), q.OR)
-        q.add(semi_category_filter_q, q.AND)
+        # to-many join 대신 서브쿼리로 필터링하여 distinct 없이 중복 제거
+        if semi_category_filters:
+            q.add(Q(id__in=SemiCategory.forest.through.objects.filter(
+                semicategory_id__in=semi_category_filters).values('forest_id')), q.AND)
 
         if writer_filter:
             q.add(Q(writer__email__iexact=writer_filter), q.AND)
@@ -140,7 +137,14 @@ class ForestSelector:
                       'oldest': 'created',
                       'hot': '-like_cnt'}
 
-        forests = Forest.objects.distinct().annotate(
+        forests = ForestSelector.annotated(user=user).filter(q).order_by(order_pair[order])
+
+        return forests
+
+    @staticmethod
+    def annotated(user: User):
+        # 목록 DTO(page_dtos) 생성에 필요한 사용자 좋아요 여부, 댓글 수 annotate
+        return Forest.objects.annotate(
             user_likes=Case(
                 When(Exists(Forest.likeuser_set.through.objects.filter(
                     forest_id=OuterRef('pk'),
@@ -149,13 +153,26 @@ class ForestSelector:
                     then=Value(1)),
                 default=Value(0),
             ),
+            comment_cnt=subquery_count(ForestComment.objects.filter(forest=OuterRef('pk'))),
         ).select_related(
             'category', 'writer'
-        ).prefetch_related(
-            'semicategories', 'hashtags', 'photos', 'comments'
-        ).filter(q).order_by(order_pair[order])
+        )
 
-        forest_dtos = [ForestDto(
+    @staticmethod
+    def page_dtos(forests):
+        def extract_preview(content):
+            # img 태그는 space로 대체
+            # 나머지는 빈 문자열로 대체
+            ret = re.sub(r'<img.*?>', '', content)
+            ret = re.sub(r'<.*?>', '', ret)  # FYI: 닫는 태그 <\/.+?>
+            ret = re.sub('&nbsp;', ' ', ret)  # &nbsp; 지우기
+            ret = re.sub(r'\s{2,}', '', ret)  # space 두개 이상인 경우 하나로
+            return ret[:150]
+
+        # 페이지에 포함된 포레스트의 세미 카테고리/해시태그/사진만 prefetch
+        prefetch_related_objects(forests, 'semicategories', 'hashtags', 'photos')
+
+        return [ForestDto(
             id=forest.id,
             title=forest.title,
             subtitle=forest.subtitle,
@@ -175,7 +192,7 @@ class ForestSelector:
             },
             user_likes=forest.user_likes,
             like_cnt=forest.like_cnt,
-            comment_cnt=len(forest.comments.all()),
+            comment_cnt=forest.comment_cnt,
             created=forest.created.strftime('%Y-%m-%dT%H:%M:%S%z'),
             updated=forest.updated.strftime('%Y-%m-%dT%H:%M:%S%z'),
 
@@ -183,13 +200,101 @@ class ForestSelector:
             photos=[photo.image.url for photo in forest.photos.all()],
         ) for forest in forests]
 
-        return forest_dtos
-
     @ staticmethod
     def likes(forest: Forest, user: User):
         return forest.likeuser_set.filter(pk=user.pk).exists()
 
 
+class ForestFeedSelector:
+    # 개인화 피드: 사용자의 세미 카테고리별 posting list(ForestFeedPosting)에서 커서 이후 page_size + 1개씩만 읽어
+    # heap으로 병합하므로, 전체 포레스트 수와 무관하게 (세미 카테고리 수 x 페이지 크기)만큼만 조회
+    MAX_PAGE_SIZE = 50
+    ORDERINGS = {
+        'latest': ['-created', '-forest_id'],
+        'hot': ['-like_cnt', '-forest_id'],
+    }
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def _streams(user: User, ordering: list[str], cursor: dict, page_size: int) -> list[list[tuple]]:
+        fields = [field.lstrip('-') for field in ordering]
+        semi_category_ids = list(user.semi_categories.values_list('id', flat=True))
+
+        if semi_category_ids:
+            querysets = [ForestFeedPosting.objects.filter(semi_category_id=semi_category_id)
+                         for semi_category_id in semi_category_ids]
+        else:
+            # 선호 세미 카테고리가 없는 사용자는 전체 포레스트를 같은 정렬로 조회
+            querysets = [Forest.objects.annotate(forest_id=F('id'))]
+
+        streams = []
+        for queryset in querysets:
+            if cursor is not None:
+                queryset = queryset.filter(keyset_q(ordering, cursor))
+            streams.append(list(
+                queryset.order_by(*ordering).values_list(*fields)[:page_size + 1]))
+        return streams
+
+    @staticmethod
+    def list(user: User, order: str = 'latest', cursor: str = None, page_size: int = 20):
+        ordering = ForestFeedSelector.ORDERINGS.get(order)
+        if ordering is None:
+            raise ApplicationError('지원하지 않는 정렬 기준입니다.')
+        page_size = max(1, min(page_size, ForestFeedSelector.MAX_PAGE_SIZE))
+        decoded = decode_cursor(cursor) if cursor else None
+
+        # 여러 세미 카테고리에 속한 포레스트는 정렬 키가 같으므로 병합 결과에서 연속으로 나타남
+        keys = []
+        streams = ForestFeedSelector._streams(user=user, ordering=ordering,
+                                              cursor=decoded, page_size=page_size)
+        for key in heapq.merge(*streams, reverse=True):
+            if keys and keys[-1] == key:
+                continue
+            keys.append(key)
+            if len(keys) > page_size:
+                break
+
+        next_cursor = None
+        if len(keys) > page_size:
+            keys = keys[:page_size]
+            next_cursor = encode_cursor(
+                dict(zip([field.lstrip('-') for field in ordering], keys[-1])))
+
+        # 페이지에 포함된 포레스트만 조회하여 DTO 생성
+        forest_ids = [key[-1] for key in keys]
+        forests = ForestSelector.annotated(user=user).in_bulk(forest_ids)
+        results = ForestSelector.page_dtos(
+            [forests[forest_id] for forest_id in forest_ids if forest_id in forests])
+
+        return results, next_cursor
+
+
+@dataclass
+class ForestHashtagDto:
+    name: str
+    forestCount: int
+
+
+FOREST_HASHTAG_TRIES = VersionedTrieCache('hashtag:forest')
+
+
+class ForestHashtagSelector:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def list(query: str, limit: int = None):
+        # 해시태그 통계로 만든 prefix trie에서 인기순(해당 해시태그를 가지는 포레스트 수)으로 조회
+        trie = FOREST_HASHTAG_TRIES.get(
+            'all', lambda: ForestHashtagStat.objects.filter(forest_count__gt=0)
+            .values_list('name', 'forest_count'))
+
+        return [ForestHashtagDto(name=name, forestCount=forest_cnt)
+                for name, forest_cnt in trie.search(query, limit)]
+
+
 @ dataclass
 class ForestCommentDto:
     id: int
@@ -4,14 +4,16 @@ import uuid
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import F
 from django.core.files.images import ImageFile
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.shortcuts import get_object_or_404
 
 from users.models import User
-from forest.models import Forest, ForestPhoto, ForestHashtag, Category, SemiCategory, ForestComment, ForestReport
-from .selectors import ForestSelector, ForestCommentSelector
+from forest.models import Forest, ForestPhoto, ForestHashtag, ForestHashtagStat, ForestFeedPosting, Category, SemiCategory, ForestComment, ForestReport
+from .selectors import FOREST_HASHTAG_TRIES, ForestSelector, ForestCommentSelector
 from core.exceptions import ApplicationError
+from core.uploads import UploadTicket, issue_upload, confirm_upload
 
 
 class ForestCoordinatorService:
@@ -83,6 +85,10 @@ class ForestCoordinatorService:
     @staticmethod
     @transaction.atomic
     def delete(forest: Forest):
+        # 삭제되는 포레스트의 해시태그 통계 감소
+        ForestHashtagStatService.decrease(
+            names=list(forest.hashtags.values_list('name', flat=True)))
+
         forest.delete()
 
 
@@ -98,6 +104,7 @@ class ForestService:
 
             forest.full_clean()
             forest.save()
+            ForestFeedPostingService.update_like_cnt(forest=forest)
 
             return False
         else:
@@ -106,6 +113,7 @@ class ForestService:
 
             forest.full_clean()
             forest.save()
+            ForestFeedPostingService.update_like_cnt(forest=forest)
 
             return True
 
@@ -119,15 +127,18 @@ class ForestService:
 
             if op == 'add':
                 semi_category.forest.add(forest)
+                ForestFeedPostingService.add(forest=forest, semi_category=semi_category)
             elif op == 'remove':
                 semi_category.forest.remove(forest)
+                ForestFeedPostingService.remove(forest=forest, semi_category=semi_category)
             else:
                 raise ApplicationError("지원하지 않는 semi_category 연산입니다.")
 
         # forest의 현재 카테고리와 맞지않는 세미카테고리 제거 - 일관성 유지
         for semi_category in forest.semicategories.exclude(
                 category=forest.category):
-            semi_categories.remove(forest)
+            semi_category.forest.remove(forest)
+            ForestFeedPostingService.remove(forest=forest, semi_category=semi_category)
 
     @staticmethod
     def create(title: str,
@@ -222,6 +233,29 @@ class ForestPhotoService:
 
         return settings.MEDIA_URL + photo.image.name
 
+    @staticmethod
+    def issue_upload(user: User, content_type: str, size: int) -> UploadTicket:
+        return issue_upload(
+            user=user,
+            upload_to='forest/post',
+            content_type=content_type,
+            size=size,
+        )
+
+    @staticmethod
+    def confirm_upload(user: User, token: str) -> str:
+        # 클라이언트가 S3에 직접 업로드한 파일을 검증한 뒤 ForestPhoto 생성, create와 동일하게 URL 반환
+        image_name = confirm_upload(user=user, token=token, upload_to='forest/post')
+        if ForestPhoto.objects.filter(image=image_name).exists():
+            raise ApplicationError('이미 등록된 사진입니다.')
+
+        photo = ForestPhoto(image=image_name, forest=None)
+
+        photo.full_clean()
+        photo.save()
+
+        return settings.MEDIA_URL + photo.image.name
+
     @staticmethod
     def process_photos(forest: Forest, photos: list[str]):
         for photo in photos:
@@ -245,6 +279,9 @@ class ForestHashtagService:
 
     @staticmethod
     def process_hashtags(forest: Forest, hashtags: list[str]):
+        added_names = []
+        removed_names = []
+
         for hashtag in hashtags:
             op, name = hashtag.split(',')
             hashtag = ForestHashtag.objects.filter(forest=forest, name=name)
@@ -253,12 +290,68 @@ class ForestHashtagService:
                 hashtag = ForestHashtag(forest=forest, name=name)
                 hashtag.full_clean()
                 hashtag.save()
+                added_names.append(name)
             elif op == 'remove' and hashtag.exists():
                 # {forest, name}이 pk이므로 object는 unique하게 존재함이 보장
                 hashtag[0].delete()
+                removed_names.append(name)
             else:
                 raise ApplicationError("지원하지 않는 hashtag 연산입니다.")
 
+        ForestHashtagStatService.decrease(names=removed_names)
+        ForestHashtagStatService.increase(names=added_names)
+
+
+class ForestHashtagStatService:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def increase(names: list[str]):
+        for name in set(names):
+            stat, _ = ForestHashtagStat.objects.get_or_create(name=name)
+            # 동시 요청에도 누락되지 않도록 DB에서 증가
+            ForestHashtagStat.objects.filter(pk=stat.pk).update(forest_count=F('forest_count') + 1)
+
+        ForestHashtagStatService._invalidate(names=names)
+
+    @staticmethod
+    def decrease(names: list[str]):
+        ForestHashtagStat.objects.filter(name__in=set(names), forest_count__gt=0).update(
+            forest_count=F('forest_count') - 1)
+        ForestHashtagStat.objects.filter(name__in=set(names), forest_count=0).delete()
+
+        ForestHashtagStatService._invalidate(names=names)
+
+    @staticmethod
+    def _invalidate(names: list[str]):
+        # 커밋된 이후 자동완성 trie 버전 갱신 (다른 프로세스의 trie도 다시 생성됨)
+        if names:
+            transaction.on_commit(lambda: FOREST_HASHTAG_TRIES.invalidate('all'))
+
+
+class ForestFeedPostingService:
+    def __init__(self):
+        pass
+
+    # 포레스트 삭제 시 posting은 cascade로 함께 삭제
+    @staticmethod
+    def add(forest: Forest, semi_category: SemiCategory):
+        ForestFeedPosting.objects.update_or_create(
+            semi_category=semi_category,
+            forest=forest,
+            defaults={'created': forest.created, 'like_cnt': forest.like_cnt},
+        )
+
+    @staticmethod
+    def remove(forest: Forest, semi_category: SemiCategory):
+        ForestFeedPosting.objects.filter(
+            semi_category=semi_category, forest=forest).delete()
+
+    @staticmethod
+    def update_like_cnt(forest: Forest):
+        ForestFeedPosting.objects.filter(forest=forest).update(like_cnt=forest.like_cnt)
+
 
 class ForestCommentService:
     def __init__(self):
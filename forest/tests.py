@@ -1,3 +1,51 @@
 from django.test import TestCase
 
-# Create your tests here.
+from users.models import User
+from forest.models import Forest, Category, SemiCategory
+from forest.selectors import ForestFeedSelector
+from forest.services import ForestService
+
+
+class ForestFeedSelectorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='feed@test.test', password='test', nickname='feed')
+        category = Category.objects.create(name='category')
+        self.semi_categories = [SemiCategory.objects.create(name='semi{}'.format(i), category=category)
+                                for i in range(3)]
+        self.user.semi_categories.add(self.semi_categories[0], self.semi_categories[1])
+
+        # 0: semi0, 1: semi1, 2: semi0 + semi1, 3: semi2 (피드에 포함되지 않음), ...
+        memberships = [[0], [1], [0, 1], [2], [0], [1], [0, 1]]
+        self.forests = []
+        for i, indexes in enumerate(memberships):
+            forest = Forest.objects.create(title='forest {}'.format(i), content='content',
+                                           category=category, writer=self.user)
+            ForestService.process_semi_categories(
+                forest=forest,
+                semi_categories=['add,{}'.format(self.semi_categories[index].id) for index in indexes])
+            self.forests.append(forest)
+
+    def test_latest_feed_merges_semi_categories_without_duplicates(self):
+        expected = [forest.id for forest in reversed(self.forests) if forest.title != 'forest 3']
+
+        ids = []
+        pages = 0
+        cursor = None
+        while pages == 0 or cursor is not None:
+            results, cursor = ForestFeedSelector.list(user=self.user, cursor=cursor, page_size=2)
+            ids.extend(result.id for result in results)
+            pages += 1
+
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_hot_feed_follows_like_count(self):
+        other = User.objects.create_user(
+            email='other@test.test', password='test', nickname='other')
+        ForestService.like_or_dislike(forest=self.forests[1], user=other)
+
+        results, _ = ForestFeedSelector.list(user=self.user, order='hot', page_size=1)
+
+        self.assertEqual([result.id for result in results], [self.forests[1].id])
+        self.assertEqual(results[0].like_cnt, 1)
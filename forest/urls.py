@@ -9,6 +9,10 @@ urlpatterns = [
          ForestReportApi.as_view(), name='forest_report'),
     path('photos/create/',
          ForestPhotoCreateApi.as_view(), name='forest_photo_create'),
+    path('photos/upload_url/',
+         ForestPhotoUploadUrlApi.as_view(), name='forest_photo_upload_url'),
+    path('photos/confirm/',
+         ForestPhotoUploadConfirmApi.as_view(), name='forest_photo_upload_confirm'),
     path('<int:forest_id>/delete/',
          ForestDeleteApi.as_view(), name='forest_delete'),
     path('<int:forest_id>/like/',
@@ -17,6 +21,10 @@ urlpatterns = [
          ForestDetailApi.as_view(), name='forest_detail'),
     path('',
          ForestListApi.as_view(), name='forest_list'),
+    path('feed/',
+         ForestFeedApi.as_view(), name='forest_feed'),
+    path('hashtags/',
+         ForestHashtagListApi.as_view(), name='forest_hashtag_list'),
     path('categories/',
          CategoryListApi.as_view(), name='category_list'),
     path('semi_categories/',
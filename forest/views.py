@@ -12,7 +12,7 @@ from drf_yasg.utils import swagger_auto_schema
 
 from core.views import get_paginated_response
 from .services import ForestCoordinatorService, ForestPhotoService, ForestService, ForestCommentService, ForestUserCategoryService
-from .selectors import ForestSelector, CategorySelector, ForestCommentSelector, ForestUserCategorySelector
+from .selectors import ForestSelector, ForestFeedSelector, ForestHashtagSelector, CategorySelector, ForestCommentSelector, ForestUserCategorySelector
 from .permissions import IsWriter
 from .models import Forest, ForestComment
 from users.serializers import UserSerializer
@@ -231,6 +231,121 @@ class ForestPhotoCreateApi(APIView):
         }, status=status.HTTP_201_CREATED)
 
 
+class ForestPhotoUploadUrlApi(APIView):
+    permission_classes = (IsAuthenticated, )
+
+    class ForestPhotoUploadUrlInputSerializer(serializers.Serializer):
+        content_type = serializers.CharField()
+        size = serializers.IntegerField()
+
+        class Meta:
+            examples = {
+                'content_type': 'image/jpeg',
+                'size': 1048576,
+            }
+
+    class ForestPhotoUploadUrlOutputSerializer(serializers.Serializer):
+        key = serializers.CharField()
+        url = serializers.CharField()
+        fields = serializers.DictField()
+        token = serializers.CharField()
+        expires_in = serializers.IntegerField()
+
+    @swagger_auto_schema(
+        request_body=ForestPhotoUploadUrlInputSerializer,
+        operation_id='포레스트 글 첨부 사진 업로드 URL 발급',
+        operation_description='''
+            포레스트 글에 첨부될 사진을 S3에 직접 업로드하기 위한 presigned URL을 발급합니다.<br/>
+            응답의 url로 fields와 file을 multipart/form-data POST 요청으로 업로드한 후(file은 마지막 필드),<br/>
+            token을 포레스트 글 첨부 사진 업로드 확인 API로 전달하면 사진이 생성됩니다.<br/>
+            ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "key": "forest/post/1686065590.1234abcd.jpg",
+                            "url": "https://sasm-bucket.s3.amazonaws.com/",
+                            "fields": {"Content-Type": "image/jpeg", "key": "media/forest/post/1686065590.1234abcd.jpg"},
+                            "token": "eyJuYW1lIjoiZm9yZXN0L3Bvc3Qv...",
+                            "expires_in": 300,
+                        }
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def post(self, request):
+        serializer = self.ForestPhotoUploadUrlInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        ticket = ForestPhotoService.issue_upload(
+            user=request.user,
+            content_type=data.get('content_type'),
+            size=data.get('size'),
+        )
+
+        return Response({
+            'status': 'success',
+            'data': self.ForestPhotoUploadUrlOutputSerializer(ticket).data,
+        }, status=status.HTTP_200_OK)
+
+
+class ForestPhotoUploadConfirmApi(APIView):
+    permission_classes = (IsAuthenticated, )
+
+    class ForestPhotoUploadConfirmInputSerializer(serializers.Serializer):
+        token = serializers.CharField()
+
+        class Meta:
+            examples = {
+                'token': 'eyJuYW1lIjoiZm9yZXN0L3Bvc3Qv...',
+            }
+
+    @swagger_auto_schema(
+        request_body=ForestPhotoUploadConfirmInputSerializer,
+        operation_id='포레스트 글 첨부 사진 업로드 확인',
+        operation_description='''
+            presigned URL로 업로드한 파일의 크기와 이미지 형식을 확인한 뒤 포레스트 글 첨부 사진을 생성합니다.<br/>
+            결과로 포레스트 글 첨부 사진 업로드 API와 동일하게 이미지 URL이 반환됩니다.<br/>
+            ''',
+        responses={
+            "201": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {"location": "https://sasm-bucket.s3.amazonaws.com/media/forest/post/1686065590.1234abcd.jpg"}
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def post(self, request):
+        serializer = self.ForestPhotoUploadConfirmInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        forest_photo_url = ForestPhotoService.confirm_upload(
+            user=request.user,
+            token=data.get('token'),
+        )
+
+        return Response({
+            'status': 'success',
+            'data': {'location': forest_photo_url},
+        }, status=status.HTTP_201_CREATED)
+
+
 class ForestLikeApi(APIView):
     permission_classes = (IsAuthenticated, )
 
@@ -464,6 +579,146 @@ class ForestListApi(APIView):
             serializer_class=self.ForestListOutputSerializer,
             queryset=forests,
             request=request,
+            view=self,
+            page_transform=ForestSelector.page_dtos,
+        )
+
+
+class ForestFeedApi(APIView):
+    permission_classes = (IsAuthenticated, )
+
+    class ForestFeedFilterSerializer(serializers.Serializer):
+        order = serializers.ChoiceField(choices=['latest', 'hot'], required=False)
+        cursor = serializers.CharField(required=False)
+        page_size = serializers.IntegerField(required=False, min_value=1)
+
+    @swagger_auto_schema(
+        query_serializer=ForestFeedFilterSerializer,
+        operation_id='포레스트 개인화 피드',
+        operation_description='''
+            사용자가 저장한 세미 카테고리(user_categories)에 속한 포레스트 글 리스트를 반환합니다.<br/>
+            저장한 세미 카테고리가 없는 경우 전체 포레스트 글을 반환합니다.<br/>
+            <br/>
+            order : 정렬 기준(latest, hot)<br/>
+            page_size(기본값 20, 최대 50)개씩 반환하며, 다음 페이지는 응답의 next 값을 cursor로 전달해 조회합니다.<br/>
+            응답 results의 각 원소는 포레스트 글 리스트 API와 동일합니다.<br/>
+        ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "next": "eyJjcmVhdGVkIjoiMjAyMy0wNi0xOFQwODo0OToxMiswMDowMCIsImZvcmVzdF9pZCI6MX0",
+                            "results": [
+                                {
+                                    "id": 1,
+                                    'title': '신재생에너지 종류 “풍력에너지 개념/특징/국내외 현황”',
+                                    'subtitle': '풍력발전이란? 풍력 발전은 바람이 가진 운동에너지를 변환하여 전기 에너지를 생산',
+                                    'preview': '육상에 설치된 풍력발전기를 육상풍력발전기, 해상에 설치된 풍력발전기를',
+                                    'rep_pic': "https://sasm-bucket.s3.amazonaws.com/media/forest/rep_pic/abc.jpg",
+                                    "photos": [],
+                                    "writer": {
+                                        "email": "sdpygl@gmail.com",
+                                        "nickname": "sdp_official",
+                                        "profile": 'https://abc.com/1.jpg',
+                                        "is_verified": False
+                                    },
+                                    "user_likes": True,
+                                    "like_cnt": 0,
+                                    "comment_cnt": 0,
+                                    "created": "2023-06-18T08:49:12+0000",
+                                    "updated": "2023-06-18T08:49:12+0000",
+                                    "semi_categories": [
+                                        {
+                                            "id": 1,
+                                            "name": "semi category 1"
+                                        },
+                                    ],
+                                },
+                            ]
+                        }
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def get(self, request):
+        filters_serializer = self.ForestFeedFilterSerializer(
+            data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        forests, next_cursor = ForestFeedSelector.list(
+            user=request.user,
+            order=filters.get('order', 'latest'),
+            cursor=filters.get('cursor'),
+            page_size=filters.get('page_size', 20),
+        )
+
+        serializer = ForestListApi.ForestListOutputSerializer(forests, many=True)
+
+        return Response({
+            'status': 'success',
+            'data': {
+                'next': next_cursor,
+                'results': serializer.data,
+            },
+        }, status=status.HTTP_200_OK)
+
+
+class ForestHashtagListApi(APIView):
+    permission_classes = (AllowAny, )
+
+    class Pagination(PageNumberPagination):
+        page_size = 5
+        page_size_query_param = 'page_size'
+
+    class ForestHashtagListFilterSerializer(serializers.Serializer):
+        query = serializers.CharField(required=True)
+
+    class ForestHashtagListOutputSerializer(serializers.Serializer):
+        name = serializers.CharField()
+        forestCount = serializers.IntegerField()
+
+    @swagger_auto_schema(
+        query_serializer=ForestHashtagListFilterSerializer,
+        operation_id='포레스트 해시태그 리스트',
+        operation_description='''
+            전달된 검색어로 시작하는 포레스트 해시태그 리스트를 인기순(해당 해시태그를 가지는 포레스트 수)으로 반환합니다.<br/>
+        ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        'name': '풍력',
+                        'forestCount': 3,
+                    },
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def get(self, request):
+        filters_serializer = self.ForestHashtagListFilterSerializer(
+            data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        hashtags = ForestHashtagSelector.list(query=filters.get('query'))
+
+        return get_paginated_response(
+            pagination_class=self.Pagination,
+            serializer_class=self.ForestHashtagListOutputSerializer,
+            queryset=hashtags,
+            request=request,
             view=self
         )
 
@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class TimelineEntry(models.Model):
+    # 팔로우한 작성자의 게시물 타임라인 (fan-out-on-write), TimelineService에서 관리
+    # 팔로워가 많은 작성자의 게시물은 저장하지 않고 조회 시 직접 읽음 (fan-out-on-read)
+    MODEL_CHOICES = (
+        ('Curation', 'Curation'),
+        ('Forest', 'Forest'),
+        ('Story', 'Story'),
+    )
+    user = models.ForeignKey(
+        'users.User', related_name='timeline_entries', on_delete=models.CASCADE)
+    writer = models.ForeignKey(
+        'users.User', related_name='+', on_delete=models.CASCADE)
+    model = models.CharField(max_length=10, choices=MODEL_CHOICES)
+    object_id = models.PositiveIntegerField()
+    created = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'model', 'object_id'], name='timeline_entry_unique_constraint'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-created', '-model', '-object_id'],
+                         name='timeline_entry_feed_idx'),
+            models.Index(fields=['model', 'object_id'],
+                         name='timeline_entry_object_idx'),
+        ]
@@ -1,9 +1,10 @@
 from users.models import User
-from curations.models import Curation
+from curations.models import Curation, CurationPhoto
 
 from django.conf import settings
 from django.db.models.functions import Concat
-from django.db.models import Q, F, Case, When, Value, CharField, Aggregate
+from django.db.models import Q, F, Case, When, Value, CharField, Aggregate, OuterRef
+from core.selectors import rep_media_url
 
 
 class GroupConcat(Aggregate):
@@ -38,18 +39,10 @@ class CurationSelector:
 
     @staticmethod
     def my_written_list(user: User):
-        curations = Curation.objects.distinct().filter(writer=user).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+        curations = Curation.objects.filter(writer=user).annotate(
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
             writer_nickname=F('writer__nickname')
-        )
+        ).order_by('-created')
 
         return curations
 
@@ -64,16 +57,8 @@ class CurationSelector:
               Q(story__tag__icontains=search), q.AND)
 
         curations = Curation.objects.distinct().filter(q, likeuser_set__in=[user]).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
             writer_nickname=F('writer__nickname')
-        )
+        ).order_by('-created')
 
         return curations
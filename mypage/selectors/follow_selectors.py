@@ -1,4 +1,7 @@
+from django.db.models import Q
+
 from users.models import User
+from users.selectors import UserFollowGraphSelector
 
 class UserFollowSelector:
     def __init__(self):
@@ -6,7 +9,7 @@ class UserFollowSelector:
 
     @staticmethod
     def follows(source: User, target: User):
-        return source.follows.contains(target)
+        return UserFollowGraphSelector.is_followed(source, target.pk)
 
     @staticmethod
     def get_following(source: User):
@@ -16,24 +19,26 @@ class UserFollowSelector:
     def get_follower(target: User):
         return target.followers.all()
     
+    # 팔로우 리스트는 팔로우 관계(through) 테이블을 최근 팔로우 순(id 내림차순)으로 조회
+    # 검색어는 email/nickname prefix로 비교하여 인덱스 사용
     @staticmethod
-    def get_following_with_filter(search_email: str, target_email: str):
-        following = User.objects.all()
-        if search_email:
-            following = User.objects.filter(email__icontains=search_email)
+    def get_following_with_filter(search: str, target: User):
+        following = User.follows.through.objects.filter(
+            from_user=target).select_related('to_user')
 
-        if target_email:
-            following = following.filter(followers__email__icontains=target_email)
+        if search:
+            following = following.filter(Q(to_user__email__startswith=search) |
+                                         Q(to_user__nickname__startswith=search))
 
-        return following
-    
-    def get_follower_with_filter(search_email: str, target_email: str):
-        follower = User.objects.all()
+        return following.order_by('-id')
 
-        if search_email:
-            follower = follower.filter(email__icontains=search_email)
+    @staticmethod
+    def get_follower_with_filter(search: str, target: User):
+        follower = User.follows.through.objects.filter(
+            to_user=target).select_related('from_user')
 
-        if target_email:
-            follower = follower.filter(follows__email__icontains=target_email)
+        if search:
+            follower = follower.filter(Q(from_user__email__startswith=search) |
+                                       Q(from_user__nickname__startswith=search))
 
-        return follower
\ No newline at end of file
+        return follower.order_by('-id')
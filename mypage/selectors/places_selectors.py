@@ -13,9 +13,14 @@ class UserReviewedPlaceSelector:
         self.user = user
     
     def list(self):
-        user_reviews = PlaceVisitorReview.objects.filter(visitor_name__email=self.user.email)
-        reviewed_places = Place.objects.filter(id__in=user_reviews.values('place'))
-        
+        # 리뷰 작성한 장소를 마지막으로 리뷰 작성한 시간 순으로 조회
+        # email join 대신 (visitor_name, place, created) 인덱스를 타는 Exists/subquery로 처리
+        my_reviews = PlaceVisitorReview.objects.filter(place=OuterRef('pk'), visitor_name=self.user)
+
+        reviewed_places = Place.objects.filter(Exists(my_reviews)).annotate(
+            last_reviewed=Subquery(my_reviews.order_by('-created').values('created')[:1]),
+        ).order_by('-last_reviewed', '-id')
+
         return reviewed_places
     
 
@@ -1,8 +1,8 @@
-from django.db.models import F, Q, Aggregate, CharField
+from django.db.models import F, Q, Aggregate, CharField, Exists, OuterRef, Subquery
 from django.conf import settings
 
 from users.models import User
-from stories.models import Story
+from stories.models import Story, StoryComment
 
 
 class GroupConcat(Aggregate):
@@ -35,7 +35,20 @@ def append_media_url(rest):
     return settings.MEDIA_URL + rest
 
 
+def story_page_transform(stories: list) -> list:
+    # 페이지네이션 이후 한 페이지의 스토리에 대해서만 대표 사진/추가 사진을 URL로 변환
+    for story in stories:
+        story.rep_pic = story.rep_pic.url
+        if story.extra_pics is not None:
+            story.extra_pics = list(map(
+                append_media_url, story.extra_pics.split(',')[:3]))
+
+    return stories
+
+
 class UserStorySelector:
+    page_transform = staticmethod(story_page_transform)
+
     def __init__(self, user: User):
         self.user = user
 
@@ -67,28 +80,24 @@ class UserStorySelector:
             extra_pics=GroupConcat('photos__image'),
         ).order_by('-created')
 
-        for story in stories:
-            story.rep_pic = story.rep_pic.url
-            if story.extra_pics is not None:
-                story.extra_pics = map(
-                    append_media_url, story.extra_pics.split(',')[:3])
-
         return stories
 
     def get_by_comment(self):
+        # 댓글 단 스토리를 마지막으로 댓글 단 시간 순으로 조회
+        # 스토리 id 목록을 메모리로 가져오지 않고 (writer, story, created) 인덱스를 타는 Exists/subquery로 처리
+        my_comments = StoryComment.objects.filter(story=OuterRef('pk'), writer=self.user)
 
-        my_story_comments = self.user.story_comments.filter(
-            writer=self.user).values_list('story')
-        story_filter = [y for x in set(my_story_comments) for y in x]
-
-        stories = Story.objects.filter(id__in=story_filter).annotate(
-            place_name=F('place__place_name')
-        ).order_by('created')
+        stories = Story.objects.filter(Exists(my_comments)).annotate(
+            place_name=F('place__place_name'),
+            last_commented=Subquery(my_comments.order_by('-created').values('created')[:1]),
+        ).order_by('-last_commented', '-id')
 
         return stories
 
 
 class UserCreatedStorySelector:
+    page_transform = staticmethod(story_page_transform)
+
     def __init__(self, user: User):
         self.user = user
 
@@ -119,10 +128,4 @@ class UserCreatedStorySelector:
             extra_pics=GroupConcat('photos__image'),
         ).order_by('-created')
 
-        for story in stories:
-            story.rep_pic = story.rep_pic.url
-            if story.extra_pics is not None:
-                story.extra_pics = map(
-                    append_media_url, story.extra_pics.split(',')[:3])
-
         return stories
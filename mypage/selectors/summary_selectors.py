@@ -0,0 +1,82 @@
+from django.db.models import F, OuterRef
+
+from core.caches import VersionedCache
+from core.selectors import subquery_count
+from users.models import User
+from places.models import Place
+from stories.models import Story
+from forest.models import Forest
+from curations.models import Curation
+
+
+# 마이페이지 요약 캐시, 좋아요/팔로우/작성 시 mypage.services.UserProfileSummaryCacheService에서 invalidate
+# 게시물 삭제로 인한 좋아요 관계 삭제 등 signal이 없는 변경은 timeout 이후 반영
+PROFILE_SUMMARY_CACHE = VersionedCache('mypage:summary:', timeout=10 * 60)
+
+
+class UserProfileSummarySelector:
+    # 마이페이지 첫 화면용 요약: 탭별 개수와 첫 페이지 id 목록
+    # 탭별 첫 페이지 크기와 정렬은 각 탭 API와 동일
+    PAGE_SIZES = {
+        'liked_place': 6,
+        'liked_story': 6,
+        'created_story': 6,
+        'liked_forest': 4,
+        'created_forest': 4,
+        'liked_curation': 6,
+        'created_curation': 6,
+        'following': 5,
+        'follower': 5,
+    }
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def counts(user_id: int) -> dict:
+        # 탭별 개수를 상관 서브쿼리로 한 번의 쿼리에서 계산 (좋아요는 through 테이블의 user 인덱스 사용)
+        # 팔로우 수는 UserFollowService가 관리하는 user 컬럼 사용
+        user = OuterRef('pk')
+        return User.objects.filter(pk=user_id).annotate(
+            liked_place=subquery_count(Place.place_likeuser_set.through.objects.filter(user=user)),
+            liked_story=subquery_count(Story.story_likeuser_set.through.objects.filter(user=user)),
+            created_story=subquery_count(Story.objects.filter(writer=user)),
+            liked_forest=subquery_count(Forest.likeuser_set.through.objects.filter(user=user)),
+            created_forest=subquery_count(Forest.objects.filter(writer=user)),
+            liked_curation=subquery_count(Curation.likeuser_set.through.objects.filter(user=user)),
+            created_curation=subquery_count(Curation.objects.filter(writer=user)),
+            following=F('following_cnt'),
+            follower=F('follower_cnt'),
+        ).values(*UserProfileSummarySelector.PAGE_SIZES).get()
+
+    @staticmethod
+    def first_page_ids(user_id: int) -> dict:
+        ids = {
+            'liked_place': Place.objects.filter(place_likeuser_set=user_id).order_by('-created'),
+            'liked_story': Story.objects.filter(story_likeuser_set=user_id).order_by('-created'),
+            'created_story': Story.objects.filter(writer=user_id).order_by('-created'),
+            'liked_forest': Forest.objects.filter(likeuser_set=user_id).order_by('-created'),
+            'created_forest': Forest.objects.filter(writer=user_id).order_by('-created'),
+            'liked_curation': Curation.objects.filter(likeuser_set=user_id).order_by('-created'),
+            'created_curation': Curation.objects.filter(writer=user_id).order_by('-created'),
+        }
+        ids = {tab: queryset.values_list('id', flat=True) for tab, queryset in ids.items()}
+        ids['following'] = User.follows.through.objects.filter(
+            from_user=user_id).order_by('-id').values_list('to_user_id', flat=True)
+        ids['follower'] = User.follows.through.objects.filter(
+            to_user=user_id).order_by('-id').values_list('from_user_id', flat=True)
+
+        return {tab: list(ids[tab][:page_size])
+                for tab, page_size in UserProfileSummarySelector.PAGE_SIZES.items()}
+
+    @staticmethod
+    def load(user_id: int) -> dict:
+        # 캐시에는 {탭: (개수, 첫 페이지 id 목록)} 형태로 저장
+        counts = UserProfileSummarySelector.counts(user_id)
+        first_page_ids = UserProfileSummarySelector.first_page_ids(user_id)
+        return {tab: (counts[tab], first_page_ids[tab]) for tab in UserProfileSummarySelector.PAGE_SIZES}
+
+    @staticmethod
+    def summary(user_id: int) -> dict:
+        document = PROFILE_SUMMARY_CACHE.get(user_id, lambda: UserProfileSummarySelector.load(user_id))
+        return {tab: {'count': count, 'ids': ids} for tab, (count, ids) in document.items()}
@@ -0,0 +1,98 @@
+import heapq
+
+from django.db.models import F, Value, CharField
+
+from core.pagination import encode_cursor, decode_cursor, keyset_q
+from users.models import User
+from stories.models import Story
+from forest.models import Forest
+from curations.models import Curation
+from curations.selectors import TotalSearchSelector
+from mypage.models import TimelineEntry
+
+
+class TimelineSelector:
+    # 팔로잉 타임라인: 타임라인 테이블(fan-out-on-write)과 팔로워가 많은 작성자의 게시물(fan-out-on-read)을
+    # (created, model, object_id) 내림차순으로 병합하여 커서 페이지네이션
+    MAX_PAGE_SIZE = 50
+    # 팔로워 수가 이보다 많은 작성자의 게시물은 팔로워 타임라인에 저장하지 않음
+    FANOUT_FOLLOWER_LIMIT = 1000
+    MODELS = ['Curation', 'Forest', 'Story']
+    ORDERING = ['-created', '-model', '-object_id']
+    FIELDS = ['created', 'model', 'object_id']
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_popular(writer_id: int) -> bool:
+        return User.objects.filter(
+            pk=writer_id, follower_cnt__gt=TimelineSelector.FANOUT_FOLLOWER_LIMIT).exists()
+
+    @staticmethod
+    def popular_following_ids(user: User) -> list[int]:
+        return list(User.objects.filter(
+            followers=user, follower_cnt__gt=TimelineSelector.FANOUT_FOLLOWER_LIMIT
+        ).values_list('id', flat=True))
+
+    @staticmethod
+    def published(writer_ids: list[int]) -> dict:
+        # 타임라인에 노출되는 모델별 게시물 queryset (공개된 큐레이션만)
+        return {
+            'Curation': Curation.objects.filter(writer_id__in=writer_ids, is_released=True),
+            'Forest': Forest.objects.filter(writer_id__in=writer_ids),
+            'Story': Story.objects.filter(writer_id__in=writer_ids),
+        }
+
+    @staticmethod
+    def _streams(user: User, cursor: dict, page_size: int) -> list[list[tuple]]:
+        querysets = [TimelineEntry.objects.filter(user=user)]
+
+        popular_ids = TimelineSelector.popular_following_ids(user=user)
+        if popular_ids:
+            for model, queryset in TimelineSelector.published(writer_ids=popular_ids).items():
+                querysets.append(queryset.annotate(
+                    model=Value(model, output_field=CharField()),
+                    object_id=F('id'),
+                ))
+
+        streams = []
+        for queryset in querysets:
+            if cursor is not None:
+                queryset = queryset.filter(keyset_q(TimelineSelector.ORDERING, cursor))
+            streams.append(list(queryset.order_by(*TimelineSelector.ORDERING).values_list(
+                *TimelineSelector.FIELDS)[:page_size + 1]))
+        return streams
+
+    @staticmethod
+    def list(user: User, cursor: str = None, page_size: int = 20):
+        page_size = max(1, min(page_size, TimelineSelector.MAX_PAGE_SIZE))
+        decoded = decode_cursor(cursor) if cursor else None
+
+        # 팔로워가 많아진 작성자의 이전 게시물은 타임라인 테이블과 직접 조회 양쪽에 있을 수 있으므로 중복 제거
+        keys = []
+        streams = TimelineSelector._streams(user=user, cursor=decoded, page_size=page_size)
+        for key in heapq.merge(*streams, reverse=True):
+            if keys and keys[-1] == key:
+                continue
+            keys.append(key)
+            if len(keys) > page_size:
+                break
+
+        next_cursor = None
+        if len(keys) > page_size:
+            keys = keys[:page_size]
+            next_cursor = encode_cursor(dict(zip(TimelineSelector.FIELDS, keys[-1])))
+
+        # 페이지에 포함된 게시물만 모델별 한 번의 쿼리로 조회
+        rows = {}
+        for model in TimelineSelector.MODELS:
+            ids = [object_id for _, key_model, object_id in keys if key_model == model]
+            if ids:
+                rows[model] = TotalSearchSelector.hydrate(model=model, ids=ids)
+
+        results = [rows[model][object_id] for _, model, object_id in keys
+                   if object_id in rows.get(model, {})]
+        TotalSearchSelector.apply_user_flags(rows=results, user=user)
+
+        return results, next_cursor
@@ -1,11 +1,18 @@
 import datetime
+from django.db import transaction
+from django.db.models import Count, Q, F
 from rest_framework_jwt.settings import api_settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from core.exceptions import ApplicationError
 
+from core.pagination import cursor_values, keyset_q
+from core.tasks import enqueue_on_commit
 from users.models import User
-from users.selectors import UserSelector
+from users.selectors import UserSelector, UserFollowGraphSelector
+from mypage.models import TimelineEntry
 from mypage.selectors.follow_selectors import UserFollowSelector
+from mypage.selectors.timeline_selectors import TimelineSelector
+from mypage.selectors.summary_selectors import PROFILE_SUMMARY_CACHE
 
 JWT_PAYLOAD_HANDLER = api_settings.JWT_PAYLOAD_HANDLER
 JWT_ENCODE_HANDLER = api_settings.JWT_ENCODE_HANDLER
@@ -19,17 +26,139 @@ class UserFollowService:
     def follow_or_unfollow(source: User, target: User) -> bool:
         # 이미 팔로우 한 상태 -> 팔로우 취소 (unfollow)
         if UserFollowSelector.follows(source=source, target=target):
-            source.follows.remove(target)
+            UserFollowService._unfollow(source=source, target=target)
             return False
 
         else:  # 팔로우 하지 않은 상태 -> 팔로우 (follow)
-            source.follows.add(target)
+            UserFollowService._follow(source=source, target=target)
             return True
 
+    @staticmethod
     def only_unfollow(source: User, target: User) -> bool:
-        source.follows.remove(target)
+        UserFollowService._unfollow(source=source, target=target)
         return False
 
+    @staticmethod
+    @transaction.atomic
+    def _follow(source: User, target: User):
+        # 실제로 관계가 추가된 경우에만 팔로워/팔로잉 수를 DB에서 증가 (동시 요청에도 누락/중복 없음)
+        _, created = User.follows.through.objects.get_or_create(
+            from_user_id=source.id, to_user_id=target.id)
+        if created:
+            User.objects.filter(pk=source.pk).update(following_cnt=F('following_cnt') + 1)
+            User.objects.filter(pk=target.pk).update(follower_cnt=F('follower_cnt') + 1)
+            TimelineService.follow(user=source, writer=target)
+            UserProfileSummaryCacheService.invalidate(user_ids=[source.id, target.id])
+
+        UserFollowGraphSelector.invalidate(source)
+
+    @staticmethod
+    @transaction.atomic
+    def _unfollow(source: User, target: User):
+        deleted, _ = User.follows.through.objects.filter(
+            from_user_id=source.id, to_user_id=target.id).delete()
+        if deleted:
+            User.objects.filter(pk=source.pk, following_cnt__gt=0).update(following_cnt=F('following_cnt') - 1)
+            User.objects.filter(pk=target.pk, follower_cnt__gt=0).update(follower_cnt=F('follower_cnt') - 1)
+            UserProfileSummaryCacheService.invalidate(user_ids=[source.id, target.id])
+
+        TimelineService.unfollow(user=source, writer=target)
+        UserFollowGraphSelector.invalidate(source)
+
+
+class UserProfileSummaryCacheService:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def invalidate(user_ids: list[int]):
+        # 커밋 이후 해당 유저들의 마이페이지 요약 캐시 버전 갱신
+        def invalidate_all():
+            for user_id in user_ids:
+                PROFILE_SUMMARY_CACHE.invalidate(user_id)
+
+        if user_ids:
+            transaction.on_commit(invalidate_all)
+
+
+class TimelineService:
+    # 게시물 작성 시 작성자의 팔로워 타임라인에 (model, object_id, created)를 추가 (fan-out-on-write)
+    # 팔로워가 많은 작성자는 추가하지 않고 TimelineSelector에서 조회 시 직접 읽음 (fan-out-on-read)
+    # 타임라인은 사용자별로 최신 MAX_ENTRIES개까지만 유지
+    MAX_ENTRIES = 500
+    BATCH_SIZE = 1000
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def publish(model: str, object_id: int, writer_id: int, created: datetime.datetime):
+        # 커밋된 이후 백그라운드에서 fan-out
+        if writer_id is not None:
+            enqueue_on_commit(TimelineService.fan_out, model, object_id, writer_id, created)
+
+    @staticmethod
+    def retract(model: str, object_id: int):
+        TimelineEntry.objects.filter(model=model, object_id=object_id).delete()
+
+    @staticmethod
+    def fan_out(model: str, object_id: int, writer_id: int, created: datetime.datetime):
+        if TimelineSelector.is_popular(writer_id=writer_id):
+            return
+
+        followers = User.follows.through.objects.filter(to_user_id=writer_id).values('from_user_id')
+        TimelineEntry.objects.bulk_create([
+            TimelineEntry(user_id=follower_id, writer_id=writer_id,
+                          model=model, object_id=object_id, created=created)
+            for follower_id in followers.values_list('from_user_id', flat=True)
+        ], batch_size=TimelineService.BATCH_SIZE, ignore_conflicts=True)
+
+        # MAX_ENTRIES개를 넘은 팔로워만 한 번의 group by 쿼리로 찾아서 정리
+        over_limit_ids = TimelineEntry.objects.filter(
+            user_id__in=followers
+        ).values('user_id').annotate(
+            count=Count('id')
+        ).filter(count__gt=TimelineService.MAX_ENTRIES).values_list('user_id', flat=True)
+        for follower_id in over_limit_ids:
+            TimelineService.trim(user_id=follower_id)
+
+    @staticmethod
+    def follow(user: User, writer: User):
+        enqueue_on_commit(TimelineService.backfill, user.id, writer.id)
+
+    @staticmethod
+    def unfollow(user: User, writer: User):
+        TimelineEntry.objects.filter(user=user, writer=writer).delete()
+
+    @staticmethod
+    def backfill(user_id: int, writer_id: int):
+        # 새로 팔로우한 작성자의 최근 게시물을 타임라인에 추가
+        if TimelineSelector.is_popular(writer_id=writer_id):
+            return
+
+        entries = []
+        for model, queryset in TimelineSelector.published(writer_ids=[writer_id]).items():
+            entries.extend(
+                TimelineEntry(user_id=user_id, writer_id=writer_id,
+                              model=model, object_id=object_id, created=created)
+                for object_id, created in queryset.order_by('-created').values_list(
+                    'id', 'created')[:TimelineService.MAX_ENTRIES]
+            )
+        TimelineEntry.objects.bulk_create(
+            entries, batch_size=TimelineService.BATCH_SIZE, ignore_conflicts=True)
+
+        TimelineService.trim(user_id=user_id)
+
+    @staticmethod
+    def trim(user_id: int):
+        # MAX_ENTRIES번째 이후(더 오래된) 항목 삭제
+        entries = TimelineEntry.objects.filter(user_id=user_id)
+        oldest = entries.order_by(*TimelineSelector.ORDERING)[
+            TimelineService.MAX_ENTRIES:TimelineService.MAX_ENTRIES + 1].first()
+        if oldest is not None:
+            entries.filter(Q(pk=oldest.pk) | keyset_q(
+                TimelineSelector.ORDERING, cursor_values(oldest, TimelineSelector.FIELDS))).delete()
+
 
 class UserInfoService:
     def __init__(self, user: User):
@@ -0,0 +1,75 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from places.models import Place
+from stories.models import Story
+from forest.models import Forest
+from curations.models import Curation
+from mypage.services import TimelineService, UserProfileSummaryCacheService
+
+
+# 팔로잉 타임라인: 게시물 작성 시 팔로워 타임라인에 추가, 삭제 시 제거 (관리자 페이지에서의 변경 포함)
+@receiver(post_save, sender=Story)
+@receiver(post_save, sender=Forest)
+def publish_to_timeline(sender, instance, created, **kwargs):
+    if created:
+        TimelineService.publish(model=sender.__name__, object_id=instance.id,
+                                writer_id=instance.writer_id, created=instance.created)
+
+
+@receiver(post_save, sender=Curation)
+def publish_curation_to_timeline(sender, instance, created, update_fields=None, **kwargs):
+    # 공개 여부가 바뀐 경우에만 반영 (공개된 큐레이션을 수정할 때마다 fan-out이 반복되지 않도록)
+    if update_fields is not None and 'is_released' not in update_fields:
+        return
+    if created:
+        if instance.is_released:
+            TimelineService.publish(model='Curation', object_id=instance.id,
+                                    writer_id=instance.writer_id, created=instance.created)
+        return
+    if not instance.is_released_changed():
+        return
+
+    if instance.is_released:
+        TimelineService.publish(model='Curation', object_id=instance.id,
+                                writer_id=instance.writer_id, created=instance.created)
+    else:
+        TimelineService.retract(model='Curation', object_id=instance.id)
+
+
+@receiver(post_delete, sender=Story)
+@receiver(post_delete, sender=Forest)
+@receiver(post_delete, sender=Curation)
+def retract_from_timeline(sender, instance, **kwargs):
+    TimelineService.retract(model=sender.__name__, object_id=instance.id)
+
+
+# 마이페이지 요약: 좋아요한 유저, 게시물 작성자의 요약 캐시 invalidate
+@receiver(m2m_changed, sender=Place.place_likeuser_set.through)
+@receiver(m2m_changed, sender=Story.story_likeuser_set.through)
+@receiver(m2m_changed, sender=Forest.likeuser_set.through)
+@receiver(m2m_changed, sender=Curation.likeuser_set.through)
+def invalidate_liker_summary(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    # reverse: user 쪽에서 변경한 경우 (ex. user.liked_forests.add(forest))
+    if reverse:
+        UserProfileSummaryCacheService.invalidate(user_ids=[instance.pk])
+    elif pk_set:
+        UserProfileSummaryCacheService.invalidate(user_ids=list(pk_set))
+
+
+@receiver(post_save, sender=Story)
+@receiver(post_save, sender=Forest)
+@receiver(post_save, sender=Curation)
+def invalidate_writer_summary_on_create(sender, instance, created, **kwargs):
+    if created and instance.writer_id is not None:
+        UserProfileSummaryCacheService.invalidate(user_ids=[instance.writer_id])
+
+
+@receiver(post_delete, sender=Story)
+@receiver(post_delete, sender=Forest)
+@receiver(post_delete, sender=Curation)
+def invalidate_writer_summary_on_delete(sender, instance, **kwargs):
+    if instance.writer_id is not None:
+        UserProfileSummaryCacheService.invalidate(user_ids=[instance.writer_id])
@@ -1,3 +1,242 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from users.models import User
+from forest.models import Forest, Category
+from places.models import Place, PlaceVisitorReview
+from stories.models import Story, StoryComment
+from curations.models import Curation
+from mypage.models import TimelineEntry
+from mypage.selectors.follow_selectors import UserFollowSelector
+from mypage.selectors.places_selectors import UserReviewedPlaceSelector
+from mypage.selectors.stories_selectors import UserStorySelector
+from mypage.selectors.summary_selectors import UserProfileSummarySelector
+from mypage.selectors.timeline_selectors import TimelineSelector
+from mypage.services import UserFollowService, TimelineService
+from curations.services import CurationLikeService
+
+
+@override_settings(BACKGROUND_TASK_EAGER=True)
+class TimelineTests(TestCase):
+    def setUp(self):
+        self.reader = User.objects.create_user(
+            email='reader@test.test', password='test', nickname='reader')
+        self.writer = User.objects.create_user(
+            email='writer@test.test', password='test', nickname='writer')
+        self.category = Category.objects.create(name='category')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserFollowService.follow_or_unfollow(source=self.reader, target=self.writer)
+
+    def publish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            forest = Forest.objects.create(title='forest', content='content',
+                                           category=self.category, writer=self.writer)
+            curation = Curation.objects.create(title='curation', contents='contents',
+                                               writer=self.writer, is_released=True)
+        return forest, curation
+
+    def test_fan_out_on_write_and_paginate(self):
+        forest, curation = self.publish()
+        self.assertEqual(TimelineEntry.objects.filter(user=self.reader).count(), 2)
+
+        results, cursor = TimelineSelector.list(user=self.reader, page_size=1)
+        self.assertEqual([(row['model'], row['id']) for row in results], [('Curation', curation.id)])
+        self.assertTrue(results[0]['writer_is_followed'])
+
+        results, cursor = TimelineSelector.list(user=self.reader, cursor=cursor, page_size=1)
+        self.assertEqual([(row['model'], row['id']) for row in results], [('Forest', forest.id)])
+        self.assertIsNone(cursor)
+
+        UserFollowService.only_unfollow(source=self.reader, target=self.writer)
+        self.assertEqual(TimelineSelector.list(user=self.reader)[0], [])
+
+    def test_popular_writer_is_read_on_request(self):
+        with mock.patch.object(TimelineSelector, 'FANOUT_FOLLOWER_LIMIT', 0):
+            forest, curation = self.publish()
+            self.assertFalse(TimelineEntry.objects.exists())
+
+            results, _ = TimelineSelector.list(user=self.reader)
+
+        self.assertEqual([(row['model'], row['id']) for row in results],
+                         [('Curation', curation.id), ('Forest', forest.id)])
+
+    def test_fan_out_trims_only_followers_over_limit(self):
+        with mock.patch.object(TimelineService, 'MAX_ENTRIES', 1), \
+                mock.patch.object(TimelineService, 'trim', wraps=TimelineService.trim) as trim:
+            forest, curation = self.publish()
+
+        # forest 추가 시에는 MAX_ENTRIES를 넘지 않으므로 curation 추가 시에만 정리
+        trim.assert_called_once_with(user_id=self.reader.id)
+        self.assertEqual(list(TimelineEntry.objects.values_list('model', 'object_id')),
+                         [('Curation', curation.id)])
+
+    def test_curation_is_published_only_when_released(self):
+        _, curation = self.publish()
+
+        with mock.patch.object(TimelineService, 'fan_out') as fan_out, \
+                self.captureOnCommitCallbacks(execute=True):
+            curation = Curation.objects.get(pk=curation.pk)
+            curation.title = 'changed'
+            curation.save()
+        fan_out.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            curation.is_released = False
+            curation.save()
+        self.assertFalse(TimelineEntry.objects.filter(model='Curation').exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            curation.is_released = True
+            curation.save()
+        self.assertTrue(TimelineEntry.objects.filter(model='Curation', object_id=curation.id).exists())
+
+
+class UserFollowTests(TestCase):
+    def setUp(self):
+        self.target = User.objects.create_user(
+            email='target@test.test', password='test', nickname='target')
+        self.followers = [User.objects.create_user(
+            email='follower{}@test.test'.format(i), password='test', nickname='follower{}'.format(i))
+            for i in range(3)]
+        for follower in self.followers:
+            UserFollowService.follow_or_unfollow(source=follower, target=self.target)
+
+    def test_follow_counts_are_kept_with_relations(self):
+        UserFollowService.only_unfollow(source=self.followers[0], target=self.target)
+        UserFollowService.only_unfollow(source=self.followers[0], target=self.target)
+
+        self.target.refresh_from_db()
+        self.followers[0].refresh_from_db()
+        self.followers[1].refresh_from_db()
+        self.assertEqual(self.target.follower_cnt, 2)
+        self.assertEqual(self.followers[0].following_cnt, 0)
+        self.assertEqual(self.followers[1].following_cnt, 1)
+
+    def test_follower_list_is_searched_by_prefix_and_ordered_by_recent_follow(self):
+        followers = UserFollowSelector.get_follower_with_filter(search='follower', target=self.target)
+        self.assertEqual([follow.from_user for follow in followers], self.followers[::-1])
+
+        followers = UserFollowSelector.get_follower_with_filter(search='follower1', target=self.target)
+        self.assertEqual([follow.from_user for follow in followers], [self.followers[1]])
+
+        followers = UserFollowSelector.get_follower_with_filter(search='ollower', target=self.target)
+        self.assertFalse(followers.exists())
+
+
+class UserCreatedStoryListTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='story@test.test', password='test', nickname='story')
+        place = Place.objects.create(place_name='place', category=Place.PLACE1, latitude=0, longitude=0)
+        self.stories = [Story.objects.create(
+            title='story{}'.format(i), story_review='review', tag='tag', html_content='content',
+            place=place, writer=self.user) for i in range(5)]
+
+        self.client = APIClient(HTTP_HOST='localhost')
+        self.client.force_authenticate(user=self.user)
+
+    def test_only_page_rows_are_fetched_and_transformed(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/mypage/my_story/', {'page_size': 2})
+
+        results = response.data['data']['results']
+        self.assertEqual([row['id'] for row in results],
+                         [story.id for story in self.stories[::-1][:2]])
+        self.assertEqual(results[0]['rep_pic'], self.stories[-1].rep_pic.url)
+
+        story_queries = [query['sql'] for query in queries.captured_queries
+                         if 'GROUP_CONCAT' in query['sql'] and not query['sql'].startswith('SELECT COUNT')]
+        self.assertEqual(len(story_queries), 1)
+        self.assertIn('LIMIT 2', story_queries[0])
+
+
+class UserActivitySelectorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='activity@test.test', password='test', nickname='activity')
+        self.other = User.objects.create_user(
+            email='other@test.test', password='test', nickname='other')
+        self.places = [Place.objects.create(
+            place_name='place{}'.format(i), category=Place.PLACE1, latitude=0, longitude=0)
+            for i in range(3)]
+        self.stories = [Story.objects.create(
+            title='story{}'.format(i), story_review='review', tag='tag', html_content='content',
+            place=self.places[i], writer=self.other) for i in range(3)]
+
+    def test_commented_stories_are_ordered_by_last_comment(self):
+        for story in [self.stories[0], self.stories[1], self.stories[0]]:
+            StoryComment.objects.create(story=story, content='comment', writer=self.user)
+        StoryComment.objects.create(story=self.stories[2], content='comment', writer=self.other)
+
+        with self.assertNumQueries(1):
+            stories = list(UserStorySelector(user=self.user).get_by_comment())
+
+        self.assertEqual(stories, [self.stories[0], self.stories[1]])
+        self.assertEqual(stories[0].place_name, 'place0')
+
+    def test_reviewed_places_are_paginated_by_last_review(self):
+        for place in [self.places[0], self.places[1], self.places[2], self.places[0]]:
+            PlaceVisitorReview.objects.create(place=place, visitor_name=self.user, contents='review')
+
+        client = APIClient(HTTP_HOST='localhost')
+        client.force_authenticate(user=self.user)
+        response = client.get('/mypage/my_reviewed_place/', {'pagination': 'cursor', 'page_size': 2})
+        second = client.get(response.data['data']['next'])
+
+        self.assertEqual([row['id'] for row in response.data['data']['results'] + second.data['data']['results']],
+                         [self.places[0].id, self.places[2].id, self.places[1].id])
+        self.assertIsNone(second.data['data']['next'])
+        self.assertEqual(UserReviewedPlaceSelector(self.other).list().count(), 0)
+
+
+@override_settings(BACKGROUND_TASK_EAGER=True)
+class UserProfileSummaryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='summary@test.test', password='test', nickname='summary')
+        self.other = User.objects.create_user(
+            email='other@test.test', password='test', nickname='other')
+        self.category = Category.objects.create(name='category')
+        self.forests = [Forest.objects.create(
+            title='forest{}'.format(i), content='content', category=self.category, writer=self.user)
+            for i in range(5)]
+
+    def test_summary_is_cached_until_like_or_follow(self):
+        summary = UserProfileSummarySelector.summary(user_id=self.user.id)
+        self.assertEqual(summary['created_forest'],
+                         {'count': 5, 'ids': [forest.id for forest in self.forests[::-1][:4]]})
+        self.assertEqual(summary['liked_forest'], {'count': 0, 'ids': []})
+
+        with self.assertNumQueries(0):
+            UserProfileSummarySelector.summary(user_id=self.user.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.forests[0].likeuser_set.add(self.user)
+            UserFollowService.follow_or_unfollow(source=self.other, target=self.user)
+
+        summary = UserProfileSummarySelector.summary(user_id=self.user.id)
+        self.assertEqual(summary['liked_forest'], {'count': 1, 'ids': [self.forests[0].id]})
+        self.assertEqual(summary['follower'], {'count': 1, 'ids': [self.other.id]})
+
+    def test_curation_like_invalidates_summary(self):
+        curation = Curation.objects.create(title='curation', contents='contents', writer=self.other)
+        self.assertEqual(UserProfileSummarySelector.summary(user_id=self.user.id)['liked_curation'],
+                         {'count': 0, 'ids': []})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CurationLikeService.like_or_dislike(curation=curation, user=self.user)
+        self.assertEqual(UserProfileSummarySelector.summary(user_id=self.user.id)['liked_curation'],
+                         {'count': 1, 'ids': [curation.id]})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CurationLikeService.like_or_dislike(curation=curation, user=self.user)
+        self.assertEqual(UserProfileSummarySelector.summary(user_id=self.user.id)['liked_curation'],
+                         {'count': 0, 'ids': []})
@@ -12,6 +12,8 @@ urlpatterns = [
           name='user_following_list'),
      path('follower/', user_following.UserFollowerListApi.as_view(),
           name='user_follower_list'),
+     path('following/timeline/', user_following.UserFollowingTimelineApi.as_view(),
+          name='user_following_timeline'),
      path('mypick_story/', stories_views.UserStoryListGetApi.as_view(), 
           name='story_edit'),
      path('story_like/', stories_views.UserStoryLikeApi.as_view(), 
@@ -29,6 +31,7 @@ urlpatterns = [
      path('forest_like/', forest_views.UserForestLikeApi.as_view(),
           name='forest_edit_like'),
      path('me/', user_info_views.UserGetApi.as_view(), name='me'),
+     path('me/summary/', user_info_views.UserProfileSummaryApi.as_view(), name='me_summary'),
      path('me/update/', user_info_views.UserUpdateApi.as_view(), name='me_update'),
      path('my_reviewed_place/',places_view.UserReviewedPlaceGetApi.as_view(),
           name='user_reviewed_place'),
@@ -43,7 +43,8 @@ class UserReviewedPlaceGetApi(APIView):
     @swagger_auto_schema(
         operation_id='내가 리뷰 작성한 장소 조회',
         operation_description='''
-                내가 리뷰 작성한 장소를 조회합니다. 쿼리 파라미터 : 없음 <br/>
+                내가 리뷰 작성한 장소를 최근 리뷰 작성 순으로 조회합니다. 쿼리 파라미터 : 없음 <br/>
+                pagination=cursor를 전달하면 커서 방식으로 조회하며, 다음 페이지는 응답의 next URL로 조회합니다. <br/>
             ''',
         responses={
             "200": openapi.Response(
@@ -102,7 +103,8 @@ class OtherUserReviewedPlaceGetApi(APIView):
     @swagger_auto_schema(
         operation_id='타유저가 리뷰 작성한 장소 조회',
         operation_description='''
-                타유저가 리뷰 작성한 장소를 조회합니다. 쿼리 파라메터로 'email' 필요(타겟 유저의 이메일)<br/>
+                타유저가 리뷰 작성한 장소를 최근 리뷰 작성 순으로 조회합니다. 쿼리 파라메터로 'email' 필요(타겟 유저의 이메일)<br/>
+                pagination=cursor를 전달하면 커서 방식으로 조회하며, 다음 페이지는 응답의 next URL로 조회합니다. <br/>
             ''',
         responses={
             "200": openapi.Response(
@@ -100,6 +100,7 @@ class UserStoryListGetApi(APIView):
             queryset=like_story,
             request=request,
             view=self,
+            page_transform=UserStorySelector.page_transform,
         )
 
 
@@ -185,6 +186,7 @@ class UserCreatedStoryApi(APIView):
             queryset=user_story,
             request=request,
             view=self,
+            page_transform=UserCreatedStorySelector.page_transform,
         )
 
 class OtherCreatedStoryApi(APIView):
@@ -271,10 +273,10 @@ class OtherCreatedStoryApi(APIView):
         
         selector = UserCreatedStorySelector(user=user)
 
-        other_user_stories = selector.list(
+        other_user_stories = selector.page_transform(list(selector.list(
             search=filters.get('search', ''),
             filter=filters.get('filter', []),
-        )
+        )))
 
         serialized_stories = []
         for story in other_user_stories:
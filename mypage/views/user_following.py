@@ -10,6 +10,7 @@ from rest_framework.pagination import PageNumberPagination
 from users.mixins import ApiAuthMixin,  ApiAllowAnyMixin
 from mypage.services import UserFollowService
 from mypage.selectors.follow_selectors import UserFollowSelector
+from mypage.selectors.timeline_selectors import TimelineSelector
 from users.models import User
 
 from core.views import get_paginated_response
@@ -97,14 +98,16 @@ class UserFollowingListApi(ApiAllowAnyMixin, APIView):
         search_email = serializers.CharField(required=True, allow_blank=True)
 
     class UserFollowingListOutputSerializer(serializers.Serializer):
-        email = serializers.CharField()
-        nickname = serializers.CharField()
-        profile_image = serializers.ImageField()
+        email = serializers.CharField(source='to_user.email')
+        nickname = serializers.CharField(source='to_user.nickname')
+        profile_image = serializers.ImageField(source='to_user.profile_image')
 
     @swagger_auto_schema(
         operation_id='유저 팔로잉 리스트',
         operation_description='''
-            유저가 팔로우한 유저의 리스트를 반환합니다. 쿼리 파라미터 : email, page, search_email <br/>
+            유저가 팔로우한 유저의 리스트를 최근 팔로우 순으로 반환합니다. 쿼리 파라미터 : email, page, search_email <br/>
+            search_email : 이메일 또는 닉네임의 앞부분(prefix) 검색어 <br/>
+            pagination=cursor를 전달하면 커서 방식으로 조회하며, 다음 페이지는 응답의 next URL로 조회합니다. <br/>
         ''',
         query_serializer=UserFollowingListFilterSerializer,
         responses={
@@ -132,8 +135,8 @@ class UserFollowingListApi(ApiAllowAnyMixin, APIView):
 
         target_user = get_object_or_404(User, email=filters.get('email'))
         followings = UserFollowSelector.get_following_with_filter(
-            search_email=filters.get('search_email'),
-            target_email=target_user.email
+            search=filters.get('search_email'),
+            target=target_user
         )
 
         return get_paginated_response(
@@ -156,14 +159,16 @@ class UserFollowerListApi(ApiAllowAnyMixin, APIView):
         search_email = serializers.CharField(required=True, allow_blank=True)
 
     class UserFollowerListOutputSerializer(serializers.Serializer):
-        email = serializers.CharField()
-        nickname = serializers.CharField()
-        profile_image = serializers.ImageField()
+        email = serializers.CharField(source='from_user.email')
+        nickname = serializers.CharField(source='from_user.nickname')
+        profile_image = serializers.ImageField(source='from_user.profile_image')
 
     @swagger_auto_schema(
         operation_id='유저 팔로워 리스트',
         operation_description='''
-            유저를 팔로우한 유저의 리스트를 반환합니다. 쿼리 파라미터 : email, page, saerch_email <br/>
+            유저를 팔로우한 유저의 리스트를 최근 팔로우 순으로 반환합니다. 쿼리 파라미터 : email, page, saerch_email <br/>
+            search_email : 이메일 또는 닉네임의 앞부분(prefix) 검색어 <br/>
+            pagination=cursor를 전달하면 커서 방식으로 조회하며, 다음 페이지는 응답의 next URL로 조회합니다. <br/>
         ''',
         query_serializer=UserFollowerListFilterSerializer,
         responses={
@@ -191,8 +196,8 @@ class UserFollowerListApi(ApiAllowAnyMixin, APIView):
 
         target_user = get_object_or_404(User, email=filters.get('email'))
         followers = UserFollowSelector.get_follower_with_filter(
-            search_email=filters.get('search_email'),
-            target_email=target_user.email
+            search=filters.get('search_email'),
+            target=target_user
         )
 
         return get_paginated_response(
@@ -202,3 +207,83 @@ class UserFollowerListApi(ApiAllowAnyMixin, APIView):
             request=request,
             view=self
         )
+
+
+class UserFollowingTimelineApi(ApiAuthMixin, APIView):
+    class UserFollowingTimelineFilterSerializer(serializers.Serializer):
+        cursor = serializers.CharField(required=False)
+        page_size = serializers.IntegerField(required=False, min_value=1)
+
+    class UserFollowingTimelineOutputSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        model = serializers.CharField()
+        title = serializers.CharField()
+        content = serializers.CharField()
+        rep_pic = serializers.CharField()
+        nickname = serializers.CharField()
+        like_cnt = serializers.IntegerField()
+        user_likes = serializers.BooleanField()
+        writer_is_followed = serializers.BooleanField()
+        created = serializers.CharField()
+
+    @swagger_auto_schema(
+        operation_id='팔로잉 타임라인',
+        operation_description='''
+            유저가 팔로우한 유저들이 작성한 큐레이션(공개된 큐레이션), 포레스트, 스토리를 최신순으로 반환합니다.<br/>
+            page_size(기본값 20, 최대 50)개씩 반환하며, 다음 페이지는 응답의 next 값을 cursor로 전달해 조회합니다.<br/>
+            model : Curation, Forest, Story 중 하나<br/>
+        ''',
+        query_serializer=UserFollowingTimelineFilterSerializer,
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "next": "eyJjcmVhdGVkIjoiMjAyMy0wNi0xOFQwODo0OToxMiswMDowMCIsIm1vZGVsIjoiRm9yZXN0Iiwib2JqZWN0X2lkIjoxfQ",
+                            "results": [
+                                {
+                                    "id": 1,
+                                    "model": "Forest",
+                                    "title": "포레스트 제목",
+                                    "content": "포레스트 부제목",
+                                    "rep_pic": "https://sasm-bucket.s3.amazonaws.com/media/forest/rep_pic/abc.jpg",
+                                    "nickname": "sdpygl",
+                                    "like_cnt": 0,
+                                    "user_likes": False,
+                                    "writer_is_followed": True,
+                                    "created": "2023-06-18 08:49:12",
+                                },
+                            ]
+                        }
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def get(self, request):
+        filters_serializer = self.UserFollowingTimelineFilterSerializer(
+            data=request.query_params
+        )
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        results, next_cursor = TimelineSelector.list(
+            user=request.user,
+            cursor=filters.get('cursor'),
+            page_size=filters.get('page_size', 20),
+        )
+
+        serializer = self.UserFollowingTimelineOutputSerializer(results, many=True)
+
+        return Response({
+            'status': 'success',
+            'data': {
+                'next': next_cursor,
+                'results': serializer.data,
+            },
+        }, status=status.HTTP_200_OK)
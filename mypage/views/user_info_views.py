@@ -9,6 +9,7 @@ from drf_yasg.utils import swagger_auto_schema
 from mypage.services import UserInfoService
 from users.models import User
 from mypage.selectors.follow_selectors import UserFollowSelector
+from mypage.selectors.summary_selectors import UserProfileSummarySelector
 
 
 class UserGetApi(APIView):
@@ -25,6 +26,8 @@ class UserGetApi(APIView):
         is_sdp_admin = serializers.BooleanField()
         is_verified = serializers.BooleanField()
         introduction = serializers.CharField()
+        follower_cnt = serializers.IntegerField()
+        following_cnt = serializers.IntegerField()
 
     @swagger_auto_schema(
         operation_id='나의 정보 조회',
@@ -46,6 +49,8 @@ class UserGetApi(APIView):
                         'is_sdp_admin': True,
                         'is_verified': False,
                         'introduction' : "안녕하세요",
+                        'follower_cnt': 10,
+                        'following_cnt': 3,
                     },
                 }
             ),
@@ -63,6 +68,56 @@ class UserGetApi(APIView):
         }, status=status.HTTP_200_OK)
 
 
+class UserProfileSummaryApi(APIView):
+    permission_classes = (IsAuthenticated, )
+
+    class UserProfileSummaryOutputSerializer(serializers.Serializer):
+        user = UserGetApi.UserGetOutputSerializer()
+        tabs = serializers.DictField()
+
+    @swagger_auto_schema(
+        operation_id='마이페이지 요약 조회',
+        operation_description='''
+            마이페이지 첫 화면에 필요한 나의 정보와 탭별 개수, 첫 페이지 id 목록을 한 번에 조회합니다. 쿼리 파라미터 : 없음 <br/>
+            탭 : liked_place, liked_story, created_story, liked_forest, created_forest, liked_curation, created_curation, following, follower <br/>
+            following, follower의 id는 유저 id입니다. <br/>
+        ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        'user': {
+                            'id': 1,
+                            'nickname': 'sdpofficial',
+                            'email': 'sdptech@gmail.com',
+                            'follower_cnt': 10,
+                            'following_cnt': 3,
+                        },
+                        'tabs': {
+                            'liked_place': {'count': 8, 'ids': [12, 7, 5, 3, 2, 1]},
+                            'following': {'count': 3, 'ids': [4, 9, 2]},
+                        },
+                    },
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def get(self, request):
+        serializer = self.UserProfileSummaryOutputSerializer({
+            'user': request.user,
+            'tabs': UserProfileSummarySelector.summary(user_id=request.user.id),
+        })
+
+        return Response({
+            'status': 'success',
+            'data': serializer.data,
+        }, status=status.HTTP_200_OK)
+
+
 class UserUpdateApi(APIView):
     permission_classes = (IsAuthenticated, )
 
@@ -168,6 +223,8 @@ class OtherUserGetApi(APIView):
         is_sdp_admin = serializers.BooleanField()
         is_verified = serializers.BooleanField()
         introduction = serializers.CharField()
+        follower_cnt = serializers.IntegerField()
+        following_cnt = serializers.IntegerField()
         is_followed = serializers.BooleanField(read_only=True)
 
         def to_representation(self, instance):
@@ -196,6 +253,8 @@ class OtherUserGetApi(APIView):
                         'is_sdp_admin': True,
                         'is_verified': False,
                         'introduction': "안녕하세요",
+                        'follower_cnt': 10,
+                        'following_cnt': 3,
                         'is_followed' : True,
                     },
                 }
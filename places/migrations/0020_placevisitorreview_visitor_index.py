@@ -0,0 +1,17 @@
+# Generated by Django 4.0 on 2026-10-19 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0019_alter_place_vegan_category'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='placevisitorreview',
+            index=models.Index(fields=['visitor_name', 'place', 'created'], name='placereview_visitor_idx'),
+        ),
+    ]
@@ -151,6 +151,13 @@ class PlaceVisitorReview(core_models.TimeStampedModel):
     contents = models.TextField(
         help_text="리뷰를 작성해주세요.", blank=False, null=False)  # 내용 작성
 
+    class Meta:
+        indexes = [
+            # 마이페이지 리뷰 작성한 장소 조회
+            models.Index(fields=['visitor_name', 'place', 'created'],
+                         name='placereview_visitor_idx'),
+        ]
+
     def __str__(self):
         return self.contents
 
@@ -51,14 +51,14 @@ class PlaceLikeView(viewsets.ModelViewSet):
             if check_like.exists():
                 place.place_likeuser_set.remove(profile)
                 place.place_like_cnt -= 1
-                place.save()
+                place.save(update_fields=['place_like_cnt', 'updated'])
                 return Response({
                     "status" : "success",
                 },status=status.HTTP_200_OK)
             else:
                 place.place_likeuser_set.add(profile)
                 place.place_like_cnt += 1
-                place.save()
+                place.save(update_fields=['place_like_cnt', 'updated'])
                 return Response({
                     "status" : "success",
                 },status=status.HTTP_200_OK)
@@ -12,6 +12,7 @@ from places.services import PlaceCoordinatorService
 from places.selectors import PlaceSnsTypeSelector, PlaceAddressOverlapCheckSelector
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from core.views import get_paginated_response
 
 
 class PlaceCreateApi(APIView):
@@ -213,22 +214,6 @@ class PlaceUpdateApi(APIView):
         return Response({'status': 'success', 'data': {'message': '장소 정보가 업데이트되었습니다.'}})
 
 
-def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
-    paginator = pagination_class()
-
-    page = paginator.paginate_queryset(queryset, request, view=view)
-
-    if page is not None:
-        serializer = serializer_class(page, many=True)
-    else:
-        serializer = serializer_class(queryset, many=True)
-
-    return Response({
-        'status': 'success',
-        'data': paginator.get_paginated_response(serializer.data).data,
-    }, status=status.HTTP_200_OK)
-
-
 class PlaceSnsTypeListApi(APIView):
     permission_classes = (AllowAny,)
 
@@ -17,6 +17,7 @@ from places.serializers import VisitorReviewSerializer
 from places.services import PlaceVisitorReviewCoordinatorService, PlaceVisitorReviewService
 from places.selectors import PlaceVisitorReviewCoordinatorSelector, PlaceReviewSelector
 from sasmproject.swagger import param_pk, param_id
+from core.views import get_paginated_data
 
 
 class BasicPagination(PageNumberPagination):
@@ -142,21 +143,19 @@ class PlaceVisitorReviewUpdateApi(APIView, ApiAuthMixin):
 
 
 def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
-    paginator = pagination_class()
-
-    page = paginator.paginate_queryset(queryset, request, view=view)
-
-    if page is not None:
-        serializer = serializer_class(page, many=True)
-    else:
-        serializer = serializer_class(queryset, many=True)
+    data = get_paginated_data(
+        pagination_class=pagination_class,
+        serializer_class=serializer_class,
+        queryset=queryset,
+        request=request,
+        view=view,
+    )
 
     # get category statistics
     selector = PlaceReviewSelector()
     category_statistics = selector.get_category_statistics(
         place_id=request.GET['place_id'])
 
-    data = paginator.get_paginated_response(serializer.data).data
     data['statistics'] = category_statistics
     # data.results 앞에 위치하도록 OrderedDict 내 순서 조정
     data.move_to_end('statistics', last=False)
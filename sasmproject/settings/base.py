@@ -80,11 +80,9 @@ THIRD_APPS = [
     'allauth.socialaccount.providers.google',
     'allauth.socialaccount.providers.naver',
     'knox',
-    'debug_toolbar',
     'corsheaders',
     'drf_yasg',
     'storages',
-    'silk',
     'sentry_sdk',
 ]
 INSTALLED_APPS = DJANGO_APPS + PROJECT_APPS + THIRD_APPS
@@ -95,6 +93,8 @@ AUTH_USER_MODEL = "users.User"
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    # view별 쿼리 수/DB 시간/캐시/외부 호출 시간 집계 (core.metrics)
+    'core.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -102,9 +102,6 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    # for performace profiling
-    'silk.middleware.SilkyMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 
 ROOT_URLCONF = 'sasmproject.urls'
@@ -165,7 +162,8 @@ USE_TZ = True
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated", ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 인증된 user를 캐시하는 JWTAuthentication
+        "users.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.TokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
@@ -217,6 +215,7 @@ AWS_S3_CUSTOM_DOMAIN = '{}.s3.amazonaws.com'.format(AWS_STORAGE_BUCKET_NAME)
 
 # 이거없어서 엄청 헤맴.. (AWS_S3_HOST, AWS_QUERYSTRING_AUTH )
 AWS_S3_HOST = 's3.ap-northeast-2.amazonaws.com'
+AWS_S3_REGION_NAME = 'ap-northeast-2'
 AWS_QUERYSTRING_AUTH = False
 
 # static files setting
@@ -230,19 +229,36 @@ MEDIAFILES_LOCATION = 'media'
 MEDIA_URL = 'https://{}/{}/'.format(AWS_S3_CUSTOM_DOMAIN, MEDIAFILES_LOCATION)
 DEFAULT_FILE_STORAGE = 'sasmproject.custom_storages.MediaStorage'
 
+# presigned 직접 업로드 설정 (core.uploads)
+UPLOAD_BACKEND = 'core.uploads.S3UploadBackend'
+UPLOAD_FILESYSTEM_ROOT = os.path.join(BASE_DIR, 'uploads')
+UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+UPLOAD_URL_EXPIRES = 300
+
+# 커밋 이후 실행되는 백그라운드 작업 설정 (core.tasks)
+BACKGROUND_TASK_WORKERS = 2
+BACKGROUND_TASK_EAGER = False
+
+# 외부 서비스 호출용 HTTP client 설정 (core.http)
+HTTP_CLIENT_POOL_CONNECTIONS = 10
+HTTP_CLIENT_POOL_MAXSIZE = 10
+# provider별 (connect, read) timeout(초)
+HTTP_CLIENT_TIMEOUTS = {
+    'default': (3.05, 5),
+    'apple': (3.05, 3),
+    'naver_map': (3.05, 10),
+}
+# 연속 실패 횟수, 차단 시간(초)
+HTTP_CLIENT_BREAKER = (5, 30)
+
 # STATIC_URL = '/static/'
 # MEDIA_URL = '/media/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
-]  # debug-tool-bar
-INTERNAL_IPS = [
-    '127.0.0.1',
 ]
-# django silk
-SILKY_PYTHON_PROFILER = True
-SILKY_INTERCEPT_PERCENT = 5
-SILKY_AUTHENTICATION = True
-SILKY_AUTHORISATION = True
+
+# core.metrics: 한 요청에서 같은 SQL이 이 횟수보다 많이 실행되면 N+1 의심으로 로그
+QUERY_REPEAT_THRESHOLD = 10
 
 # drf-yasg
 SWAGGER_SETTINGS = {
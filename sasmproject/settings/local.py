@@ -11,9 +11,30 @@ DATABASES = {
 
 ALLOWED_HOSTS = ['0.0.0.0', '127.0.0.1', 'localhost']
 
+# 성능 프로파일링 도구는 로컬에서만 사용 (운영 환경은 core.metrics의 요청별 지표 사용)
+INSTALLED_APPS += ['debug_toolbar', 'silk']
+MIDDLEWARE += [
+    'silk.middleware.SilkyMiddleware',
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+]
+# debug-tool-bar
+INTERNAL_IPS = [
+    '127.0.0.1',
+]
+# django silk
+SILKY_PYTHON_PROFILER = True
+# 테스트에서는 무작위로 요청을 기록하지 않도록 비활성화 (쿼리 수 검증 테스트에 silk 쿼리가 섞이지 않도록)
+SILKY_INTERCEPT_PERCENT = 0 if 'test' in sys.argv else 5
+SILKY_AUTHENTICATION = True
+SILKY_AUTHORISATION = True
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=28),
     'ROTATE_REFRESH_TOKENS': False,  # true면 토큰 갱신 시 refresh도 같이 갱신
     'BLACKLIST_AFTER_ROTATION': True,
 }
+
+# 로컬 개발 시 메일은 SMTP 대신 파일로 저장 (core.mail outbox worker가 발송)
+EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
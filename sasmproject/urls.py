@@ -6,6 +6,8 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from core.views import MetricsApi
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('stories/', include('stories.urls')),
@@ -14,12 +16,12 @@ urlpatterns = [
     path('users/', include('allauth.urls')),
     path('places/', include('places.urls')),
     path('sdp_admin/', include('sdp_admin.urls')),
-    path('silk/', include('silk.urls', namespace='silk')),
     path('community/', include('community.urls')),
     path('curations/', include('curations.urls')),
     path('mypage/', include('mypage.urls')),
     path('forest/', include('forest.urls')),
     path('report/', include('report.urls')),
+    path('metrics/', MetricsApi.as_view(), name='metrics'),
 ]
 
 # API 문서에 작성될 소개 내용
@@ -50,7 +52,12 @@ urlpatterns += [
     path('docs/', schema_view.with_ui('redoc',
          cache_timeout=0), name='schema-redoc'),
 ]
-if settings.DEBUG:
+# 프로파일링 도구는 로컬 설정에서만 설치됨
+if 'silk' in settings.INSTALLED_APPS:
+    urlpatterns += [
+        path('silk/', include('silk.urls', namespace='silk')),
+    ]
+if 'debug_toolbar' in settings.INSTALLED_APPS:
     import debug_toolbar
     urlpatterns += [
         path("__debug__/", include(debug_toolbar.urls)),
@@ -0,0 +1,21 @@
+# Generated by Django 4.0 on 2026-10-19 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stories', '0016_storycomment_like_cnt_storycomment_likeuser_set'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='storycomment',
+            index=models.Index(fields=['story', 'isParent', 'created', 'id'], name='storycomment_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storycomment',
+            index=models.Index(fields=['parent', 'created', 'id'], name='storycomment_reply_idx'),
+        ),
+    ]
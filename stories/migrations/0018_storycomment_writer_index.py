@@ -0,0 +1,17 @@
+# Generated by Django 4.0 on 2026-10-19 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stories', '0017_storycomment_thread_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='storycomment',
+            index=models.Index(fields=['writer', 'story', 'created'], name='storycomment_writer_idx'),
+        ),
+    ]
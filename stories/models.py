@@ -85,6 +85,18 @@ class StoryComment(core_models.TimeStampedModel):
     # TODO: TimestampedModel 필드와 중복, 삭제 필요
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 스레드 조회: parent 댓글 keyset 페이지네이션, parent별 답글 조회
+            models.Index(fields=['story', 'isParent', 'created', 'id'],
+                         name='storycomment_thread_idx'),
+            models.Index(fields=['parent', 'created', 'id'],
+                         name='storycomment_reply_idx'),
+            # 마이페이지 댓글 단 스토리 조회
+            models.Index(fields=['writer', 'story', 'created'],
+                         name='storycomment_writer_idx'),
+        ]
+
     def __str__(self):
         return '{} {}'.format(self.story.title, str(self.id))
 
@@ -1,5 +1,6 @@
 from datetime import datetime
 from dataclasses import dataclass
+from typing import List, Set
 from collections import Counter
 from django.conf import settings
 from django.db import transaction
@@ -8,9 +9,12 @@ from django.shortcuts import get_object_or_404
 from django.db.models import Q, F, Aggregate, Value, CharField, Case, When, Exists, OuterRef, Subquery
 from django.db.models.functions import Concat, Substr
 from users.models import User
+from users.selectors import UserFollowGraphSelector
 import stories as st
 from stories.models import Story, StoryPhoto, StoryComment, StoryMap
-from curations.models import Curation, Curation_Story
+from curations.models import Curation, CurationPhoto, Curation_Story
+from core.pagination import paginate_keyset, encode_cursor, cursor_values
+from core.selectors import subquery_count, rep_media_url
 import re
 
 # for caching
@@ -68,6 +72,25 @@ class StoryDto:
     extra_pics: list[str]
     writer_is_followed : bool = None
 
+@dataclass
+class StoryCommentDto:
+    id: int
+    story: int
+    content: str
+    isParent: bool
+    parent: int
+    nickname: str
+    email: str
+    mention: str
+    profile_image: str
+    user_likes: bool
+    like_cnt: int
+    created: datetime
+    updated: datetime
+    reply_cnt: int = None
+    replies: list = None
+    replies_cursor: str = None
+
 @dataclass
 class SamePlaceStoryDto:
     id: int
@@ -101,7 +124,7 @@ class StoryCoordinatorSelector:
         )
         semi_cate = semi_category(story.id)
         
-        writer_is_followed = self.user.follows.filter(pk=story.writer.pk).exists() if self.user.is_authenticated else False
+        writer_is_followed = UserFollowGraphSelector.is_followed(self.user, story.writer_id)
         
         dto = StoryDto(
             id=story.id,
@@ -230,15 +253,6 @@ class StorySelector:
         if order in order_by_likes:
             order = order_by_likes[order]
 
-        def extract_summary(html_content):
-            # img 태그는 space로 대체
-            # 나머지는 빈 문자열로 대체
-            ret = re.sub(r'<img.*?>', '', html_content)
-            ret = re.sub(r'<.*?>', '', ret)  # FYI: 닫는 태그 <\/.+?>
-            ret = re.sub(r'\s{2,}', '', ret)  # space 두개 이상인 경우 하나로
-            ret = re.sub(r'&\w+;', '', ret) #&로 시작하고 ;로 끝나는 &nbsp; 와 같은 태그 빈 문자열로 대체
-            return ret[:130]
-
         stories = Story.objects.filter(q).annotate(
             place_name=F('place__place_name'),
             category=F('place__category'),
@@ -250,12 +264,27 @@ class StorySelector:
             extra_pics=GroupConcat('photos__image'),
         ).order_by(order)
 
+        return stories
+
+    @staticmethod
+    def extract_summary(html_content: str) -> str:
+        # img 태그는 space로 대체
+        # 나머지는 빈 문자열로 대체
+        ret = re.sub(r'<img.*?>', '', html_content)
+        ret = re.sub(r'<.*?>', '', ret)  # FYI: 닫는 태그 <\/.+?>
+        ret = re.sub(r'\s{2,}', '', ret)  # space 두개 이상인 경우 하나로
+        ret = re.sub(r'&\w+;', '', ret) #&로 시작하고 ;로 끝나는 &nbsp; 와 같은 태그 빈 문자열로 대체
+        return ret[:130]
+
+    @staticmethod
+    def page_transform(stories: list) -> list:
+        # 페이지네이션 이후 한 페이지의 스토리에 대해서만 요약 생성 및 사진 URL 변환
         for story in stories:
-            story.summary = extract_summary(story.html_content)
+            story.summary = StorySelector.extract_summary(story.html_content)
             story.rep_pic = story.rep_pic.url
             if story.extra_pics is not None:
-                story.extra_pics = map(
-                    append_media_url, story.extra_pics.split(',')[:3])
+                story.extra_pics = list(map(
+                    append_media_url, story.extra_pics.split(',')[:3]))
 
         return stories
 
@@ -287,6 +316,22 @@ class MapMarkerSelector:
 
 
 class StoryCommentSelector:
+    # 스레드 조회 시 정렬 기준 (마지막 필드 id로 순서를 unique하게 보장)
+    THREAD_ORDERING = ['created', 'id']
+    THREAD_FIELDS = (
+        'id',
+        'story',
+        'content',
+        'isParent',
+        'like_cnt',
+        'created',
+        'updated',
+        'writer__nickname',
+        'writer__email',
+        'writer__profile_image',
+        'mention__email',
+    )
+
     def __init__(self):
         pass
 
@@ -331,21 +376,126 @@ class StoryCommentSelector:
 
         return story_comments
 
+    @staticmethod
+    def thread(story_id: int, user: User, cursor: str = None, page_size: int = 20, reply_size: int = 3):
+        # parent 댓글은 (created, id) keyset 페이지네이션, 각 parent마다 첫 reply_size개의 답글을 포함
+        get_object_or_404(Story, id=story_id)
+
+        # parent별 첫 reply_size개 답글 중 마지막 답글의 (created, id)
+        # storycomment_reply_idx에서 parent마다 reply_size개만 읽으므로 답글이 많은 댓글도 비용이 일정
+        reply_bounds = {}
+        if reply_size > 0:
+            last_reply = StoryComment.objects.filter(
+                parent=OuterRef('pk')).order_by(*StoryCommentSelector.THREAD_ORDERING)[reply_size - 1:reply_size]
+            reply_bounds = {
+                'last_reply_created': Subquery(last_reply.values('created')),
+                'last_reply_id': Subquery(last_reply.values('id')),
+            }
+
+        parents = StoryComment.objects.filter(story_id=story_id, isParent=True).annotate(
+            reply_cnt=subquery_count(StoryComment.objects.filter(parent=OuterRef('pk'))),
+            **reply_bounds,
+        ).values(*StoryCommentSelector.THREAD_FIELDS, 'reply_cnt', *reply_bounds)
+        parents, next_cursor = paginate_keyset(
+            parents, StoryCommentSelector.THREAD_ORDERING, cursor=cursor, page_size=page_size)
+
+        # parent별로 마지막 답글까지의 범위만 한 번에 조회 (답글이 reply_size개 이하이면 전체)
+        replies = []
+        q = Q()
+        for parent in parents:
+            if reply_size <= 0 or parent['reply_cnt'] == 0:
+                continue
+            if parent['last_reply_id'] is None:
+                q |= Q(parent_id=parent['id'])
+            else:
+                q |= Q(parent_id=parent['id']) & (
+                    Q(created__lt=parent['last_reply_created']) |
+                    Q(created=parent['last_reply_created'], id__lte=parent['last_reply_id']))
+        if q:
+            replies = list(StoryComment.objects.filter(q).values(
+                *StoryCommentSelector.THREAD_FIELDS, 'parent',
+            ).order_by('parent', *StoryCommentSelector.THREAD_ORDERING))
+
+        replies_by_parent = {}
+        for reply in replies:
+            replies_by_parent.setdefault(reply['parent'], []).append(reply)
+
+        liked_ids = StoryCommentSelector.liked_ids(
+            user=user,
+            story_comment_ids=[parent['id'] for parent in parents] +
+            [reply['id'] for reply in replies],
+        )
+
+        results = []
+        for parent in parents:
+            parent_replies = replies_by_parent.get(parent['id'], [])
+            dto = StoryCommentSelector._to_dto(parent, liked_ids)
+            dto.reply_cnt = parent['reply_cnt']
+            dto.replies = [StoryCommentSelector._to_dto(
+                reply, liked_ids) for reply in parent_replies]
+            # 포함되지 않은 답글이 남아있는 경우, 마지막 답글 기준 커서 제공
+            if parent_replies and parent['reply_cnt'] > len(parent_replies):
+                dto.replies_cursor = encode_cursor(cursor_values(
+                    parent_replies[-1], StoryCommentSelector.THREAD_ORDERING))
+            results.append(dto)
+
+        return results, next_cursor
+
+    @staticmethod
+    def replies(story_comment_id: int, user: User, cursor: str = None, page_size: int = 20):
+        parent = get_object_or_404(StoryComment, id=story_comment_id)
+
+        replies = StoryComment.objects.filter(parent=parent).values(
+            *StoryCommentSelector.THREAD_FIELDS, 'parent')
+        replies, next_cursor = paginate_keyset(
+            replies, StoryCommentSelector.THREAD_ORDERING, cursor=cursor, page_size=page_size)
+
+        liked_ids = StoryCommentSelector.liked_ids(
+            user=user, story_comment_ids=[reply['id'] for reply in replies])
+
+        return [StoryCommentSelector._to_dto(reply, liked_ids) for reply in replies], next_cursor
+
+    @staticmethod
+    def liked_ids(user: User, story_comment_ids: List[int]) -> Set[int]:
+        # 좋아요 여부를 댓글마다 EXISTS로 확인하지 않고, 한 번의 쿼리로 조회
+        if not user.is_authenticated or not story_comment_ids:
+            return set()
+
+        return set(StoryComment.likeuser_set.through.objects.filter(
+            user_id=user.pk,
+            storycomment_id__in=story_comment_ids,
+        ).values_list('storycomment_id', flat=True))
+
+    @staticmethod
+    def _to_dto(row: dict, liked_ids: Set[int]) -> StoryCommentDto:
+        # profile_image는 DB에서 Concat하지 않고 경로에 MEDIA_URL만 붙임
+        profile_image = row['writer__profile_image']
+
+        return StoryCommentDto(
+            id=row['id'],
+            story=row['story'],
+            content=row['content'],
+            isParent=row['isParent'],
+            parent=row.get('parent'),
+            nickname=row['writer__nickname'],
+            email=row['writer__email'],
+            mention=row['mention__email'],
+            profile_image=append_media_url(
+                profile_image) if profile_image else None,
+            user_likes=row['id'] in liked_ids,
+            like_cnt=row['like_cnt'],
+            created=row['created'],
+            updated=row['updated'],
+        )
+
+
 class StoryIncludedCurationSelector:
     def __init__(self, user:User):
         self.user = user
 
     def list(self, story_id: int):
         included_curation = Curation.objects.filter(short_curations__story__id=story_id).annotate(
-            rep_pic=Case(
-                When(
-                    photos__image=None,
-                    then=None
-                ),
-                default=Concat(Value(settings.MEDIA_URL),
-                               F('photos__image'),
-                               output_field=CharField())
-            ),
+            rep_pic=rep_media_url(CurationPhoto.objects.filter(curation=OuterRef('pk'))),
         )
 
         return included_curation
@@ -15,6 +15,8 @@ from stories.models import Story, StoryComment, StoryPhoto, StoryMap
 from places.models import Place
 from .selectors import StoryLikeSelector, StoryCommentSelector, semi_category
 from core.map_image import Marker, get_static_naver_image
+from core.exceptions import ApplicationError
+from core.uploads import UploadTicket, issue_upload, confirm_upload
 
 # for caching
 # from core.caches import delete_cache
@@ -119,6 +121,27 @@ class StoryPhotoService:
 
         return photo
 
+    @staticmethod
+    def issue_upload(user: User, content_type: str, size: int, place_id: int) -> UploadTicket:
+        return issue_upload(
+            user=user,
+            upload_to='stories/img/{}'.format(place_id),
+            content_type=content_type,
+            size=size,
+        )
+
+    @staticmethod
+    def confirm_upload(user: User, token: str, caption: str = '') -> StoryPhoto:
+        # 클라이언트가 S3에 직접 업로드한 파일을 검증한 뒤 StoryPhoto 생성
+        image_name = confirm_upload(user=user, token=token, upload_to='stories/img')
+        if StoryPhoto.objects.filter(image=image_name).exists():
+            raise ApplicationError('이미 등록된 사진입니다.')
+
+        photo = StoryPhoto(caption=caption or '', image=image_name)
+        photo.save()
+
+        return photo
+
     @staticmethod
     def process_after_story_creation(story: Story, photoList: list[str]):
         if len(photoList) > 0:
@@ -148,7 +171,8 @@ class StoryService:
         story.story_like_cnt += 1
 
         story.full_clean()
-        story.save()
+        # 좋아요 수만 저장하여 스토리 내용 변경 시의 캐시 invalidate(curations.signals)가 실행되지 않도록 함
+        story.save(update_fields=['story_like_cnt', 'updated'])
 
     @staticmethod
     def dislike(story: Story, user: User):
@@ -156,7 +180,8 @@ class StoryService:
         story.story_like_cnt -= 1
 
         story.full_clean()
-        story.save()
+        # 좋아요 수만 저장하여 스토리 내용 변경 시의 캐시 invalidate(curations.signals)가 실행되지 않도록 함
+        story.save(update_fields=['story_like_cnt', 'updated'])
 
     def create(self,
                title: str,
@@ -239,7 +264,7 @@ class StoryCommentCoordinatorService:
             return True
 
     @transaction.atomic
-    def create(self, story_id: int, content: str, mentioned_email: str = '') -> StoryComment:
+    def create(self, story_id: int, content: str, mentioned_email: str = '', parent_id: int = None) -> StoryComment:
         story = Story.objects.get(id=story_id)
 
         comment_service = StoryCommentService()
@@ -249,11 +274,16 @@ class StoryCommentCoordinatorService:
         else:
             mentioned_user = None
 
+        parent = None
+        if parent_id:
+            parent = get_object_or_404(StoryComment, id=parent_id)
+
         story_comment = comment_service.create(
             story=story,
             content=content,
             mentioned_user=mentioned_user,
-            writer=self.user
+            writer=self.user,
+            parent=parent,
         )
 
         return story_comment
@@ -294,10 +324,16 @@ class StoryCommentService:
     def __init__(self):
         pass
 
-    def create(self, story: Story, content: str, mentioned_user: User, writer: User) -> StoryComment:
+    def create(self, story: Story, content: str, mentioned_user: User, writer: User, parent: StoryComment = None) -> StoryComment:
+        # 답글은 같은 스토리의 parent 댓글에만 달 수 있음 (1 depth)
+        if parent is not None and (parent.story_id != story.id or not parent.isParent):
+            raise exceptions.ValidationError({'error': '답글을 달 수 없는 댓글입니다.'})
+
         story_comment = StoryComment(
             story=story,
             content=content,
+            isParent=parent is None,
+            parent=parent,
             mention=mentioned_user,
             writer=writer,
         )
@@ -1,3 +1,59 @@
 from django.test import TestCase
 
-# Create your tests here.
+from users.models import User
+from stories.models import Story, StoryComment
+from stories.selectors import StoryCommentSelector
+
+
+class StoryCommentThreadSelectorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@test.test', password='test', nickname='test')
+        self.story = Story.objects.create(
+            title='test', story_review='test', tag='test', html_content='test', writer=self.user)
+
+        self.parents = [StoryComment.objects.create(
+            story=self.story, content=str(i), writer=self.user) for i in range(3)]
+        self.replies = [StoryComment.objects.create(
+            story=self.story, content=str(i), isParent=False, parent=self.parents[0], writer=self.user) for i in range(5)]
+
+        self.replies[1].likeuser_set.add(self.user)
+
+    def test_thread_paginates_parents_by_cursor(self):
+        first, next_cursor = StoryCommentSelector.thread(
+            story_id=self.story.id, user=self.user, page_size=2)
+        second, last_cursor = StoryCommentSelector.thread(
+            story_id=self.story.id, user=self.user, cursor=next_cursor, page_size=2)
+
+        self.assertEqual([c.id for c in first + second],
+                         [c.id for c in self.parents])
+        self.assertIsNone(last_cursor)
+
+    def test_thread_inlines_first_replies_with_cursor_for_rest(self):
+        with self.assertNumQueries(4):
+            comments, _ = StoryCommentSelector.thread(
+                story_id=self.story.id, user=self.user, reply_size=2)
+
+        parent = comments[0]
+        self.assertEqual(parent.reply_cnt, 5)
+        self.assertEqual([r.id for r in parent.replies],
+                         [r.id for r in self.replies[:2]])
+        self.assertEqual([r.user_likes for r in parent.replies], [False, True])
+        self.assertEqual(comments[1].replies, [])
+        self.assertIsNone(comments[1].replies_cursor)
+
+        rest, next_cursor = StoryCommentSelector.replies(
+            story_comment_id=parent.id, user=self.user, cursor=parent.replies_cursor)
+        self.assertEqual([r.id for r in rest], [r.id for r in self.replies[2:]])
+        self.assertIsNone(next_cursor)
+
+    def test_thread_first_replies_with_equal_created(self):
+        replies = [StoryComment.objects.create(
+            story=self.story, content=str(i), isParent=False, parent=self.parents[1], writer=self.user) for i in range(4)]
+        StoryComment.objects.filter(parent=self.parents[1]).update(created=self.parents[1].created)
+
+        comments, _ = StoryCommentSelector.thread(
+            story_id=self.story.id, user=self.user, reply_size=3)
+
+        self.assertEqual([r.id for r in comments[1].replies], [r.id for r in replies[:3]])
+        self.assertEqual([r.id for r in comments[0].replies], [r.id for r in self.replies[:3]])
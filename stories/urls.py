@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import StoryDetailApi, StoryCreateApi, StoryUpdateApi, StoryDeleteApi, StoryRecommendApi, StoryLikeApi, StoryPhotoCreateApi, StoryListApi, GoToMapApi, StoryCommentListApi, StoryCommentLikeApi, StoryCommentCreateApi, StoryCommentUpdateApi, StoryCommentDeleteApi,  StoryIncludedCurationApi, SamePlaceStory
+from .views import StoryDetailApi, StoryCreateApi, StoryUpdateApi, StoryDeleteApi, StoryRecommendApi, StoryLikeApi, StoryPhotoCreateApi, StoryPhotoUploadUrlApi, StoryPhotoUploadConfirmApi, StoryListApi, GoToMapApi, StoryCommentListApi, StoryCommentThreadListApi, StoryCommentReplyListApi, StoryCommentLikeApi, StoryCommentCreateApi, StoryCommentUpdateApi, StoryCommentDeleteApi,  StoryIncludedCurationApi, SamePlaceStory
 
 urlpatterns = [
      path('<int:story_id>/story_like/',
@@ -8,6 +8,10 @@ urlpatterns = [
      path('create/', StoryCreateApi.as_view(), name='story_create'),
      path('story_photos/create/',
          StoryPhotoCreateApi.as_view(), name='story_photo'),
+     path('story_photos/upload_url/',
+         StoryPhotoUploadUrlApi.as_view(), name='story_photo_upload_url'),
+     path('story_photos/confirm/',
+         StoryPhotoUploadConfirmApi.as_view(), name='story_photo_upload_confirm'),
      path('<int:story_id>/update/', StoryUpdateApi.as_view(), name='story_update'),
      path('<int:story_id>/delete/', StoryDeleteApi.as_view(), name='story_delete'),
      path('story_search/',
@@ -15,6 +19,9 @@ urlpatterns = [
      path('recommend_story/', StoryRecommendApi.as_view(), name='story_recommend'),
      path('go_to_map/', GoToMapApi.as_view(), name='go_to_map'),
      path('comments/', StoryCommentListApi.as_view(), name='story_comments'),
+     path('comments/threads/', StoryCommentThreadListApi.as_view(), name='story_comment_threads'),
+     path('comments/<int:story_comment_id>/replies/',
+          StoryCommentReplyListApi.as_view(), name='story_comment_replies'),
      path('comments/create/', StoryCommentCreateApi.as_view(), name='comments_create'),
      path('comments/update/<int:story_comment_id>/', 
           StoryCommentUpdateApi.as_view(), name='comments_update'),
@@ -165,6 +165,128 @@ class StoryPhotoCreateApi(APIView):
         }, status=status.HTTP_201_CREATED)
 
 
+class StoryPhotoUploadUrlApi(APIView):
+    permission_classes = (IsVerifiedOrSdpStaff, )
+
+    class StoryPhotoUploadUrlInputSerializer(serializers.Serializer):
+        content_type = serializers.CharField()
+        size = serializers.IntegerField()
+        place_id = serializers.IntegerField()
+
+        class Meta:
+            examples = {
+                'content_type': 'image/jpeg',
+                'size': 1048576,
+                'place_id': 1,
+            }
+
+    class StoryPhotoUploadUrlOutputSerializer(serializers.Serializer):
+        key = serializers.CharField()
+        url = serializers.CharField()
+        fields = serializers.DictField()
+        token = serializers.CharField()
+        expires_in = serializers.IntegerField()
+
+    @swagger_auto_schema(
+        request_body=StoryPhotoUploadUrlInputSerializer,
+        operation_id='스토리 사진 업로드 URL 발급',
+        operation_description='''
+            스토리 사진을 S3에 직접 업로드하기 위한 presigned URL을 발급합니다.<br/>
+            응답의 url로 fields와 file을 multipart/form-data POST 요청으로 업로드한 후(file은 마지막 필드),<br/>
+            token을 스토리 사진 업로드 확인 API로 전달하면 스토리 사진이 생성됩니다.<br/>
+            URL은 expires_in(초) 이후 만료됩니다.<br/>
+            ''',
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "key": "stories/img/1/1686065590.1234abcd.jpg",
+                            "url": "https://sasm-bucket.s3.amazonaws.com/",
+                            "fields": {"Content-Type": "image/jpeg", "key": "media/stories/img/1/1686065590.1234abcd.jpg"},
+                            "token": "eyJuYW1lIjoic3Rvcmllcy9pbWcvMS8...",
+                            "expires_in": 300,
+                        }
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def post(self, request):
+        serializer = self.StoryPhotoUploadUrlInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        ticket = StoryPhotoService.issue_upload(
+            user=request.user,
+            content_type=data.get('content_type'),
+            size=data.get('size'),
+            place_id=data.get('place_id'),
+        )
+
+        return Response({
+            'status': 'success',
+            'data': self.StoryPhotoUploadUrlOutputSerializer(ticket).data,
+        }, status=status.HTTP_200_OK)
+
+
+class StoryPhotoUploadConfirmApi(APIView):
+    permission_classes = (IsVerifiedOrSdpStaff, )
+
+    class StoryPhotoUploadConfirmInputSerializer(serializers.Serializer):
+        token = serializers.CharField()
+        caption = serializers.CharField(required=False)
+
+        class Meta:
+            examples = {
+                'token': 'eyJuYW1lIjoic3Rvcmllcy9pbWcvMS8...',
+                'caption': '내부 전경',
+            }
+
+    @swagger_auto_schema(
+        request_body=StoryPhotoUploadConfirmInputSerializer,
+        operation_id='스토리 사진 업로드 확인',
+        operation_description='''
+            presigned URL로 업로드한 파일의 크기와 이미지 형식을 확인한 뒤 스토리 사진을 생성합니다.<br/>
+            결과는 스토리 사진 생성 API와 동일하게 이미지 URL(location)입니다.<br/>
+            ''',
+        responses={
+            "201": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {"location": "https://sasm-bucket.s3.amazonaws.com/media/stories/img/1/1686065590.1234abcd.jpg"}
+                    }
+                }
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def post(self, request):
+        serializer = self.StoryPhotoUploadConfirmInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        story_photo = StoryPhotoService.confirm_upload(
+            user=request.user,
+            token=data.get('token'),
+            caption=data.get('caption', ''),
+        )
+
+        return Response({
+            'status': 'success',
+            'data': {'location': settings.MEDIA_URL + story_photo.image.name},
+        }, status=status.HTTP_201_CREATED)
+
+
 class StoryListApi(APIView):
     permission_classes = (AllowAny, )
 
@@ -256,7 +378,8 @@ class StoryListApi(APIView):
             serializer_class=self.StoryListOutputSerializer,
             queryset=story,
             request=request,
-            view=self
+            view=self,
+            page_transform=StorySelector.page_transform,
         )
 
 
@@ -644,6 +767,181 @@ class StoryCommentListApi(APIView):
             view=self,
         )
     
+class StoryCommentThreadListApi(APIView):
+    permission_classes = (AllowAny, )
+
+    class StoryCommentThreadFilterSerializer(serializers.Serializer):
+        story = serializers.IntegerField(required=True)
+        cursor = serializers.CharField(required=False)
+        page_size = serializers.IntegerField(
+            required=False, default=20, min_value=1, max_value=50)
+        reply_size = serializers.IntegerField(
+            required=False, default=3, min_value=0, max_value=10)
+
+    class StoryCommentReplyOutputSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        story = serializers.IntegerField()
+        content = serializers.CharField()
+        isParent = serializers.BooleanField()
+        parent = serializers.IntegerField(allow_null=True)
+        nickname = serializers.CharField()
+        email = serializers.CharField()
+        mention = serializers.CharField()
+        profile_image = serializers.CharField()
+        user_likes = serializers.BooleanField()
+        like_cnt = serializers.IntegerField()
+        created = serializers.DateTimeField()
+        updated = serializers.DateTimeField()
+
+    class StoryCommentThreadOutputSerializer(StoryCommentReplyOutputSerializer):
+        reply_cnt = serializers.IntegerField()
+        replies = serializers.SerializerMethodField()
+        replies_cursor = serializers.CharField(allow_null=True)
+
+        def get_replies(self, obj):
+            return StoryCommentThreadListApi.StoryCommentReplyOutputSerializer(
+                obj.replies, many=True).data
+
+    @swagger_auto_schema(
+        operation_id='스토리 댓글 스레드 조회',
+        operation_description='''
+            해당 story의 댓글을 parent 댓글 단위로 조회합니다. 쿼리 파라미터 : story, cursor, page_size, reply_size <br/>
+            각 parent 댓글에는 작성 순으로 첫 reply_size개의 답글이 replies에 포함됩니다.<br/>
+            reply_cnt가 replies의 개수보다 많은 경우, replies_cursor를 답글 조회 API의 cursor로 넘겨 나머지 답글을 조회할 수 있습니다.<br/>
+            다음 페이지는 응답의 next 값을 cursor로 넘겨 조회하며, next가 null이면 마지막 페이지입니다.<br/>
+        ''',
+        query_serializer=StoryCommentThreadFilterSerializer,
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "next": "eyJjcmVhdGVkIjoiMjAxOS0wOC0yNFQxNDoxNToyMloiLCJpZCI6MjB9",
+                            "results": [{
+                                'id': 1,
+                                'story': 1,
+                                'content': '멋져요',
+                                'isParent': True,
+                                'parent': None,
+                                'nickname': 'sdpygl',
+                                'email': 'sdpygl@gmail.com',
+                                'mention': None,
+                                'profile_image': 'https://abc.com/1.jpg',
+                                'user_likes': True,
+                                'like_cnt': 3,
+                                'created': '2019-08-24T14:15:22Z',
+                                'updated': '2019-08-24T14:15:22Z',
+                                'reply_cnt': 5,
+                                'replies': [],
+                                'replies_cursor': 'eyJjcmVhdGVkIjoiMjAxOS0wOC0yNFQxNDoxNToyMloiLCJpZCI6NH0',
+                            }],
+                        }
+                    }
+                },
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def get(self, request):
+        filters_serializer = self.StoryCommentThreadFilterSerializer(
+            data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        story_comments, next_cursor = StoryCommentSelector.thread(
+            story_id=filters.get('story'),
+            user=request.user,
+            cursor=filters.get('cursor'),
+            page_size=filters.get('page_size'),
+            reply_size=filters.get('reply_size'),
+        )
+        serializer = self.StoryCommentThreadOutputSerializer(
+            story_comments, many=True)
+
+        return Response({
+            'status': 'success',
+            'data': {
+                'next': next_cursor,
+                'results': serializer.data,
+            },
+        }, status=status.HTTP_200_OK)
+
+
+class StoryCommentReplyListApi(APIView):
+    permission_classes = (AllowAny, )
+
+    class StoryCommentReplyFilterSerializer(serializers.Serializer):
+        cursor = serializers.CharField(required=False)
+        page_size = serializers.IntegerField(
+            required=False, default=20, min_value=1, max_value=50)
+
+    @swagger_auto_schema(
+        operation_id='스토리 댓글 답글 조회',
+        operation_description='''
+            전달된 id에 해당하는 parent 댓글의 답글을 작성 순으로 조회합니다. 쿼리 파라미터 : cursor, page_size <br/>
+            스레드 조회 결과의 replies_cursor를 cursor로 넘기면 이미 받은 답글 이후부터 조회합니다.<br/>
+        ''',
+        query_serializer=StoryCommentReplyFilterSerializer,
+        responses={
+            "200": openapi.Response(
+                description="OK",
+                examples={
+                    "application/json": {
+                        "status": "success",
+                        "data": {
+                            "next": None,
+                            "results": [{
+                                'id': 4,
+                                'story': 1,
+                                'content': '저도요',
+                                'isParent': False,
+                                'parent': 1,
+                                'nickname': 'sdpygl',
+                                'email': 'sdpygl@gmail.com',
+                                'mention': 'sasm@gmail.com',
+                                'profile_image': 'https://abc.com/1.jpg',
+                                'user_likes': False,
+                                'like_cnt': 0,
+                                'created': '2019-08-24T14:15:22Z',
+                                'updated': '2019-08-24T14:15:22Z',
+                            }],
+                        }
+                    }
+                },
+            ),
+            "400": openapi.Response(
+                description="Bad Request",
+            ),
+        },
+    )
+    def get(self, request, story_comment_id):
+        filters_serializer = self.StoryCommentReplyFilterSerializer(
+            data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        replies, next_cursor = StoryCommentSelector.replies(
+            story_comment_id=story_comment_id,
+            user=request.user,
+            cursor=filters.get('cursor'),
+            page_size=filters.get('page_size'),
+        )
+        serializer = StoryCommentThreadListApi.StoryCommentReplyOutputSerializer(
+            replies, many=True)
+
+        return Response({
+            'status': 'success',
+            'data': {
+                'next': next_cursor,
+                'results': serializer.data,
+            },
+        }, status=status.HTTP_200_OK)
+
+
 class StoryCommentLikeApi(APIView):
     permission_classes = (IsAuthenticated, )
 
@@ -689,6 +987,7 @@ class StoryCommentCreateApi(APIView):
         story = serializers.IntegerField()
         content = serializers.CharField()
         mention = serializers.CharField(required=False)
+        parent = serializers.IntegerField(required=False)
 
         class Meta:
             examples = {
@@ -696,6 +995,7 @@ class StoryCommentCreateApi(APIView):
                 'story': 1,
                 'content': '정보 부탁드려요.',
                 'mentionEmail': 'sdpygl@gmail.com',
+                'parent': 1,
             }
 
     @swagger_auto_schema(
@@ -704,6 +1004,7 @@ class StoryCommentCreateApi(APIView):
         operation_id='스토리 댓글 생성',
         operation_description='''
             전달된 필드를 기반으로 해당 스토리의 댓글을 생성합니다.<br/>
+            답글을 작성하는 경우 parent에 parent 댓글의 id를 담아 보내면 됩니다.<br/>
             ''',
         responses={
             "200": openapi.Response(
@@ -732,7 +1033,8 @@ class StoryCommentCreateApi(APIView):
         story_comment = service.create(
             story_id=data.get('story'),
             content=data.get('content'),
-            mentioned_email=data.get('mention', '')
+            mentioned_email=data.get('mention', ''),
+            parent_id=data.get('parent'),
         )
 
         return Response({
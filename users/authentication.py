@@ -0,0 +1,45 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.caches import LocalVersionedCache
+from users.models import User
+
+
+# 인증에 필요한 최소한의 user 필드 (비밀번호 등 민감한 값은 캐시하지 않음)
+# Model.from_db는 값이 모델 필드 순서대로 주어져야 하므로 concrete field 순서로 정렬
+AUTH_USER_FIELDS = tuple(
+    field.attname for field in User._meta.concrete_fields
+    if field.attname in {'id', 'email', 'nickname', 'profile_image', 'is_active',
+                         'is_staff', 'is_superuser', 'is_sdp_admin', 'is_verified'})
+
+# user 저장 시 users.signals에서 invalidate
+AUTH_USER_CACHE = LocalVersionedCache('users:auth:', timeout=5 * 60, local_timeout=5)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    # 요청마다 User를 조회하지 않고 캐시된 최소 필드로 user 인스턴스 생성
+    # 나머지 필드는 처음 접근할 때 한 번의 쿼리로 로드됨 (User.refresh_from_db)
+    @staticmethod
+    def load(user_id):
+        return User.objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id}).values_list(*AUTH_USER_FIELDS).first()
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        values = AUTH_USER_CACHE.get(user_id, lambda: self.load(user_id))
+        if values is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = User.from_db(DEFAULT_DB_ALIAS, AUTH_USER_FIELDS, values)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,46 @@
+# Generated by Django 4.0 on 2026-10-19 14:44
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_follow_counts(apps, schema_editor):
+    # 기존 팔로우 관계로 팔로워/팔로잉 수 채우기
+    User = apps.get_model('users', 'User')
+    Follow = User.follows.through
+
+    def count(field):
+        return Coalesce(Subquery(
+            Follow.objects.filter(**{field: OuterRef('pk')}).order_by()
+            .values(field).annotate(cnt=Count('*')).values('cnt')[:1]), 0)
+
+    User.objects.update(follower_cnt=count('to_user_id'),
+                        following_cnt=count('from_user_id'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_user_semi_categories'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='follower_cnt',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='following_cnt',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='nickname',
+            field=models.CharField(blank=True, db_index=True, max_length=20),
+        ),
+        migrations.RunPython(fill_follow_counts,
+                             migrations.RunPython.noop),
+    ]
@@ -60,7 +60,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     code = models.CharField(max_length=5, blank=True)
     gender = models.CharField(choices=GENDER_CHOICES,
                               max_length=10, blank=True)
-    nickname = models.CharField(max_length=20, blank=True)
+    # 팔로우 리스트 prefix 검색에 사용
+    nickname = models.CharField(max_length=20, blank=True, db_index=True)
     birthdate = models.DateField(blank=True, null=True)
     email = models.EmailField(max_length=64, unique=True)
     address = models.CharField(max_length=100, blank=True)
@@ -80,6 +81,10 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     follows = models.ManyToManyField(
         "users.User", related_name='followers', blank=True)
+    # 팔로워/팔로잉 수, UserFollowService에서 팔로우 관계와 함께 증감
+    follower_cnt = models.PositiveIntegerField(default=0)
+    following_cnt = models.PositiveIntegerField(default=0)
+    COUNTER_FIELDS = ('follower_cnt', 'following_cnt')
     
     semi_categories = models.ManyToManyField("forest.SemiCategory", related_name='semi_category', blank=True)
     
@@ -98,9 +103,40 @@ class User(AbstractBaseUser, PermissionsMixin):
 #             print(self.nickname, len(self.nickname))
 #             raise ValidationError('닉네임은 두 글자 이상이어야 합니다(공백 사용 불가).')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 저장 시 로드 이후 바뀐 필드를 확인하기 위해 로드한 값 보관 (changed_fields)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def changed_fields(self, fields) -> set:
+        # 로드 이후(또는 마지막 저장 이후) 값이 바뀐 필드, DB에서 로드하지 않은 user는 로드된 모든 필드가 바뀐 것으로 간주
+        loaded = getattr(self, '_loaded_values', {})
+        return {field for field in fields
+                if field in self.__dict__ and (field not in loaded or loaded[field] != self.__dict__[field])}
+
     def save(self, *args, **kwargs):
-        self.full_clean()
-        return super().save(*args, **kwargs)
+        # email unique 검증 쿼리는 생성 시에만 수행 (이후에는 DB unique 제약으로 보장)
+        self.full_clean(validate_unique=self._state.adding)
+        # 팔로워/팔로잉 수는 UserFollowService에서 DB 값으로만 증감하므로, 프로필 수정 등 전체 저장 시 제외
+        # (로드 이후에 생긴 팔로우/언팔로우가 이전 값으로 덮어써지지 않도록)
+        if not self._state.adding and not args and kwargs.get('update_fields') is None:
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in deferred and field.name not in self.COUNTER_FIELDS]
+        super().save(*args, **kwargs)
+        self._loaded_values = {field.attname: self.__dict__[field.attname]
+                               for field in self._meta.concrete_fields if field.attname in self.__dict__}
+
+    def refresh_from_db(self, using=None, fields=None):
+        # 인증 캐시(users.authentication)로 만든 user는 일부 필드만 로드되어 있으므로,
+        # 로드되지 않은 필드에 처음 접근할 때 나머지 필드를 한 번의 쿼리로 함께 로드
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred and set(fields) <= deferred:
+            fields = deferred
+        return super().refresh_from_db(using=using, fields=fields)
 
     def __str__(self):
         return self.email
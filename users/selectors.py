@@ -86,13 +86,43 @@ class UserStorySelector:
         return stories
 
     def get_by_comment(self):
+        # mypage의 댓글 단 스토리 조회와 동일한 쿼리 사용
+        from mypage.selectors.stories_selectors import UserStorySelector as MypageUserStorySelector
 
-        my_story_comments = self.user.story_comments.filter(
-            writer=self.user).values_list('story')
-        story_filter = [y for x in set(my_story_comments) for y in x]
+        return MypageUserStorySelector(user=self.user).get_by_comment()
 
-        stories = Story.objects.filter(id__in=story_filter).annotate(
-            place_name=F('place__place_name')
-        ).order_by('created')
 
-        return stories
+class UserFollowGraphSelector:
+    # 팔로우 여부 조회 도우미: 작성자 N명에 대한 팔로우 여부를 (from_user, to_user) unique 인덱스를 타는 쿼리 1번으로 조회
+    # 팔로워가 많은 작성자라도 팔로워 목록 전체를 불러오지 않음
+    # 결과는 요청 동안만 유지되도록 user 인스턴스(request.user)에 캐시
+    CACHE_ATTR = '_followed_cache'
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def followed_ids(user: User, target_ids) -> set:
+        if user is None or not user.is_authenticated:
+            return set()
+
+        target_ids = set(target_ids)
+        cache = user.__dict__.setdefault(UserFollowGraphSelector.CACHE_ATTR, {})
+        missing = target_ids - cache.keys()
+        if missing:
+            followed = set(User.follows.through.objects.filter(
+                from_user_id=user.pk, to_user_id__in=missing
+            ).values_list('to_user_id', flat=True))
+            for target_id in missing:
+                cache[target_id] = target_id in followed
+
+        return {target_id for target_id in target_ids if cache[target_id]}
+
+    @staticmethod
+    def is_followed(user: User, target_id: int) -> bool:
+        return target_id in UserFollowGraphSelector.followed_ids(user, [target_id])
+
+    @staticmethod
+    def invalidate(user: User):
+        # 팔로우/언팔로우 후 같은 요청 안에서 이전 결과를 사용하지 않도록 폐기
+        user.__dict__.pop(UserFollowGraphSelector.CACHE_ATTR, None)
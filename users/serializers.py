@@ -13,8 +13,7 @@ from .models import User
 from django.template.loader import render_to_string
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes, force_str
-from django.core.mail import EmailMultiAlternatives
-from email.mime.image import MIMEImage
+from core.mail import EmailOutboxService
 # 로그인 & 이메일 인증관련
 JWT_PAYLOAD_HANDLER = api_settings.JWT_PAYLOAD_HANDLER
 JWT_ENCODE_HANDLER = api_settings.JWT_ENCODE_HANDLER
@@ -69,17 +68,12 @@ class UserSerializer(serializers.ModelSerializer):
         mail_subject = '[SDP] 회원가입 인증 메일입니다'
         to_email = user.email
         from_email = 'sdpygl@gmail.com'
-        msg = EmailMultiAlternatives(
-            mail_subject, plaintext, from_email, [to_email])
-        msg.attach_alternative(html_content, "text/html")
-        imagefile = 'SASM_LOGO_BLACK.png'
-        file_path = os.path.join(
-            settings.BASE_DIR, 'static/img/SASM_LOGO_BLACK.png')
-        img_data = open(file_path, 'rb').read()
-        image = MIMEImage(img_data)
-        image.add_header('Content-ID', '<{}>'.format(imagefile))
-        msg.attach(image)
-        msg.send()
+        EmailOutboxService.enqueue(
+            subject=mail_subject,
+            to_email=to_email,
+            html_content=html_content,
+            from_email=from_email,
+        )
         print('dd')
         return user
 
@@ -1,10 +1,7 @@
-import os
 import string
 import random
 import datetime
-from email.mime.image import MIMEImage
-from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from django.utils.encoding import force_str, force_bytes
 from django.utils.http import urlsafe_base64_encode
 from django.template.loader import render_to_string
@@ -17,6 +14,7 @@ from rest_framework_jwt.settings import api_settings
 from users.models import User
 from users.selectors import UserSelector
 from core.exceptions import ApplicationError
+from core.mail import EmailOutboxService
 
 JWT_PAYLOAD_HANDLER = api_settings.JWT_PAYLOAD_HANDLER
 JWT_ENCODE_HANDLER = api_settings.JWT_ENCODE_HANDLER
@@ -94,6 +92,7 @@ class UserService:
             return '사용 가능한 닉네임입니다'
 
     @staticmethod
+    @transaction.atomic
     def sign_up(email: str, password: str, nickname: str):
         user = User(
             email=email,
@@ -111,19 +110,13 @@ class UserService:
             'uid': force_str(urlsafe_base64_encode(force_bytes(user.pk))),
             'token': JWT_ENCODE_HANDLER(JWT_PAYLOAD_HANDLER(user)),
         })
-        to_email = user.email
-        from_email = 'sdpygl@gmail.com'
-        msg = EmailMultiAlternatives(
-            '[SDP] 회원가입 인증 메일입니다', '...', from_email, [to_email])
-        msg.attach_alternative(html_content, "text/html")
-
-        file_path = os.path.join(
-            settings.BASE_DIR, 'static/img/SASM_LOGO_BLACK.png')
-        img_data = open(file_path, 'rb').read()
-        image = MIMEImage(img_data)
-        image.add_header('Content-ID', '<{}>'.format('SASM_LOGO_BLACK.png'))
-        msg.attach(image)
-        msg.send()
+        # 회원 생성과 같은 트랜잭션에서 outbox에 저장, 커밋 이후 백그라운드에서 발송
+        EmailOutboxService.enqueue(
+            subject='[SDP] 회원가입 인증 메일입니다',
+            to_email=user.email,
+            html_content=html_content,
+            from_email='sdpygl@gmail.com',
+        )
 
 
 class UserPasswordService:
@@ -138,6 +131,7 @@ class UserPasswordService:
             auth_string += random.choice(string_pool)
         return auth_string
 
+    @transaction.atomic
     def password_reset_send_email(self, email: str):
         user_selector = UserSelector()
 
@@ -158,20 +152,12 @@ class UserPasswordService:
         user.code = code
         user.save()
 
-        mail_subject = '[SDP] 비밀번호 변경 메일입니다'
-        to_email = user.email
-        from_email = 'sdpygl@gmail.com'
-        msg = EmailMultiAlternatives(
-            mail_subject, '...', from_email, [to_email])
-        msg.attach_alternative(html_content, "text/html")
-        file_path = os.path.join(
-            settings.BASE_DIR, 'static/img/SASM_LOGO_BLACK.png')
-        img_data = open(file_path, 'rb').read()
-        image = MIMEImage(img_data)
-        image.add_header('Content-ID', '<{}>'.format('SASM_LOGO_BLACK.png'))
-        msg.attach(image)
-
-        msg.send()
+        EmailOutboxService.enqueue(
+            subject='[SDP] 비밀번호 변경 메일입니다',
+            to_email=user.email,
+            html_content=html_content,
+            from_email='sdpygl@gmail.com',
+        )
 
     def password_change_with_code(self, code: str, password: str):
         user_selector = UserSelector
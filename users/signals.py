@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users.models import User
+from users.authentication import AUTH_USER_CACHE, AUTH_USER_FIELDS
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_auth_user(sender, instance, update_fields=None, **kwargs):
+    # last_login 갱신 등 인증 캐시에 포함되지 않은 필드만 저장된 경우 무시
+    if update_fields is not None and not set(AUTH_USER_FIELDS) & set(update_fields):
+        return
+    AUTH_USER_CACHE.invalidate(instance.pk)
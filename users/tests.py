@@ -1,3 +1,83 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import User
+from users.authentication import CachedJWTAuthentication
+from users.selectors import UserFollowGraphSelector
+from mypage.services import UserFollowService
+
+
+class UserFollowGraphSelectorTests(TestCase):
+    def setUp(self):
+        self.viewer = User.objects.create_user(
+            email='viewer@test.test', password='test', nickname='viewer')
+        self.writers = [User.objects.create_user(
+            email='writer{}@test.test'.format(i), password='test', nickname='writer{}'.format(i))
+            for i in range(5)]
+        self.viewer.follows.add(self.writers[0], self.writers[3])
+
+    def test_followed_ids_uses_single_query_and_request_cache(self):
+        writer_ids = [writer.id for writer in self.writers]
+
+        with self.assertNumQueries(1):
+            followed = UserFollowGraphSelector.followed_ids(self.viewer, writer_ids)
+        self.assertEqual(followed, {self.writers[0].id, self.writers[3].id})
+
+        with self.assertNumQueries(0):
+            self.assertTrue(UserFollowGraphSelector.is_followed(self.viewer, self.writers[3].id))
+            self.assertFalse(UserFollowGraphSelector.is_followed(self.viewer, self.writers[1].id))
+
+    def test_invalidate_after_follow(self):
+        self.assertFalse(UserFollowGraphSelector.is_followed(self.viewer, self.writers[1].id))
+
+        self.viewer.follows.add(self.writers[1])
+        UserFollowGraphSelector.invalidate(self.viewer)
+
+        self.assertTrue(UserFollowGraphSelector.is_followed(self.viewer, self.writers[1].id))
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='auth@test.test', password='test', nickname='auth', is_active=True, introduction='hello')
+        self.request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION='Bearer {}'.format(AccessToken.for_user(self.user)))
+
+    def test_cached_user_skips_query_and_loads_other_fields_at_once(self):
+        with self.assertNumQueries(1):
+            CachedJWTAuthentication().authenticate(self.request)
+
+        with self.assertNumQueries(0):
+            user, _ = CachedJWTAuthentication().authenticate(self.request)
+            self.assertEqual((user.id, user.nickname), (self.user.id, 'auth'))
+
+        with self.assertNumQueries(1):
+            self.assertEqual((user.introduction, user.gender), ('hello', ''))
+
+    def test_user_save_invalidates_cached_user(self):
+        CachedJWTAuthentication().authenticate(self.request)
+
+        self.user.nickname = 'changed'
+        self.user.save()
+
+        user, _ = CachedJWTAuthentication().authenticate(self.request)
+        self.assertEqual(user.nickname, 'changed')
+
+
+class UserSaveTests(TestCase):
+    def test_full_save_keeps_follow_counters_changed_after_load(self):
+        user = User.objects.create_user(email='user@test.test', password='test', nickname='user')
+        follower = User.objects.create_user(email='follower@test.test', password='test', nickname='follower')
+
+        loaded = User.objects.get(pk=user.pk)
+        UserFollowService.follow_or_unfollow(source=follower, target=user)
+
+        loaded.nickname = 'changed'
+        loaded.save()
+
+        user.refresh_from_db()
+        self.assertEqual((user.nickname, user.follower_cnt), ('changed', 1))
@@ -15,23 +15,27 @@ from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from jwt.algorithms import RSAAlgorithm
 
+# 애플 공개키는 로그인마다 조회하지 않고 캐시, 키 교체(모르는 kid) 시 다시 조회
+APPLE_PUBLIC_KEYS = JwksCache('apple', 'https://appleid.apple.com/auth/keys')
+
+
 @api_view(["GET", "POST"])
 @method_decorator(csrf_exempt)
 @permission_classes([AllowAny])
+@report_login('apple')
 def apple_callback(request):
     id_token = request.GET.get('token')
     
     #토큰 검증
-    header = jwt.get_unverified_header(id_token)
-
-    APPLE_PUBLIC_KEY_URL = 'https://appleid.apple.com/auth/keys'
-
-    key_payload = requests.get(APPLE_PUBLIC_KEY_URL).json()
-    keys = key_payload['keys']
+    try:
+        header = jwt.get_unverified_header(id_token)
+    except jwt.exceptions.InvalidTokenError as e:
+        raise ApplicationError("유효하지 않은 토큰입니다.")
 
-    for key in keys:
-        if key['kid'] == header['kid'] and key['alg'] == header['alg']:
-            public_key = RSAAlgorithm.from_jwk(json.dumps(key))
+    key = APPLE_PUBLIC_KEYS.get_key(header.get('kid'))
+    if key is None or key.get('alg') != header.get('alg'):
+        raise ApplicationError("유효하지 않은 토큰입니다.")
+    public_key = RSAAlgorithm.from_jwk(json.dumps(key))
 
     try:
         decodedToken = jwt.decode(id_token, public_key, audience='kr.co.sasm', algorithms='RS256')
@@ -14,10 +14,13 @@ from core.exceptions import ApplicationError
 @api_view(["GET", "POST"])
 @method_decorator(csrf_exempt)
 @permission_classes([AllowAny])
+@report_login('google')
 def google_callback(request):
     access_token = request.GET.get('access_token')
-    user_info_req = requests.get(
-        f"https://www.googleapis.com/oauth2/v1/userinfo?access_token={access_token}"
+    user_info_req = http_client.get(
+        'google',
+        "https://www.googleapis.com/oauth2/v1/userinfo",
+        params={'access_token': access_token},
     )
 
     # 토큰을 이용해 사용자 정보를 가져오지 못했을 경우
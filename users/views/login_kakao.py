@@ -13,6 +13,7 @@ from core.exceptions import ApplicationError
 @api_view(["GET", "POST"])
 @method_decorator(csrf_exempt)
 @permission_classes([AllowAny])
+@report_login('kakao')
 def kakao_callback(request):
     if 'access_token' not in request.GET:
         rest_api_key = getattr(settings, 'KAKAO_REST_API_KEY')
@@ -20,17 +21,26 @@ def kakao_callback(request):
         redirect_uri = 'https://www.sasm.co.kr/auth/kakao/callback/'
 
         # 인가 코드를 이용해 사용자 정보에 접근할 수 있는 엑세스 토큰 받아오기
-        access_token_res = requests.get(
-            f"https://kauth.kakao.com/oauth/token?grant_type=authorization_code&client_id={rest_api_key}&redirect_uri={redirect_uri}&code={code}"
+        access_token_res = http_client.get(
+            'kakao',
+            "https://kauth.kakao.com/oauth/token",
+            params={
+                'grant_type': 'authorization_code',
+                'client_id': rest_api_key,
+                'redirect_uri': redirect_uri,
+                'code': code,
+            },
         )
         access_token = access_token_res.json().get("access_token")
     else:
         access_token = request.GET.get('access_token')
 
     # 받아온 엑세스 토큰으로 사용자 정보 가져오기
-    profile_res = requests.get(
-        'https://kapi.kakao.com/v2/user/me', headers={"Authorization": f'Bearer ${access_token}'})
+    profile_res = http_client.get(
+        'kakao', 'https://kapi.kakao.com/v2/user/me', headers={"Authorization": f'Bearer ${access_token}'})
     profile = profile_res.json().get('kakao_account')
+    if not profile:
+        raise ApplicationError("카카오로부터 사용자 정보를 가져오지 못했습니다.")
 
     # 이메일, 닉네임 정보 가져오기
     email = profile.get('email', None)
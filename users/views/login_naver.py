@@ -24,6 +24,7 @@ for i in range(STATE_LENGTH):
 @api_view(["GET", "POST"])
 @method_decorator(csrf_exempt)
 @permission_classes([AllowAny])
+@report_login('naver')
 def naver_callback(request):
     if 'access_token' not in request.GET:
         client_id = getattr(settings, 'NAVER_CLIENT_ID')
@@ -41,8 +42,16 @@ def naver_callback(request):
         code = request.GET.get('code')
 
         # 네이버 계정 정보를 가져오기 위한 액세스 토큰 요청
-        provider_token_response = requests.get(
-            f"https://nid.naver.com/oauth2.0/token?grant_type=authorization_code&client_id={client_id}&client_secret={client_secret}&code={code}&state={state}"
+        provider_token_response = http_client.get(
+            'naver',
+            "https://nid.naver.com/oauth2.0/token",
+            params={
+                'grant_type': 'authorization_code',
+                'client_id': client_id,
+                'client_secret': client_secret,
+                'code': code,
+                'state': state,
+            },
         ).json()
 
         if 'error' in provider_token_response:
@@ -57,9 +66,10 @@ def naver_callback(request):
         access_token = request.GET.get('access_token')
 
     # 액세스 토큰을 이용해 유저 정보 가져오기
-    user_info_response = requests.get(
+    user_info_response = http_client.get(
+        'naver',
         "https://openapi.naver.com/v1/nid/me",
-        headers={"Authorization": f"Bearer {access_token}"}).json().get('response')
+        headers={"Authorization": f"Bearer {access_token}"}).json().get('response') or {}
 
     email = user_info_response.get('email', None)
     nickname = user_info_response.get('nickname', None)
@@ -1,4 +1,7 @@
 #소셜 로그인 관련 설정들
+import functools
+import logging
+import time
 import requests
 import string
 import random
@@ -9,4 +12,28 @@ from rest_framework import status
 from allauth.socialaccount.models import SocialAccount
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 from json.decoder import JSONDecodeError
-from dj_rest_auth.registration.views import SocialLoginView
\ No newline at end of file
+from dj_rest_auth.registration.views import SocialLoginView
+
+from core.http import http_client, JwksCache
+
+
+logger = logging.getLogger('django')
+
+
+def report_login(provider: str):
+    # 소셜 로그인 provider별 처리 시간과 실패를 로그로 기록
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                response = view(request, *args, **kwargs)
+            except Exception as e:
+                logger.warning('social login failed: provider={} error={} elapsed_ms={:.1f}'.format(
+                    provider, type(e).__name__, (time.perf_counter() - start) * 1000))
+                raise
+            logger.info('social login: provider={} status={} elapsed_ms={:.1f}'.format(
+                provider, response.status_code, (time.perf_counter() - start) * 1000))
+            return response
+        return wrapper
+    return decorator
@@ -304,7 +304,8 @@ class UserStoryGetByCommentApi(APIView):
     @swagger_auto_schema(
         operation_id='댓글 단 스토리 조회',
         operation_description='''
-                유저가 댓글 단 스토리를 조회합니다.<br/>
+                유저가 댓글 단 스토리를 최근 댓글 작성 순으로 조회합니다.<br/>
+                pagination=cursor를 전달하면 커서 방식으로 조회하며, 다음 페이지는 응답의 next URL로 조회합니다. <br/>
             ''',
         responses={
             "200": openapi.Response(